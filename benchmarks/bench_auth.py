@@ -0,0 +1,136 @@
+"""Benchmark the AuthService hot paths against in-memory Redis and MongoDB.
+
+Seeds a configurable number of users and live sessions, then times
+register, authenticate, create_tokens, validate_token,
+refresh_access_token and logout and prints throughput and p50/p99
+latency as JSON. Compare runs with different --sessions values to see
+how each path scales with the number of live sessions.
+
+Usage: python -m benchmarks.bench_auth [--users N] [--sessions N] [--iterations N]
+"""
+
+import argparse
+import itertools
+import json
+import time
+from unittest.mock import Mock
+from src.config import Config
+from src.models.user import User
+from src.repositories.user import UserRepository
+from src.services.auth import AuthService
+from src.services.password_hasher import PasswordHasher
+from benchmarks.fakes import FakeCollection, FakeRedis
+
+PASSWORD = "benchmark-password"
+
+
+def measure(operation, inputs: list) -> dict:
+    latencies = []
+    failures = 0
+    started = time.perf_counter()
+    for item in inputs:
+        op_started = time.perf_counter()
+        if not operation(item):
+            failures += 1
+        latencies.append(time.perf_counter() - op_started)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "count": len(latencies),
+        "failures": failures,
+        "ops_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": latencies[int(0.50 * (len(latencies) - 1))] * 1000,
+        "p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1000,
+    }
+
+
+def build_auth_service(bcrypt_rounds: int) -> tuple[AuthService, FakeRedis]:
+    Config.BCRYPT_ROUNDS = bcrypt_rounds
+    redis_client = FakeRedis()
+    user_repository = UserRepository(FakeCollection(indexed_fields=("email",)))
+    auth_service = AuthService(
+        user_repository,
+        redis_client,
+        email_service=Mock(),
+        password_hasher=PasswordHasher(),
+    )
+    return auth_service, redis_client
+
+
+def seed(auth_service: AuthService, users: int, sessions: int) -> list[User]:
+    # Hash once and reuse it so seeding large user counts stays fast
+    password_hash = auth_service._hash_password(PASSWORD)
+    seeded = []
+    for i in range(users):
+        user = User(
+            username=f"user{i}", email=f"user{i}@example.com", password=password_hash
+        )
+        user.id = auth_service.user_repository.create(user)
+        seeded.append(user)
+    for user in itertools.islice(itertools.cycle(seeded), sessions):
+        auth_service.create_tokens(user)
+    return seeded
+
+
+def run(users: int, sessions: int, iterations: int, bcrypt_rounds: int) -> dict:
+    auth_service, redis_client = build_auth_service(bcrypt_rounds)
+    seeded = seed(auth_service, users, sessions)
+    seeded_keys = len(redis_client.data)
+    pick = lambda: list(itertools.islice(itertools.cycle(seeded), iterations))
+
+    results = {
+        "register": measure(
+            lambda i: auth_service.register(f"new{i}", f"new{i}@example.com", PASSWORD),
+            list(range(iterations)),
+        ),
+        "authenticate": measure(
+            lambda user: auth_service.authenticate(user.email, PASSWORD), pick()
+        ),
+        "create_tokens": measure(auth_service.create_tokens, pick()),
+    }
+
+    token_pairs = [auth_service.create_tokens(user) for user in pick()]
+    results["validate_token"] = measure(
+        lambda pair: auth_service.validate_token(pair["access_token"]), token_pairs
+    )
+    results["refresh_access_token"] = measure(
+        lambda pair: auth_service.refresh_access_token(pair["refresh_token"]),
+        token_pairs,
+    )
+
+    token_pairs = [auth_service.create_tokens(user) for user in pick()]
+    results["logout"] = measure(
+        lambda pair: auth_service.logout(pair["access_token"]), token_pairs
+    )
+
+    return {
+        "config": {
+            "users": users,
+            "sessions": sessions,
+            "iterations": iterations,
+            "bcrypt_rounds": bcrypt_rounds,
+            "identity_mode": Config.AUTH_IDENTITY_MODE,
+        },
+        "seeded_redis_keys": seeded_keys,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument(
+        "--bcrypt-rounds",
+        type=int,
+        default=4,
+        help="bcrypt cost for the benchmark; the minimum leaves CPU to the other paths",
+    )
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            run(args.users, args.sessions, args.iterations, args.bcrypt_rounds),
+            indent=2,
+        )
+    )
@@ -0,0 +1,81 @@
+"""Compare task cache encodings: payload bytes, encode and decode throughput.
+
+"legacy_json" is the unversioned json.dumps/json.loads format the cache used
+before codecs; the others are written through src.utils.cache_codec.
+
+Usage: python -m benchmarks.bench_cache_codec [--tasks N] [--iterations N]
+"""
+
+import argparse
+import json
+import random
+import time
+from bson.objectid import ObjectId
+from src.models.task import Task
+from src.utils.cache_codec import CODECS, decode_task, get_task_codec
+
+WORDS = "plan review ship fix write call email test deploy draft budget meeting".split()
+
+
+def _make_tasks(count: int) -> list[Task]:
+    rng = random.Random(42)
+    user_id = str(ObjectId())
+    return [
+        Task(
+            id=str(ObjectId()),
+            title=" ".join(rng.choices(WORDS, k=rng.randint(2, 6))).capitalize(),
+            description=" ".join(rng.choices(WORDS, k=rng.randint(0, 80))) or None,
+            user_id=user_id,
+            completed=rng.random() < 0.4,
+        )
+        for _ in range(count)
+    ]
+
+
+def _legacy_encode(task: Task) -> bytes:
+    return json.dumps({"id": task.id, **task.to_dict()}).encode()
+
+
+def _tasks_per_second(operation, items: list, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for item in items:
+            operation(item)
+    return len(items) * iterations / (time.perf_counter() - started)
+
+
+def _measure(encode, tasks: list[Task], iterations: int) -> dict:
+    payloads = [encode(task) for task in tasks]
+    return {
+        "avg_bytes": sum(len(payload) for payload in payloads) / len(payloads),
+        "total_bytes": sum(len(payload) for payload in payloads),
+        "encode_tasks_per_s": _tasks_per_second(encode, tasks, iterations),
+        "decode_tasks_per_s": _tasks_per_second(decode_task, payloads, iterations),
+    }
+
+
+def run(task_count: int, iterations: int) -> dict:
+    tasks = _make_tasks(task_count)
+    results = {
+        "tasks": task_count,
+        "iterations": iterations,
+        "legacy_json": _measure(_legacy_encode, tasks, iterations),
+    }
+    for name in CODECS:
+        for threshold in (0, 512):
+            try:
+                codec = get_task_codec(name, compress_threshold=threshold)
+            except ValueError as e:
+                results[name] = {"skipped": str(e)}
+                break
+            label = f"{name}+zlib{threshold}" if threshold else name
+            results[label] = _measure(codec.encode, tasks, iterations)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run(args.tasks, args.iterations), indent=2))
@@ -0,0 +1,65 @@
+"""Microbenchmark JWT encode/decode with raw secrets versus the pre-parsed key ring.
+
+Usage: python -m benchmarks.bench_jwt [--iterations N]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from jose import jwt
+from src.config import Config
+from src.services.key_ring import KeyRing
+
+
+def _ops_per_second(operation, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return iterations / (time.perf_counter() - started)
+
+
+def run(iterations: int) -> dict:
+    claims = {
+        "sub": "507f1f77bcf86cd799439011",
+        "email": "john@example.com",
+        "exp": datetime.utcnow() + timedelta(minutes=30),
+        "type": "access",
+        "jti": "Zt0VnqJ3xq2C9kQe",
+    }
+    key_ring = KeyRing()
+    raw_token = jwt.encode(
+        claims, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM
+    )
+    ring_token = key_ring.encode(claims)
+
+    return {
+        "iterations": iterations,
+        "raw_secret": {
+            "encode_ops": _ops_per_second(
+                lambda: jwt.encode(
+                    claims, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM
+                ),
+                iterations,
+            ),
+            "decode_ops": _ops_per_second(
+                lambda: jwt.decode(
+                    raw_token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
+                ),
+                iterations,
+            ),
+        },
+        "key_ring": {
+            "encode_ops": _ops_per_second(lambda: key_ring.encode(claims), iterations),
+            "decode_ops": _ops_per_second(
+                lambda: key_ring.decode(ring_token), iterations
+            ),
+        },
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.iterations), indent=2))
@@ -0,0 +1,134 @@
+"""Compare the cost of reading one user's task list out of MongoDB replies.
+
+Each scenario decodes the BSON a cursor would receive for the user's tasks
+and builds Task objects from it, the way TaskRepository does:
+
+- "full": whole documents, the behaviour before read projections
+- "projected": TaskRepository.TASK_PROJECTION, the fields Task is built from
+- "status": TaskRepository.STATUS_PROJECTION, as used by the metrics scan
+- "raw_bson": whole documents as RawBSONDocument, decoded on first access
+
+``--padding`` adds an unrendered field of that many bytes to every stored
+document, standing in for data written by other tools or older versions.
+
+Usage: python -m benchmarks.bench_task_reads [--tasks N] [--padding BYTES]
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+import bson
+from bson.codec_options import CodecOptions
+from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
+from src.models.task import Task
+from src.repositories.task import TaskRepository
+
+WORDS = "plan review ship fix write call email test deploy draft budget meeting".split()
+
+# Default server batch limit; a cursor decodes one reply of this size at a time
+BATCH_BYTES = 16 * 1024 * 1024
+
+DICT_OPTIONS = CodecOptions()
+RAW_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+
+
+def _make_documents(count: int, padding: int) -> list[dict]:
+    rng = random.Random(42)
+    user_id = str(ObjectId())
+    documents = []
+    for _ in range(count):
+        document = {
+            "_id": ObjectId(),
+            "title": " ".join(rng.choices(WORDS, k=rng.randint(2, 6))).capitalize(),
+            "description": " ".join(rng.choices(WORDS, k=rng.randint(0, 80))) or None,
+            "user_id": user_id,
+            "completed": rng.random() < 0.4,
+        }
+        if padding:
+            document["notes"] = "x" * padding
+        documents.append(document)
+    return documents
+
+
+def _project(document: dict, projection: dict) -> dict:
+    # Server-side projection always keeps _id
+    return {
+        key: value
+        for key, value in document.items()
+        if key == "_id" or key in projection
+    }
+
+
+def _batches(documents: list[dict]) -> list[bytes]:
+    batches, current, size = [], [], 0
+    for document in documents:
+        encoded = bson.encode(document)
+        if current and size + len(encoded) > BATCH_BYTES:
+            batches.append(b"".join(current))
+            current, size = [], 0
+        current.append(encoded)
+        size += len(encoded)
+    if current:
+        batches.append(b"".join(current))
+    return batches
+
+
+def _read(batches: list[bytes], options: CodecOptions) -> list[Task]:
+    return [
+        Task.from_dict(task_data)
+        for batch in batches
+        for task_data in bson.decode_all(batch, options)
+    ]
+
+
+def _measure(batches: list[bytes], options: CodecOptions, iterations: int) -> dict:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        _read(batches, options)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    tasks = _read(batches, options)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "wire_bytes": sum(len(batch) for batch in batches),
+        "best_ms": round(best * 1000, 2),
+        "tasks_per_s": round(len(tasks) / best),
+        "peak_kib": round(peak / 1024),
+    }
+
+
+def run(task_count: int, padding: int, iterations: int) -> dict:
+    documents = _make_documents(task_count, padding)
+    full = _batches(documents)
+    projected = _batches(
+        [_project(document, TaskRepository.TASK_PROJECTION) for document in documents]
+    )
+    status = _batches(
+        [_project(document, TaskRepository.STATUS_PROJECTION) for document in documents]
+    )
+    return {
+        "tasks": task_count,
+        "padding": padding,
+        "iterations": iterations,
+        "full": _measure(full, DICT_OPTIONS, iterations),
+        "projected": _measure(projected, DICT_OPTIONS, iterations),
+        "status": _measure(status, DICT_OPTIONS, iterations),
+        "raw_bson": _measure(full, RAW_OPTIONS, iterations),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--padding", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    print(json.dumps(run(args.tasks, args.padding, args.iterations), indent=2))
@@ -0,0 +1,275 @@
+"""In-memory stand-ins for Redis and MongoDB used by the benchmarks.
+
+They implement only the commands the services issue, with the same
+argument conventions as redis-py and pymongo, so benchmarks measure the
+service code rather than network round trips.
+"""
+
+import fnmatch
+import time
+from bson import ObjectId
+from src.services.auth import ROTATE_REFRESH_TOKEN_SCRIPT
+
+
+def _encode(value) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.expires_at = {}
+        self.published = 0
+
+    # Keys
+    def _expire_if_needed(self, key: bytes) -> None:
+        deadline = self.expires_at.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+
+    def _get(self, key):
+        key = _encode(key)
+        self._expire_if_needed(key)
+        return self.data.get(key)
+
+    def exists(self, *keys) -> int:
+        return sum(1 for key in keys if self._get(key) is not None)
+
+    def delete(self, *keys) -> int:
+        deleted = 0
+        for key in keys:
+            key = _encode(key)
+            if self.data.pop(key, None) is not None:
+                deleted += 1
+            self.expires_at.pop(key, None)
+        return deleted
+
+    def expire(self, key, seconds, nx: bool = False) -> bool:
+        key = _encode(key)
+        if self._get(key) is None or (nx and key in self.expires_at):
+            return False
+        self.expires_at[key] = time.monotonic() + int(seconds)
+        return True
+
+    def ttl(self, key) -> int:
+        key = _encode(key)
+        if self._get(key) is None:
+            return -2
+        if key not in self.expires_at:
+            return -1
+        return int(self.expires_at[key] - time.monotonic())
+
+    def scan_iter(self, match: str = "*", count: int = None):
+        for key in list(self.data):
+            if (
+                fnmatch.fnmatchcase(key.decode("utf-8"), match)
+                and self._get(key) is not None
+            ):
+                yield key
+
+    def flushall(self) -> None:
+        self.data.clear()
+        self.expires_at.clear()
+
+    # Strings
+    def get(self, key):
+        return self._get(key)
+
+    def set(self, key, value, ex=None, px=None, nx=False, keepttl=False):
+        key = _encode(key)
+        if nx and self._get(key) is not None:
+            return None
+        self.data[key] = _encode(value)
+        if ex is not None:
+            self.expires_at[key] = time.monotonic() + ex
+        elif px is not None:
+            self.expires_at[key] = time.monotonic() + px / 1000
+        elif not keepttl:
+            self.expires_at.pop(key, None)
+        return True
+
+    def setex(self, key, seconds, value):
+        return self.set(key, value, ex=int(seconds))
+
+    def mget(self, keys, *args):
+        keys = list(keys) if isinstance(keys, (list, tuple)) else [keys, *args]
+        return [self._get(key) for key in keys]
+
+    def incr(self, key, amount: int = 1) -> int:
+        value = int(self._get(key) or 0) + amount
+        self.set(key, value, keepttl=True)
+        return value
+
+    # Sets
+    def sadd(self, key, *members) -> int:
+        current = self._get(key)
+        if current is None:
+            current = set()
+            self.data[_encode(key)] = current
+        before = len(current)
+        current.update(_encode(member) for member in members)
+        return len(current) - before
+
+    def srem(self, key, *members) -> int:
+        current = self._get(key) or set()
+        before = len(current)
+        current.difference_update(_encode(member) for member in members)
+        return before - len(current)
+
+    def smembers(self, key) -> set:
+        return set(self._get(key) or set())
+
+    # Pub/sub
+    def publish(self, channel, message) -> int:
+        self.published += 1
+        return 0
+
+    # Pipelines and scripts
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    def register_script(self, script: str):
+        return FakeScript(self, SCRIPTS[script])
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.commands = []
+
+    def execute(self):
+        results = [command(*args, **kwargs) for command, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
+class FakeScript:
+    def __init__(self, redis: FakeRedis, implementation):
+        self.redis = redis
+        self.implementation = implementation
+
+    def __call__(self, keys=(), args=(), client=None):
+        return self.implementation(client or self.redis, list(keys), list(args))
+
+
+def _rotate_refresh_token(redis: FakeRedis, keys: list, args: list):
+    session = redis.get(keys[0])
+    if session is None:
+        return None
+    redis.delete(keys[0])
+    redis.setex(keys[1], args[0], session)
+    redis.setex(keys[2], args[1], session)
+    redis.srem(keys[3], keys[0])
+    redis.sadd(keys[3], keys[1], keys[2])
+    redis.expire(keys[3], args[1])
+    return session
+
+
+# Python equivalents of the Lua scripts registered by the services
+SCRIPTS = {
+    ROTATE_REFRESH_TOKEN_SCRIPT: _rotate_refresh_token,
+}
+
+
+class InsertOneResult:
+    def __init__(self, inserted_id):
+        self.inserted_id = inserted_id
+
+
+class FakeCollection:
+    """Collection with hash indexes on the given fields for equality lookups"""
+
+    def __init__(self, indexed_fields: tuple = ()):
+        self.documents = {}
+        self.indexes = {field: {} for field in indexed_fields}
+
+    def _index(self, document: dict) -> None:
+        for field, index in self.indexes.items():
+            index.setdefault(document.get(field), set()).add(document["_id"])
+
+    def _unindex(self, document: dict) -> None:
+        for field, index in self.indexes.items():
+            index.get(document.get(field), set()).discard(document["_id"])
+
+    def _candidates(self, filter: dict):
+        if "_id" in filter and not isinstance(filter["_id"], dict):
+            document = self.documents.get(filter["_id"])
+            return [document] if document else []
+        for field, value in filter.items():
+            if field in self.indexes and not isinstance(value, dict):
+                return [
+                    self.documents[_id] for _id in self.indexes[field].get(value, ())
+                ]
+        return list(self.documents.values())
+
+    @staticmethod
+    def _matches(document: dict, filter: dict) -> bool:
+        for field, condition in filter.items():
+            value = document.get(field)
+            if isinstance(condition, dict):
+                for operator, operand in condition.items():
+                    if operator == "$in" and value not in operand:
+                        return False
+                    if operator == "$gt" and not (
+                        value is not None and value > operand
+                    ):
+                        return False
+                    if operator == "$lt" and not (
+                        value is not None and value < operand
+                    ):
+                        return False
+            elif value != condition:
+                return False
+        return True
+
+    def insert_one(self, document: dict) -> InsertOneResult:
+        document = dict(document)
+        document.setdefault("_id", ObjectId())
+        self.documents[document["_id"]] = document
+        self._index(document)
+        return InsertOneResult(document["_id"])
+
+    def find_one(self, filter: dict = None, projection=None):
+        for document in self._candidates(filter or {}):
+            if self._matches(document, filter or {}):
+                return dict(document)
+        return None
+
+    def find(self, filter: dict = None, projection=None):
+        return [
+            dict(document)
+            for document in self._candidates(filter or {})
+            if self._matches(document, filter or {})
+        ]
+
+    def update_one(self, filter: dict, update: dict) -> None:
+        document = self.find_one(filter)
+        if document is None:
+            return
+        stored = self.documents[document["_id"]]
+        self._unindex(stored)
+        stored.update(update.get("$set", {}))
+        self._index(stored)
+
+    def delete_one(self, filter: dict) -> None:
+        document = self.find_one(filter)
+        if document is not None:
+            self._unindex(self.documents.pop(document["_id"]))
@@ -1,12 +1,27 @@
+import click
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_swagger_ui import get_swaggerui_blueprint
+from werkzeug.middleware.proxy_fix import ProxyFix
 from src.config import Config
-from src.extensions import init_app
+from src.extensions import container, init_app
 from src.routes.task import tasks_bp
 from src.routes.auth import auth_bp
 from src.routes.metrics import metrics_bp
 from src.swagger import swagger_config
+from src.cli import sessions_cli, outbox_cli, cache_cli, db_cli
+from src.repositories.indexes import check_indexes
+
+
+def _loading_for_management_command() -> bool:
+    """True while `flask <group> ...` loads the app to find a management command.
+
+    The flask group loads the app itself only to resolve the commands the app
+    registers (sessions, outbox, cache, db). Built-in commands such as
+    `flask run` load it inside their own command context.
+    """
+    ctx = click.get_current_context(silent=True)
+    return ctx is not None and ctx.parent is None
 
 
 def create_app(config_class=Config):
@@ -15,6 +30,10 @@ def create_app(config_class=Config):
 
     app.url_map.strict_slashes = False
 
+    # Take the client address from the trusted proxies' X-Forwarded-For
+    if config_class.TRUSTED_PROXY_HOPS:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=config_class.TRUSTED_PROXY_HOPS)
+
     CORS(
         app,
         origins=["http://localhost:9000"],
@@ -42,10 +61,19 @@ def create_app(config_class=Config):
 
     init_app(app)
 
+    # Management commands skip the check so `flask db indexes --apply` can run
+    if not _loading_for_management_command():
+        check_indexes(container.mongo_db(), config_class.INDEX_CHECK_MODE)
+
     app.register_blueprint(tasks_bp, url_prefix="/tasks")
     app.register_blueprint(auth_bp, url_prefix="/auth")
     app.register_blueprint(metrics_bp, url_prefix="/metrics")
 
+    app.cli.add_command(sessions_cli)
+    app.cli.add_command(outbox_cli)
+    app.cli.add_command(cache_cli)
+    app.cli.add_command(db_cli)
+
     SWAGGER_URL = "/api/docs"
     swaggerui_blueprint = get_swaggerui_blueprint(
         SWAGGER_URL,
@@ -0,0 +1,123 @@
+import json
+import click
+from flask.cli import AppGroup
+from src.extensions import container
+from src.repositories.indexes import create_missing_indexes, diff_indexes
+from src.services.session_report import SessionReportService
+
+sessions_cli = AppGroup("sessions", help="Inspect login sessions stored in Redis.")
+
+
+@sessions_cli.command("report")
+@click.option(
+    "--sample", default=1000, show_default=True, help="Keys sampled per family."
+)
+def sessions_report(sample: int):
+    """Show Redis bytes per session for the legacy and compact key formats."""
+    report = SessionReportService(container.redis_client()).get_report(sample)
+    click.echo(json.dumps(report, indent=2))
+    legacy = report["legacy"]["bytes_per_session"]
+    compact = report["compact"]["bytes_per_session"]
+    if legacy and compact:
+        click.echo(
+            f"Compact sessions use {compact:.0f} bytes vs {legacy:.0f} bytes "
+            f"({(1 - compact / legacy) * 100:.1f}% smaller)"
+        )
+
+
+@sessions_cli.command("migrate-legacy")
+@click.option(
+    "--batch-size", default=500, show_default=True, help="Keys read per round trip."
+)
+def sessions_migrate_legacy(batch_size: int):
+    """Index sessions stored under full-JWT keys so logout can revoke them."""
+    migrated = container.auth_service().migrate_legacy_sessions(batch_size)
+    click.echo(f"Indexed {migrated} legacy sessions")
+
+
+outbox_cli = AppGroup("outbox", help="Run and inspect the email outbox.")
+
+
+@outbox_cli.command("work")
+@click.option(
+    "--worker-id", default=None, help="Stable id used to recover in-flight emails."
+)
+def outbox_work(worker_id: str):
+    """Drain the email outbox, sending queued emails over SMTP."""
+    container.email_service().run(worker_id=worker_id)
+
+
+@outbox_cli.command("stats")
+def outbox_stats():
+    """Show queue depth and enqueue-to-send latency."""
+    click.echo(json.dumps(container.email_service().stats(), indent=2))
+
+
+cache_cli = AppGroup("cache", help="Manage the Redis task cache.")
+
+
+@cache_cli.command("prewarm")
+@click.option(
+    "--users",
+    default=1000,
+    show_default=True,
+    help="Most recently active users to load.",
+)
+@click.option(
+    "--batch-size",
+    default=100,
+    show_default=True,
+    help="Users per MongoDB cursor and Redis pipeline.",
+)
+@click.option(
+    "--rate",
+    default=200.0,
+    show_default=True,
+    help="Maximum users loaded per second (0 = unlimited).",
+)
+def cache_prewarm(users: int, batch_size: int, rate: float):
+    """Load task lists of recently active users into the cache."""
+    result = container.cache_prewarmer().prewarm_recent_users(users, batch_size, rate)
+    click.echo(json.dumps(result, indent=2))
+
+
+@cache_cli.command("invalidate")
+@click.option(
+    "--user", "user_id", default=None, help="Only drop this user's cached tasks."
+)
+def cache_invalidate(user_id: str):
+    """Stop serving cached tasks by bumping a generation counter.
+
+    Without --user every task cache key moves to a new namespace; workers
+    pick it up within TASK_CACHE_GENERATION_REFRESH_SECONDS and the old
+    keys expire on their own.
+    """
+    if user_id:
+        container.task_service().invalidate_user(user_id)
+        click.echo(f"Invalidated cached tasks of user {user_id}")
+    else:
+        generation = container.task_cache_generation().bump()
+        click.echo(f"Task cache generation is now {generation}")
+
+
+db_cli = AppGroup("db", help="Manage MongoDB indexes.")
+
+
+@db_cli.command("indexes")
+@click.option(
+    "--apply",
+    is_flag=True,
+    help="Build missing indexes instead of only reporting them.",
+)
+def db_indexes(apply: bool):
+    """Compare declared indexes with MongoDB; exits 1 while any are missing."""
+    db = container.mongo_db()
+    rows = create_missing_indexes(db) if apply else diff_indexes(db)
+    for row in rows:
+        keys = ", ".join(f"{field}:{direction}" for field, direction in row["keys"])
+        line = f"{row['status']:<9} {row['collection']}.{row['name']} ({keys})"
+        if row.get("detail"):
+            line += f" - {row['detail']}"
+        click.echo(line)
+    if any(row["status"] in ("missing", "conflict", "failed") for row in rows):
+        raise SystemExit(1)
@@ -16,6 +16,8 @@ class Config:
     MONGO_DB = os.getenv("MONGO_DB", "task_manager")
     MONGO_USERNAME = os.getenv("MONGO_USERNAME", "")
     MONGO_PASSWORD = os.getenv("MONGO_PASSWORD", "")
+    # Startup check of declared MongoDB indexes: off, warn or fail
+    INDEX_CHECK_MODE = os.getenv("INDEX_CHECK_MODE", "warn")
 
     # Redis Configuration
     REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -28,13 +30,114 @@ class Config:
         "JWT_SECRET_KEY", "your-super-secret-key-change-this-in-production"
     )
     JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+    # Optional JSON key ring ({"active_kid": ..., "keys": [...]}) re-read on change
+    JWT_KEYRING_FILE = os.getenv("JWT_KEYRING_FILE", "")
+    JWT_KEYRING_RELOAD_SECONDS = int(os.getenv("JWT_KEYRING_RELOAD_SECONDS", "30"))
+    # Keep accepting JWT_SECRET_KEY tokens under the "default" kid alongside a
+    # key ring file, e.g. while tokens issued before the ring are still live
+    JWT_KEYRING_INCLUDE_DEFAULT_KEY = (
+        os.getenv("JWT_KEYRING_INCLUDE_DEFAULT_KEY", "false").lower() == "true"
+    )
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(
         os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30")
     )
-    JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(
-        os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7")
+    JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+
+    # Accept sessions stored under the full-JWT keys used before tokens
+    # carried a jti claim. Only enable while such sessions may still be live,
+    # after running `flask sessions migrate-legacy` so logout can reach them
+    SESSION_LEGACY_KEYS_ENABLED = (
+        os.getenv("SESSION_LEGACY_KEYS_ENABLED", "false").lower() == "true"
     )
 
+    # How require_auth builds the request user: "database" loads the user
+    # record on every request, "claims" trusts the stored session payload
+    AUTH_IDENTITY_MODE = os.getenv("AUTH_IDENTITY_MODE", "database")
+
+    # Verified token cache (per worker)
+    TOKEN_CACHE_ENABLED = os.getenv("TOKEN_CACHE_ENABLED", "true").lower() == "true"
+    TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", "10000"))
+    TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+    TOKEN_REVOCATION_CHANNEL = os.getenv(
+        "TOKEN_REVOCATION_CHANNEL", "auth:token_revocations"
+    )
+
+    # Password hashing
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    BCRYPT_MAX_WORKERS = int(os.getenv("BCRYPT_MAX_WORKERS", "4"))
+    BCRYPT_MAX_QUEUE = int(os.getenv("BCRYPT_MAX_QUEUE", "16"))
+
+    # How long empty task lists and unknown task ids stay cached
+    TASK_CACHE_NEGATIVE_TTL_SECONDS = int(
+        os.getenv("TASK_CACHE_NEGATIVE_TTL_SECONDS", "60")
+    )
+    # Task payload encoding in Redis: binary, json or msgpack
+    TASK_CACHE_CODEC = os.getenv("TASK_CACHE_CODEC", "binary")
+    # Payloads larger than this many bytes are zlib-compressed (0 disables)
+    TASK_CACHE_COMPRESS_THRESHOLD = int(
+        os.getenv("TASK_CACHE_COMPRESS_THRESHOLD", "512")
+    )
+    # Page sizes for GET /tasks?limit=...&cursor=... and how long pages stay cached
+    TASK_LIST_DEFAULT_LIMIT = int(os.getenv("TASK_LIST_DEFAULT_LIMIT", "50"))
+    TASK_LIST_MAX_LIMIT = int(os.getenv("TASK_LIST_MAX_LIMIT", "500"))
+    TASK_PAGE_CACHE_TTL_SECONDS = int(os.getenv("TASK_PAGE_CACHE_TTL_SECONDS", "300"))
+    # Most tasks a single /tasks/bulk request may create, change or delete
+    TASK_BULK_MAX_ITEMS = int(os.getenv("TASK_BULK_MAX_ITEMS", "1000"))
+    # Cache the serialized GET /tasks body with an ETag, per user
+    TASK_LIST_RESPONSE_CACHE_ENABLED = (
+        os.getenv("TASK_LIST_RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+    )
+    # Task list rebuilds: TTL spread, early refresh (0 disables) and single-flight lock
+    TASK_CACHE_TTL_JITTER = float(os.getenv("TASK_CACHE_TTL_JITTER", "0.1"))
+    TASK_CACHE_EARLY_REFRESH_BETA = float(
+        os.getenv("TASK_CACHE_EARLY_REFRESH_BETA", "1.0")
+    )
+    TASK_CACHE_REBUILD_LOCK_MS = int(os.getenv("TASK_CACHE_REBUILD_LOCK_MS", "5000"))
+    TASK_CACHE_REBUILD_WAIT_MS = int(os.getenv("TASK_CACHE_REBUILD_WAIT_MS", "500"))
+    # How often each worker re-reads the global task cache generation
+    TASK_CACHE_GENERATION_REFRESH_SECONDS = float(
+        os.getenv("TASK_CACHE_GENERATION_REFRESH_SECONDS", "5")
+    )
+
+    # How often each worker logs its task cache counters as JSON
+    CACHE_METRICS_LOG_INTERVAL_SECONDS = float(
+        os.getenv("CACHE_METRICS_LOG_INTERVAL_SECONDS", "60")
+    )
+
+    # Task list prewarming after logins, rate-limited per worker
+    CACHE_PREWARM_ON_LOGIN = (
+        os.getenv("CACHE_PREWARM_ON_LOGIN", "true").lower() == "true"
+    )
+    CACHE_PREWARM_MAX_PER_SECOND = float(
+        os.getenv("CACHE_PREWARM_MAX_PER_SECOND", "20")
+    )
+    CACHE_PREWARM_MAX_PENDING = int(os.getenv("CACHE_PREWARM_MAX_PENDING", "100"))
+
+    # Per-worker L1 in front of the Redis task cache
+    TASK_L1_CACHE_ENABLED = os.getenv("TASK_L1_CACHE_ENABLED", "true").lower() == "true"
+    TASK_L1_CACHE_MAX_ENTRIES = int(os.getenv("TASK_L1_CACHE_MAX_ENTRIES", "2000"))
+    TASK_L1_CACHE_MAX_BYTES = int(
+        os.getenv("TASK_L1_CACHE_MAX_BYTES", str(16 * 1024 * 1024))
+    )
+    TASK_L1_CACHE_TTL_SECONDS = float(os.getenv("TASK_L1_CACHE_TTL_SECONDS", "5"))
+    TASK_CACHE_INVALIDATION_CHANNEL = os.getenv(
+        "TASK_CACHE_INVALIDATION_CHANNEL", "tasks:cache_invalidations"
+    )
+
+    # Failed-login throttling, checked before any password hashing
+    LOGIN_THROTTLE_ENABLED = (
+        os.getenv("LOGIN_THROTTLE_ENABLED", "true").lower() == "true"
+    )
+    LOGIN_THROTTLE_WINDOW_SECONDS = int(
+        os.getenv("LOGIN_THROTTLE_WINDOW_SECONDS", "300")
+    )
+    LOGIN_THROTTLE_EMAIL_LIMIT = int(os.getenv("LOGIN_THROTTLE_EMAIL_LIMIT", "5"))
+    LOGIN_THROTTLE_IP_LIMIT = int(os.getenv("LOGIN_THROTTLE_IP_LIMIT", "50"))
+    # Reverse proxies in front of the app that append to X-Forwarded-For.
+    # The per-IP limit keys on the client address they report; left at 0
+    # behind a proxy, every client shares the proxy's address.
+    TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "0"))
+
     # Email Configuration
     SMTP_HOST = os.getenv("SMTP_HOST", "localhost")
     SMTP_PORT = int(os.getenv("SMTP_PORT", "1025"))
@@ -44,3 +147,11 @@ class Config:
     PASSWORD_RESET_EXPIRE_MINUTES = int(
         os.getenv("PASSWORD_RESET_EXPIRE_MINUTES", "60")
     )
+
+    # Email outbox (drained by `flask outbox work`)
+    EMAIL_OUTBOX_ENABLED = os.getenv("EMAIL_OUTBOX_ENABLED", "true").lower() == "true"
+    EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+    EMAIL_OUTBOX_BACKOFF_SECONDS = int(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", "5"))
+    EMAIL_OUTBOX_MAX_BACKOFF_SECONDS = int(
+        os.getenv("EMAIL_OUTBOX_MAX_BACKOFF_SECONDS", "300")
+    )
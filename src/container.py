@@ -1,12 +1,22 @@
 from dependency_injector import containers, providers
 from pymongo import MongoClient
 from redis import StrictRedis
+from .config import Config
 from .services.task import TaskService
 from .services.cached_task import CachedTaskService
 from .services.auth import AuthService
 from .services.user import UserService
 from .services.email import EmailService
+from .services.email_outbox import EmailOutbox
 from .services.metrics import MetricsService
+from .services.token_cache import TokenCache
+from .services.password_hasher import PasswordHasher
+from .services.key_ring import KeyRing
+from .services.login_throttle import LoginThrottle
+from .services.task_cache import TaskCache
+from .services.cache_prewarmer import CachePrewarmer
+from .services.cache_generation import CacheGeneration
+from .utils.stats import CacheMetrics
 from .repositories.task import TaskRepository
 from .repositories.user import UserRepository
 from .repositories.metrics import MetricsRepository
@@ -62,13 +72,35 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Services
-    email_service = providers.Factory(EmailService)
+    smtp_email_service = providers.Factory(EmailService)
+
+    # Outbox that queues emails in Redis; a worker sends them over SMTP
+    email_service = providers.Factory(
+        EmailOutbox,
+        redis_client=redis_client,
+        email_service=smtp_email_service,
+    )
+
+    # Verified-token cache shared by every request in the worker
+    token_cache = providers.Singleton(TokenCache, redis_client=redis_client)
+
+    # Bounded bcrypt pool shared by every request in the worker
+    password_hasher = providers.Singleton(PasswordHasher)
+
+    # JWT keys, parsed once and reloaded when the key ring file changes
+    key_ring = providers.Singleton(KeyRing)
+
+    login_throttle = providers.Factory(LoginThrottle, redis_client=redis_client)
 
     auth_service = providers.Factory(
         AuthService,
         user_repository=user_repository,
         redis_client=redis_client,
         email_service=email_service,
+        token_cache=token_cache,
+        password_hasher=password_hasher,
+        key_ring=key_ring,
+        login_throttle=login_throttle,
     )
 
     user_service = providers.Factory(
@@ -84,12 +116,37 @@ class Container(containers.DeclarativeContainer):
         user_service=user_service,
     )
 
+    # In-process L1 task cache shared by every request in the worker
+    task_cache = providers.Singleton(TaskCache, redis_client=redis_client)
+
+    # Task cache hit, size and latency counters shared by the worker
+    cache_metrics = providers.Singleton(
+        CacheMetrics, log_interval=Config.CACHE_METRICS_LOG_INTERVAL_SECONDS
+    )
+
+    # Global task cache generation, re-read by each worker every few seconds
+    task_cache_generation = providers.Singleton(
+        CacheGeneration, redis_client=redis_client, key="task_cache_generation"
+    )
+
     # Cached task service that wraps the core task service
     task_service = providers.Factory(
         CachedTaskService,
         task_service=core_task_service,
         redis_client=redis_client,
+        task_cache=task_cache,
+        metrics=cache_metrics,
+        generation=task_cache_generation,
+    )
+
+    # Background and bulk task list prewarming, shared by the worker
+    cache_prewarmer = providers.Singleton(
+        CachePrewarmer,
+        task_service_factory=task_service.provider,
+        task_repository=task_repository,
     )
+    # Logins queue a prewarm; wired here since task_service is defined later
+    auth_service.add_kwargs(cache_prewarmer=cache_prewarmer)
 
     metrics_service = providers.Factory(
         MetricsService,
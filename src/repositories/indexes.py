@@ -0,0 +1,153 @@
+from pymongo.errors import OperationFailure, PyMongoError
+from ..utils.logger import setup_logger
+from .task import TaskRepository
+from .user import UserRepository
+
+logger = setup_logger("indexes")
+
+# Collection name -> repository declaring the indexes its queries need
+INDEXED_REPOSITORIES = {
+    "tasks": TaskRepository,
+    "users": UserRepository,
+}
+
+INDEX_CHECK_MODES = ("off", "warn", "fail")
+
+# Index options that change query results or behaviour, so a mismatch is a conflict
+_COMPARED_OPTIONS = (
+    "unique",
+    "sparse",
+    "partialFilterExpression",
+    "expireAfterSeconds",
+)
+
+
+class IndexCheckError(RuntimeError):
+    """Raised at startup when required indexes are missing in "fail" mode"""
+
+
+def _key_pattern(keys) -> list[tuple]:
+    # Declared keys are a SON, index_information() returns a list of pairs
+    if hasattr(keys, "items"):
+        return list(keys.items())
+    return [tuple(key) for key in keys]
+
+
+def _options(index: dict) -> dict:
+    return {
+        option: index[option]
+        for option in _COMPARED_OPTIONS
+        if index.get(option) not in (None, False)
+    }
+
+
+def diff_indexes(db) -> list[dict]:
+    """Compare declared indexes with the ones that exist in MongoDB.
+
+    Indexes are matched on their key pattern, so an equivalent index under
+    another name counts as present. Each row has a status of "ok",
+    "missing", "conflict" (same keys, different options) or "extra"
+    (present but not declared).
+    """
+    rows = []
+    for collection_name, repository in INDEXED_REPOSITORIES.items():
+        existing = db.get_collection(collection_name).index_information()
+        matched = set()
+        for model in repository.INDEXES:
+            declared = model.document
+            keys = _key_pattern(declared["key"])
+            row = {
+                "collection": collection_name,
+                "name": declared["name"],
+                "keys": keys,
+                "status": "missing",
+            }
+            for name, index in existing.items():
+                if _key_pattern(index["key"]) != keys:
+                    continue
+                matched.add(name)
+                if _options(index) == _options(declared):
+                    row["status"] = "ok"
+                else:
+                    row["status"] = "conflict"
+                    row["detail"] = f"{name} has options {_options(index)}"
+                break
+            rows.append(row)
+
+        for name, index in existing.items():
+            if name != "_id_" and name not in matched:
+                rows.append(
+                    {
+                        "collection": collection_name,
+                        "name": name,
+                        "keys": _key_pattern(index["key"]),
+                        "status": "extra",
+                    }
+                )
+    return rows
+
+
+def create_missing_indexes(db) -> list[dict]:
+    """Build every missing index and return the refreshed diff.
+
+    Conflicting indexes are left alone since replacing them means dropping
+    an index that live queries may be using; they stay in the report.
+    """
+    failures = {}
+    for row in diff_indexes(db):
+        if row["status"] != "missing":
+            continue
+        collection_name, name = row["collection"], row["name"]
+        model = next(
+            model
+            for model in INDEXED_REPOSITORIES[collection_name].INDEXES
+            if model.document["name"] == name
+        )
+        logger.info(f"Building index {collection_name}.{name}")
+        try:
+            db.get_collection(collection_name).create_indexes([model])
+        except OperationFailure as e:
+            # e.g. duplicate emails blocking a unique index
+            failures[(collection_name, name)] = str(e)
+            logger.error(f"Error building index {collection_name}.{name}: {str(e)}")
+
+    rows = diff_indexes(db)
+    for row in rows:
+        error = failures.get((row["collection"], row["name"]))
+        if error:
+            row["status"] = "failed"
+            row["detail"] = error
+    return rows
+
+
+def check_indexes(db, mode: str) -> list[dict]:
+    """Log or raise when declared indexes are missing or conflicting"""
+    if mode not in INDEX_CHECK_MODES:
+        raise ValueError(f"Unknown index check mode: {mode}")
+    if mode == "off":
+        return []
+
+    try:
+        rows = diff_indexes(db)
+    except PyMongoError as e:
+        if mode == "fail":
+            raise IndexCheckError(f"Could not read MongoDB indexes: {str(e)}")
+        logger.warning(
+            f"Skipping index check, could not read MongoDB indexes: {str(e)}"
+        )
+        return []
+
+    problems = [row for row in rows if row["status"] in ("missing", "conflict")]
+    if problems:
+        message = (
+            "MongoDB indexes out of date: "
+            + ", ".join(
+                f"{row['collection']}.{row['name']} ({row['status']})"
+                for row in problems
+            )
+            + "; run `flask db indexes --apply`"
+        )
+        if mode == "fail":
+            raise IndexCheckError(message)
+        logger.warning(message)
+    return rows
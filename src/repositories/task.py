@@ -1,8 +1,33 @@
+from typing import Iterator, Optional
 from bson.objectid import ObjectId
+from pymongo import (
+    ASCENDING,
+    DeleteOne,
+    IndexModel,
+    InsertOne,
+    ReturnDocument,
+    UpdateOne,
+)
+from pymongo.errors import BulkWriteError
 from ..models.task import Task
 
 
 class TaskRepository:
+    # Indexes the queries below rely on, checked and built by
+    # repositories/indexes.py
+    INDEXES = [
+        # Per-user lookups and listings in _id (creation) order
+        IndexModel(
+            [("user_id", ASCENDING), ("_id", ASCENDING)], name="user_id_1__id_1"
+        ),
+    ]
+
+    # Fields a Task is built from; reads fetch only these unless the caller
+    # asks for fewer. Anything else stored on a document stays in MongoDB.
+    TASK_PROJECTION = {"title": 1, "description": 1, "user_id": 1, "completed": 1}
+    # Enough to count tasks by status
+    STATUS_PROJECTION = {"completed": 1}
+
     def __init__(self, collection):
         self.collection = collection
 
@@ -10,8 +35,13 @@ class TaskRepository:
         result = self.collection.insert_one(task.to_dict())
         return str(result.inserted_id)
 
-    def find_by_id(self, task_id: str) -> Task:
-        task_data = self.collection.find_one({"_id": ObjectId(task_id)})
+    def _projection(self, projection: Optional[dict]) -> dict:
+        return self.TASK_PROJECTION if projection is None else projection
+
+    def find_by_id(self, task_id: str, projection: Optional[dict] = None) -> Task:
+        task_data = self.collection.find_one(
+            {"_id": ObjectId(task_id)}, self._projection(projection)
+        )
         return Task.from_dict(task_data) if task_data else None
 
     def update(self, task_id: str, task: Task) -> None:
@@ -20,10 +50,141 @@ class TaskRepository:
     def delete(self, task_id: str) -> None:
         self.collection.delete_one({"_id": ObjectId(task_id)})
 
-    def find_all(self) -> list[Task]:
-        tasks_data = self.collection.find({})
+    def update_owned(self, task_id: str, user_id: str, fields: dict) -> Optional[Task]:
+        """Set ``fields`` on the task if ``user_id`` owns it, in one round trip.
+
+        Returns the updated task, or None when no task matched.
+        """
+        query = {"_id": ObjectId(task_id), "user_id": user_id}
+        if not fields:
+            task_data = self.collection.find_one(query, self.TASK_PROJECTION)
+        else:
+            task_data = self.collection.find_one_and_update(
+                query,
+                {"$set": fields},
+                projection=self.TASK_PROJECTION,
+                return_document=ReturnDocument.AFTER,
+            )
+        return Task.from_dict(task_data) if task_data else None
+
+    def delete_owned(self, task_id: str, user_id: str) -> bool:
+        """Delete the task if ``user_id`` owns it; False when no task matched"""
+        result = self.collection.delete_one(
+            {"_id": ObjectId(task_id), "user_id": user_id}
+        )
+        return result.deleted_count == 1
+
+    def exists(self, task_id: str) -> bool:
+        return self.collection.count_documents({"_id": ObjectId(task_id)}, limit=1) > 0
+
+    def find_owners(self, task_ids: list[str]) -> dict[str, str]:
+        """Map each of ``task_ids`` that exists to its owner, in one query"""
+        tasks_data = self.collection.find(
+            {"_id": {"$in": [ObjectId(task_id) for task_id in task_ids]}},
+            {"user_id": 1},
+        )
+        return {
+            str(task_data["_id"]): task_data.get("user_id") for task_data in tasks_data
+        }
+
+    def _bulk_write(self, operations: list) -> dict[int, str]:
+        """Apply ``operations`` in one unordered batch.
+
+        Returns the error of each operation that failed by its position;
+        every other operation was applied.
+        """
+        if not operations:
+            return {}
+        try:
+            self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            if e.details.get("writeConcernErrors"):
+                raise
+            return {
+                error["index"]: error.get("errmsg", "Write failed")
+                for error in e.details.get("writeErrors", [])
+            }
+        return {}
+
+    def bulk_create(self, tasks: list[Task]) -> tuple[list[str], dict[int, str]]:
+        """Insert ``tasks`` in one batch; returns their ids and the failures"""
+        documents = [{"_id": ObjectId(), **task.to_dict()} for task in tasks]
+        errors = self._bulk_write([InsertOne(document) for document in documents])
+        return [str(document["_id"]) for document in documents], errors
+
+    def bulk_update_owned(
+        self, updates: list[tuple[str, dict]], user_id: str
+    ) -> dict[int, str]:
+        """Set each (task id, fields) pair on tasks ``user_id`` owns, in one batch"""
+        return self._bulk_write(
+            [
+                UpdateOne(
+                    {"_id": ObjectId(task_id), "user_id": user_id}, {"$set": fields}
+                )
+                for task_id, fields in updates
+            ]
+        )
+
+    def bulk_delete_owned(self, task_ids: list[str], user_id: str) -> dict[int, str]:
+        """Delete the tasks ``user_id`` owns among ``task_ids``, in one batch"""
+        return self._bulk_write(
+            [
+                DeleteOne({"_id": ObjectId(task_id), "user_id": user_id})
+                for task_id in task_ids
+            ]
+        )
+
+    def find_all(self, projection: Optional[dict] = None) -> list[Task]:
+        """Every task; fields left out of ``projection`` are None on the Task"""
+        tasks_data = self.collection.find({}, self._projection(projection))
         return [Task.from_dict(task_data) for task_data in tasks_data]
 
-    def find_by_user_id(self, user_id: str) -> list[Task]:
-        tasks_data = self.collection.find({"user_id": user_id})
+    def find_by_user_id(
+        self, user_id: str, projection: Optional[dict] = None
+    ) -> list[Task]:
+        tasks_data = self.collection.find(
+            {"user_id": user_id}, self._projection(projection)
+        )
         return [Task.from_dict(task_data) for task_data in tasks_data]
+
+    def find_page_by_user_id(
+        self,
+        user_id: str,
+        after_id: Optional[str],
+        limit: int,
+        projection: Optional[dict] = None,
+    ) -> list[Task]:
+        """Up to ``limit`` of the user's tasks created after ``after_id``.
+
+        A range on the {user_id, _id} index, so the cost does not grow with
+        how deep into the list the page is.
+        """
+        query = {"user_id": user_id}
+        if after_id:
+            query["_id"] = {"$gt": ObjectId(after_id)}
+        tasks_data = (
+            self.collection.find(query, self._projection(projection))
+            .sort("_id", ASCENDING)
+            .limit(limit)
+        )
+        return [Task.from_dict(task_data) for task_data in tasks_data]
+
+    def find_recent_user_ids(self, limit: int) -> list[str]:
+        """Users ordered by their most recently created task, newest first"""
+        pipeline = [
+            # Sorting on the user_id/_id index lets $first read one entry per user
+            {"$sort": {"user_id": -1, "_id": -1}},
+            {"$group": {"_id": "$user_id", "last_task_id": {"$first": "$_id"}}},
+            {"$sort": {"last_task_id": -1}},
+            {"$limit": limit},
+        ]
+        return [row["_id"] for row in self.collection.aggregate(pipeline)]
+
+    def iter_by_user_ids(
+        self, user_ids: list[str], batch_size: int, projection: Optional[dict] = None
+    ) -> Iterator[Task]:
+        cursor = self.collection.find(
+            {"user_id": {"$in": user_ids}}, self._projection(projection)
+        ).batch_size(batch_size)
+        for task_data in cursor:
+            yield Task.from_dict(task_data)
@@ -1,8 +1,16 @@
 from bson.objectid import ObjectId
+from pymongo import ASCENDING, IndexModel
 from ..models.user import User
 
 
 class UserRepository:
+    # Indexes the queries below rely on, checked and built by
+    # repositories/indexes.py
+    INDEXES = [
+        # find_by_email on every login; also rejects duplicate registrations
+        IndexModel([("email", ASCENDING)], name="email_1", unique=True),
+    ]
+
     def __init__(self, collection):
         self.collection = collection
 
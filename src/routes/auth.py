@@ -2,6 +2,8 @@ from flask import Blueprint, request, jsonify, g
 from dependency_injector.wiring import inject, Provide
 from src.container import Container
 from src.services.auth import AuthService
+from src.services.password_hasher import PasswordHasherBusyError
+from src.services.login_throttle import LoginThrottledError
 from src.schemas.user import (
     UserRegister,
     UserLogin,
@@ -16,7 +18,12 @@ from src.schemas.user import (
     RefreshTokenRequest,
     RefreshTokenResponse,
 )
-from src.schemas.common import ErrorResponse, UnauthorizedResponse
+from src.schemas.common import (
+    ErrorResponse,
+    UnauthorizedResponse,
+    TooManyRequestsResponse,
+    ServiceUnavailableResponse,
+)
 from src.utils.decorators import validate_request
 from src.middleware.auth import require_auth
 
@@ -24,6 +31,14 @@ from src.middleware.auth import require_auth
 auth_bp = Blueprint("auth", __name__)
 
 
+def _service_unavailable():
+    return (
+        jsonify(ServiceUnavailableResponse().model_dump()),
+        503,
+        {"Retry-After": "1"},
+    )
+
+
 @auth_bp.route("/register", methods=["POST"])
 @inject
 @validate_request(UserRegister)
@@ -46,6 +61,8 @@ def register(
         )
     except ValueError as e:
         return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
+    except PasswordHasherBusyError:
+        return _service_unavailable()
     except Exception as e:
         return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
 
@@ -55,7 +72,9 @@ def register(
 @validate_request(UserLogin)
 def login(data: UserLogin, auth_service: AuthService = Provide[Container.auth_service]):
     try:
-        user = auth_service.authenticate(data.email, data.password)
+        user = auth_service.authenticate(
+            data.email, data.password, client_ip=request.remote_addr
+        )
         if not user:
             return (
                 jsonify(UnauthorizedResponse(error="Invalid credentials").model_dump()),
@@ -76,6 +95,14 @@ def login(data: UserLogin, auth_service: AuthService = Provide[Container.auth_se
             ),
             200,
         )
+    except LoginThrottledError as e:
+        return (
+            jsonify(TooManyRequestsResponse().model_dump()),
+            429,
+            {"Retry-After": str(e.retry_after)},
+        )
+    except PasswordHasherBusyError:
+        return _service_unavailable()
     except Exception as e:
         return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
 
@@ -84,18 +111,20 @@ def login(data: UserLogin, auth_service: AuthService = Provide[Container.auth_se
 @inject
 @validate_request(RefreshTokenRequest)
 def refresh_token(
-    data: RefreshTokenRequest, auth_service: AuthService = Provide[Container.auth_service]
+    data: RefreshTokenRequest,
+    auth_service: AuthService = Provide[Container.auth_service],
 ):
     try:
         token_data = auth_service.refresh_access_token(data.refresh_token)
         if not token_data:
             return (
-                jsonify(UnauthorizedResponse(error="Invalid refresh token").model_dump()),
+                jsonify(
+                    UnauthorizedResponse(error="Invalid refresh token").model_dump()
+                ),
                 401,
             )
 
-        # Get user info
-        user = auth_service.validate_token(token_data["access_token"])
+        user = token_data["user"]
         return (
             jsonify(
                 RefreshTokenResponse(
@@ -143,7 +172,11 @@ def forgot_password(
 def reset_password(
     data: PasswordReset, auth_service: AuthService = Provide[Container.auth_service]
 ):
-    if auth_service.reset_password(data.token, data.new_password):
+    try:
+        reset = auth_service.reset_password(data.token, data.new_password)
+    except PasswordHasherBusyError:
+        return _service_unavailable()
+    if reset:
         return jsonify(PasswordResetResponse().model_dump()), 200
     return (
         jsonify(ErrorResponse(error="Invalid or expired reset token").model_dump()),
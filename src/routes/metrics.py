@@ -2,9 +2,19 @@ from flask import Blueprint, jsonify
 from dependency_injector.wiring import inject, Provide
 from src.container import Container
 from src.services.metrics import MetricsService
+from src.services.token_cache import TokenCache
+from src.services.password_hasher import PasswordHasher
+from src.services.email_outbox import EmailOutbox
+from src.services.task_cache import TaskCache
+from src.services.cache_prewarmer import CachePrewarmer
+from src.utils.stats import CacheMetrics
 from src.middleware.auth import require_auth
 from src.utils.logger import setup_logger
-from src.schemas.metrics import MetricsResponse, MetricsErrorResponse
+from src.schemas.metrics import (
+    MetricsResponse,
+    MetricsErrorResponse,
+    RuntimeMetricsResponse,
+)
 from src.schemas.common import UnauthorizedResponse
 
 logger = setup_logger("metrics_routes")
@@ -33,3 +43,34 @@ def get_metrics(metrics_service: MetricsService = Provide[Container.metrics_serv
     except Exception as e:
         logger.error(f"Error retrieving metrics: {str(e)}")
         return jsonify(MetricsErrorResponse().model_dump()), 500
+
+
+@metrics_bp.route("/runtime", methods=["GET"])
+@inject
+@require_auth
+def get_runtime_metrics(
+    token_cache: TokenCache = Provide[Container.token_cache],
+    password_hasher: PasswordHasher = Provide[Container.password_hasher],
+    email_outbox: EmailOutbox = Provide[Container.email_service],
+    task_cache: TaskCache = Provide[Container.task_cache],
+    cache_metrics: CacheMetrics = Provide[Container.cache_metrics],
+    cache_prewarmer: CachePrewarmer = Provide[Container.cache_prewarmer],
+):
+    """Get in-process counters for the current worker"""
+    try:
+        return (
+            jsonify(
+                RuntimeMetricsResponse(
+                    token_cache=token_cache.stats(),
+                    password_hasher=password_hasher.stats(),
+                    email_outbox=email_outbox.stats(),
+                    task_cache=task_cache.stats(),
+                    cache_operations=cache_metrics.snapshot(),
+                    cache_prewarm=cache_prewarmer.stats(),
+                ).model_dump()
+            ),
+            200,
+        )
+    except Exception as e:
+        logger.error(f"Error retrieving runtime metrics: {str(e)}")
+        return jsonify(MetricsErrorResponse().model_dump()), 500
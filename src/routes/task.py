@@ -1,7 +1,9 @@
-from flask import Blueprint, jsonify, g
+from typing import Optional
+from flask import Blueprint, Response, current_app, jsonify, g, request
 from dependency_injector.wiring import inject, Provide
+from src.config import Config
 from src.container import Container
-from src.services.task import TaskService
+from src.services.task import TaskNotFoundError, TaskService
 from src.schemas.task import (
     TaskCreate,
     TaskUpdate,
@@ -12,6 +14,12 @@ from src.schemas.task import (
     TaskUpdateResponse,
     TaskDeleteResponse,
     TaskStatusUpdateResponse,
+    TaskBulkCreate,
+    TaskBulkUpdate,
+    TaskBulkStatusUpdate,
+    TaskBulkDelete,
+    TaskBulkItemResult,
+    TaskBulkResponse,
 )
 from src.schemas.common import ErrorResponse, ValidationErrorResponse, NotFoundResponse
 from src.middleware.auth import require_auth
@@ -44,6 +52,116 @@ def create(
         return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
 
 
+def _bulk_response(results: list[dict]):
+    return (
+        jsonify(
+            TaskBulkResponse(
+                results=[TaskBulkItemResult(**result) for result in results]
+            ).model_dump()
+        ),
+        200,
+    )
+
+
+@tasks_bp.route("/bulk", methods=["POST"])
+@inject
+@require_auth
+@validate_request(TaskBulkCreate)
+def bulk_create(
+    data: TaskBulkCreate,
+    task_service: TaskService = Provide[Container.task_service],
+):
+    try:
+        results = task_service.bulk_create_tasks(
+            [(task.title, task.description) for task in data.tasks], g.current_user.id
+        )
+        return _bulk_response(results)
+    except ValueError as e:
+        logger.error(f"Validation error while bulk creating tasks: {str(e)}")
+        return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
+    except Exception as e:
+        logger.exception("Unexpected error while bulk creating tasks")
+        return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
+
+
+@tasks_bp.route("/bulk", methods=["PUT"])
+@inject
+@require_auth
+@validate_request(TaskBulkUpdate)
+def bulk_update(
+    data: TaskBulkUpdate,
+    task_service: TaskService = Provide[Container.task_service],
+):
+    try:
+        # As with PUT /tasks/<id>, a missing description keeps the stored one
+        updates = [
+            (
+                task.id,
+                {
+                    field: value
+                    for field, value in (
+                        ("title", task.title),
+                        ("description", task.description),
+                    )
+                    if value is not None
+                },
+            )
+            for task in data.tasks
+        ]
+        return _bulk_response(
+            task_service.bulk_update_tasks(updates, g.current_user.id)
+        )
+    except ValueError as e:
+        logger.error(f"Validation error while bulk updating tasks: {str(e)}")
+        return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
+    except Exception as e:
+        logger.exception("Unexpected error while bulk updating tasks")
+        return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
+
+
+@tasks_bp.route("/bulk/status", methods=["PATCH"])
+@inject
+@require_auth
+@validate_request(TaskBulkStatusUpdate)
+def bulk_update_status(
+    data: TaskBulkStatusUpdate,
+    task_service: TaskService = Provide[Container.task_service],
+):
+    try:
+        updates = [
+            (task.id, {"completed": bool(task.completed)}) for task in data.tasks
+        ]
+        return _bulk_response(
+            task_service.bulk_update_tasks(updates, g.current_user.id)
+        )
+    except ValueError as e:
+        logger.error(f"Validation error while bulk updating task status: {str(e)}")
+        return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
+    except Exception as e:
+        logger.exception("Unexpected error while bulk updating task status")
+        return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
+
+
+@tasks_bp.route("/bulk", methods=["DELETE"])
+@inject
+@require_auth
+@validate_request(TaskBulkDelete)
+def bulk_delete(
+    data: TaskBulkDelete,
+    task_service: TaskService = Provide[Container.task_service],
+):
+    try:
+        return _bulk_response(
+            task_service.bulk_delete_tasks(data.ids, g.current_user.id)
+        )
+    except ValueError as e:
+        logger.error(f"Validation error while bulk deleting tasks: {str(e)}")
+        return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
+    except Exception as e:
+        logger.exception("Unexpected error while bulk deleting tasks")
+        return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
+
+
 @tasks_bp.route("/<task_id>", methods=["GET"])
 @inject
 @require_auth
@@ -83,14 +201,13 @@ def update(
     task_service: TaskService = Provide[Container.task_service],
 ):
     try:
-        task = task_service.get_task(task_id, g.current_user.id)
-        if task is None:
-            return jsonify(NotFoundResponse().model_dump()), 404
-
+        # Ownership is part of the update filter; no read beforehand
         task_service.update_task(
             task_id, data.title, data.description, g.current_user.id
         )
         return jsonify(TaskUpdateResponse().model_dump()), 200
+    except TaskNotFoundError:
+        return jsonify(NotFoundResponse().model_dump()), 404
     except ValueError as e:
         return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
     except Exception as e:
@@ -105,14 +222,12 @@ def delete(
     task_service: TaskService = Provide[Container.task_service],
 ):
     try:
-        task = task_service.get_task(task_id, g.current_user.id)
-        if task is None:
-            logger.warning(f"Attempt to delete non-existent task: {task_id}")
-            return jsonify(NotFoundResponse().model_dump()), 404
-
         task_service.delete_task(task_id, g.current_user.id)
         logger.info(f"Task {task_id} successfully deleted by user {g.current_user.id}")
         return jsonify(TaskDeleteResponse().model_dump()), 200
+    except TaskNotFoundError:
+        logger.warning(f"Attempt to delete non-existent task: {task_id}")
+        return jsonify(NotFoundResponse().model_dump()), 404
     except ValueError as e:
         logger.error(f"Error deleting task {task_id}: {str(e)}")
         return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
@@ -121,24 +236,78 @@ def delete(
         return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
 
 
+def _task_responses(tasks) -> list[TaskResponse]:
+    return [
+        TaskResponse(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            user_id=task.user_id,
+            completed=task.completed,
+        )
+        for task in tasks
+    ]
+
+
+def _render_task_list(
+    tasks, next_cursor: Optional[str] = None, paged: bool = False
+) -> bytes:
+    """Serialize a task list body the same way on the cached and uncached paths"""
+    response = TaskListResponse(tasks=_task_responses(tasks), next=next_cursor)
+    # Only paginated responses carry the next-page cursor
+    data = response.model_dump(exclude=None if paged else {"next"})
+    # Same bytes jsonify would send, so the cached body matches the uncached one
+    return current_app.json.response(data).get_data()
+
+
+def _task_list_response(body: bytes, headers: Optional[dict] = None) -> Response:
+    return Response(body, status=200, mimetype="application/json", headers=headers)
+
+
+def _parse_limit(value: str | None) -> int:
+    if value is None:
+        return Config.TASK_LIST_DEFAULT_LIMIT
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError("limit must be an integer")
+
+
 @tasks_bp.route("/", methods=["GET"])
 @inject
 @require_auth
 def get_user_tasks(task_service: TaskService = Provide[Container.task_service]):
     try:
-        tasks = task_service.get_user_tasks(g.current_user.id)
-        tasks_response = [
-            TaskResponse(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                user_id=task.user_id,
-                completed=task.completed,
+        limit = request.args.get("limit")
+        cursor = request.args.get("cursor")
+        if limit is not None or cursor is not None:
+            # Keyset pagination: one index range per page, whatever the list size
+            tasks, next_cursor = task_service.get_user_tasks_page(
+                g.current_user.id, cursor, _parse_limit(limit)
             )
-            for task in tasks
-        ]
+            logger.info(
+                f"Retrieved a page of {len(tasks)} tasks for user {g.current_user.id}"
+            )
+            return _task_list_response(
+                _render_task_list(tasks, next_cursor, paged=True)
+            )
+
+        if Config.TASK_LIST_RESPONSE_CACHE_ENABLED:
+            # Serve the cached, already serialized body as-is
+            body, etag = task_service.get_user_tasks_response(
+                g.current_user.id, _render_task_list
+            )
+            # If-None-Match uses the weak comparison; contains_weak also
+            # matches "*"
+            if request.if_none_match.contains_weak(etag):
+                return Response(status=304, headers={"ETag": f'"{etag}"'})
+            return _task_list_response(body, {"ETag": f'"{etag}"'})
+
+        tasks = task_service.get_user_tasks(g.current_user.id)
         logger.info(f"Retrieved {len(tasks)} tasks for user {g.current_user.id}")
-        return jsonify(TaskListResponse(tasks=tasks_response).model_dump()), 200
+        return _task_list_response(_render_task_list(tasks))
+    except ValueError as e:
+        return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
     except Exception as e:
         logger.exception("Error retrieving user tasks")
         return jsonify(ErrorResponse(error="Internal server error").model_dump()), 500
@@ -154,11 +323,6 @@ def update_status(
     task_service: TaskService = Provide[Container.task_service],
 ):
     try:
-        task = task_service.get_task(task_id, g.current_user.id)
-        if task is None:
-            logger.warning(f"Attempt to update status of non-existent task: {task_id}")
-            return jsonify(NotFoundResponse().model_dump()), 404
-
         task_service.update_task_status(
             task_id, bool(data.completed), g.current_user.id
         )
@@ -166,6 +330,9 @@ def update_status(
             f"Successfully updated completion status of task {task_id} to {data.completed}"
         )
         return jsonify(TaskStatusUpdateResponse().model_dump()), 200
+    except TaskNotFoundError:
+        logger.warning(f"Attempt to update status of non-existent task: {task_id}")
+        return jsonify(NotFoundResponse().model_dump()), 404
     except ValueError as e:
         logger.error(f"Error updating task status: {str(e)}")
         return jsonify(ErrorResponse(error=str(e)).model_dump()), 400
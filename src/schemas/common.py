@@ -30,3 +30,11 @@ class NotFoundResponse(BaseModel):
 
 class ForbiddenResponse(BaseModel):
     error: str = "Forbidden"
+
+
+class TooManyRequestsResponse(BaseModel):
+    error: str = "Too many failed login attempts, please try again later"
+
+
+class ServiceUnavailableResponse(BaseModel):
+    error: str = "Service temporarily unavailable, please retry"
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import BaseModel
 
 
@@ -8,5 +9,96 @@ class MetricsResponse(BaseModel):
     active_tasks: int
 
 
+class CacheStatsResponse(BaseModel):
+    size: int
+    max_entries: int
+    bytes: int = 0
+    max_bytes: Optional[int] = None
+    hits: int
+    misses: int
+    hit_ratio: float
+    evictions: int
+    expirations: int
+    invalidations: int
+
+
+class HitRatioResponse(BaseModel):
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class RebuildStatsResponse(BaseModel):
+    rebuilds: int
+    early_refreshes: int
+    coalesced: int
+    wait_timeouts: int
+
+
+class TaskCacheStatsResponse(BaseModel):
+    enabled: bool
+    l1: CacheStatsResponse
+    l2: HitRatioResponse
+    rebuilds: RebuildStatsResponse
+
+
+class LatencyStatsResponse(BaseModel):
+    count: int
+    avg_ms: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class PasswordHasherStatsResponse(BaseModel):
+    rounds: int
+    max_workers: int
+    max_queue: int
+    rejected: int
+    queue_wait: LatencyStatsResponse
+    hash_time: LatencyStatsResponse
+
+
+class EmailOutboxStatsResponse(BaseModel):
+    pending: int
+    retrying: int
+    dead: int
+    oldest_pending_age_seconds: float
+    send_latency: Optional[LatencyStatsResponse] = None
+
+
+class CacheOperationStatsResponse(BaseModel):
+    calls: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    bytes: int
+    avg_bytes: float
+    latency: LatencyStatsResponse
+
+
+class CacheMetricsResponse(BaseModel):
+    # Key family -> operation -> counters
+    families: dict[str, dict[str, CacheOperationStatsResponse]]
+    invalidations: dict[str, int]
+
+
+class CachePrewarmStatsResponse(BaseModel):
+    enabled: bool
+    queued: int
+    skipped: int
+    failed: int
+    pending: int
+
+
+class RuntimeMetricsResponse(BaseModel):
+    token_cache: CacheStatsResponse
+    password_hasher: PasswordHasherStatsResponse
+    email_outbox: EmailOutboxStatsResponse
+    task_cache: TaskCacheStatsResponse
+    cache_operations: CacheMetricsResponse
+    cache_prewarm: CachePrewarmStatsResponse
+
+
 class MetricsErrorResponse(BaseModel):
     error: str = "Internal server error"
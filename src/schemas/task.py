@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import Optional
+from src.config import Config
 
 
 class TaskCreate(BaseModel):
@@ -8,8 +9,8 @@ class TaskCreate(BaseModel):
 
 
 class TaskUpdate(BaseModel):
-    title: str = Field(... , min_length=1, max_length=100)
-    description: Optional[str] = Field(None , max_length=500)
+    title: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = Field(None, max_length=500)
 
 
 class TaskStatusUpdate(BaseModel):
@@ -26,6 +27,8 @@ class TaskResponse(BaseModel):
 
 class TaskListResponse(BaseModel):
     tasks: list[TaskResponse]
+    # Cursor of the next page when paginating; None on the last page
+    next: Optional[str] = None
 
 
 class TaskCreateResponse(BaseModel):
@@ -43,3 +46,47 @@ class TaskDeleteResponse(BaseModel):
 
 class TaskStatusUpdateResponse(BaseModel):
     message: str = "Task status updated successfully"
+
+
+class TaskBulkCreate(BaseModel):
+    # Oversized bodies are rejected by the length check, before any item is parsed
+    tasks: list[TaskCreate] = Field(
+        ..., min_length=1, max_length=Config.TASK_BULK_MAX_ITEMS
+    )
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: str
+
+
+class TaskBulkUpdate(BaseModel):
+    tasks: list[TaskBulkUpdateItem] = Field(
+        ..., min_length=1, max_length=Config.TASK_BULK_MAX_ITEMS
+    )
+
+
+class TaskBulkStatusItem(TaskStatusUpdate):
+    id: str
+
+
+class TaskBulkStatusUpdate(BaseModel):
+    tasks: list[TaskBulkStatusItem] = Field(
+        ..., min_length=1, max_length=Config.TASK_BULK_MAX_ITEMS
+    )
+
+
+class TaskBulkDelete(BaseModel):
+    ids: list[str] = Field(..., min_length=1, max_length=Config.TASK_BULK_MAX_ITEMS)
+
+
+class TaskBulkItemResult(BaseModel):
+    # None for tasks that failed to be created
+    id: Optional[str] = None
+    # The HTTP status the single-task endpoint would have returned
+    status: int
+    error: Optional[str] = None
+
+
+class TaskBulkResponse(BaseModel):
+    # One result per requested item, in request order
+    results: list[TaskBulkItemResult]
@@ -1,13 +1,58 @@
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Iterable, Optional, Dict
 import json
-import bcrypt
-from jose import JWTError, jwt
+import secrets
+from jose import JWTError
+from pymongo.errors import DuplicateKeyError
 from redis import StrictRedis
 from ..models.user import User
 from ..repositories.user import UserRepository
 from ..config import Config
 from src.services.email import EmailService
+from src.services.token_cache import TokenCache
+from src.services.password_hasher import PasswordHasher, PasswordHasherBusyError
+from src.services.key_ring import KeyRing
+from src.services.login_throttle import LoginThrottle
+
+
+# Atomically redeems a refresh token: the old key and the access token issued
+# with it are deleted and the new pair stored with the same session payload,
+# or nothing happens if it is gone. Compact refresh sessions carry the key of
+# their paired access token as a fourth element, so the user's session index
+# only ever holds the live pair. Legacy object sessions are stored compact.
+# KEYS: old refresh key, new access key, new refresh key, user session index
+# ARGV: access token TTL, refresh token TTL
+# Returns the session and the revoked access key ('' if unknown)
+ROTATE_REFRESH_TOKEN_SCRIPT = """
+local stored = redis.call('GET', KEYS[1])
+if not stored then
+    return false
+end
+local data = cjson.decode(stored)
+local access_key = ''
+local user_id, email, username
+if data.user_id then
+    user_id, email, username = data.user_id, data.email, data.username
+else
+    user_id, email, username, access_key = data[1], data[2], data[3], data[4] or ''
+end
+local session = cjson.encode({
+    user_id, email or cjson.null, username or cjson.null
+})
+local stale = {KEYS[1]}
+if access_key ~= '' then
+    table.insert(stale, access_key)
+end
+redis.call('DEL', unpack(stale))
+redis.call('SREM', KEYS[4], unpack(stale))
+redis.call('SETEX', KEYS[2], ARGV[1], session)
+redis.call('SETEX', KEYS[3], ARGV[2], cjson.encode({
+    user_id, email or cjson.null, username or cjson.null, KEYS[2]
+}))
+redis.call('SADD', KEYS[4], KEYS[2], KEYS[3])
+redis.call('EXPIRE', KEYS[4], ARGV[2])
+return {session, access_key}
+"""
 
 
 class AuthService:
@@ -16,22 +61,49 @@ class AuthService:
         user_repository: UserRepository,
         redis_client: StrictRedis,
         email_service: EmailService,
+        token_cache: Optional[TokenCache] = None,
+        password_hasher: Optional[PasswordHasher] = None,
+        key_ring: Optional[KeyRing] = None,
+        login_throttle: Optional[LoginThrottle] = None,
+        cache_prewarmer=None,
     ):
         self.user_repository = user_repository
         self.redis_client = redis_client
+        # Sessions are stored under the token's jti claim; the full-token
+        # prefixes are only read for sessions issued before jti existed
+        self.access_key_prefix = "at:"
+        self.refresh_key_prefix = "rt:"
         self.token_prefix = "token:"
         self.refresh_token_prefix = "refresh:"
+        self.user_sessions_prefix = "user_sessions:"
         self.email_service = email_service
         self.reset_prefix = "reset:"
+        self.token_cache = token_cache if Config.TOKEN_CACHE_ENABLED else None
+        self.password_hasher = password_hasher or PasswordHasher()
+        self.key_ring = key_ring or KeyRing()
+        self.login_throttle = login_throttle if Config.LOGIN_THROTTLE_ENABLED else None
+        # Warms the user's task list in the background after a login
+        self.cache_prewarmer = cache_prewarmer
+        self._rotate_refresh_token = redis_client.register_script(
+            ROTATE_REFRESH_TOKEN_SCRIPT
+        )
 
     def _hash_password(self, password: str) -> str:
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+        return self.password_hasher.hash(password)
 
     def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(
-            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
-        )
+        return self.password_hasher.verify(plain_password, hashed_password)
+
+    def _rehash_if_needed(self, user: User, password: str) -> None:
+        """Upgrade the stored hash when the configured bcrypt cost has changed"""
+        if not self.password_hasher.needs_rehash(user.password):
+            return
+        try:
+            user.password = self._hash_password(password)
+        except PasswordHasherBusyError:
+            # The login itself succeeded; retry the upgrade on a later login
+            return
+        self.user_repository.update(user.id, user)
 
     def register(self, username: str, email: str, password: str) -> User:
         # Check if user already exists
@@ -40,145 +112,319 @@ class AuthService:
 
         hashed_password = self._hash_password(password)
         user = User(username=username, email=email, password=hashed_password)
-        user.id = self.user_repository.create(user)
+        try:
+            user.id = self.user_repository.create(user)
+        except DuplicateKeyError:
+            # A concurrent registration won the unique email index
+            raise ValueError("Email already registered")
         return user
 
-    def _cleanup_previous_tokens(self, user_id: str) -> None:
-        """Clean up any existing tokens for the user"""
-        # Get all tokens
-        for key in self.redis_client.scan_iter(f"{self.token_prefix}*"):
-            data = self.redis_client.get(key)
-            if data:
-                user_data = json.loads(data.decode("utf-8"))
-                if user_data.get("user_id") == user_id:
-                    self.redis_client.delete(key)
-        
-        # Clean up refresh tokens
-        for key in self.redis_client.scan_iter(f"{self.refresh_token_prefix}*"):
-            data = self.redis_client.get(key)
-            if data:
-                user_data = json.loads(data.decode("utf-8"))
-                if user_data.get("user_id") == user_id:
-                    self.redis_client.delete(key)
-
-    def authenticate(self, email: str, password: str) -> Optional[User]:
+    def _get_user_sessions_key(self, user_id: str) -> str:
+        return f"{self.user_sessions_prefix}{user_id}"
+
+    def _cleanup_previous_tokens(
+        self, user_id: str, session_keys: Iterable[str] = ()
+    ) -> None:
+        """Clean up any existing tokens for the user, plus ``session_keys``"""
+        # The per-user index holds every token key issued to the user, so
+        # cleanup costs two round trips regardless of how many sessions exist.
+        # Sessions issued before the index existed are only in it once
+        # `flask sessions migrate-legacy` has run.
+        sessions_key = self._get_user_sessions_key(user_id)
+        token_keys = {
+            key.decode("utf-8") for key in self.redis_client.smembers(sessions_key)
+        }
+        token_keys.update(session_keys)
+        self.redis_client.delete(sessions_key, *token_keys)
+
+        if self.token_cache:
+            # Evict revoked access tokens from every worker's verified-token cache
+            self.token_cache.revoke(
+                key
+                for key in token_keys
+                if key.startswith((self.access_key_prefix, self.token_prefix))
+            )
+
+    def migrate_legacy_sessions(self, batch_size: int = 500) -> int:
+        """Add every legacy full-JWT session to its user's session index.
+
+        Run once after deploying the index, from the CLI rather than a
+        request: logout and login cleanup only read the index, and no new
+        legacy sessions are issued. Returns how many sessions were indexed.
+        """
+        migrated = 0
+        for prefix in (self.token_prefix, self.refresh_token_prefix):
+            batch = []
+            for key in self.redis_client.scan_iter(
+                match=f"{prefix}*", count=batch_size
+            ):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    migrated += self._index_legacy_sessions(batch)
+                    batch = []
+            if batch:
+                migrated += self._index_legacy_sessions(batch)
+        return migrated
+
+    def _index_legacy_sessions(self, keys: list[bytes]) -> int:
+        refresh_token_ttl = Config.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+        indexed = 0
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key, data in zip(keys, self.redis_client.mget(keys)):
+            if not data:
+                # Expired since the scan
+                continue
+            try:
+                user_id = self._decode_session(data)["user_id"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            sessions_key = self._get_user_sessions_key(user_id)
+            pipe.sadd(sessions_key, key)
+            pipe.expire(sessions_key, refresh_token_ttl)
+            indexed += 1
+        pipe.execute()
+        return indexed
+
+    def authenticate(
+        self, email: str, password: str, client_ip: Optional[str] = None
+    ) -> Optional[User]:
+        # Refuse throttled clients before spending any bcrypt CPU
+        had_failures = False
+        if self.login_throttle:
+            had_failures = self.login_throttle.check(email, client_ip)
+
         user = self.user_repository.find_by_email(email)
-        if not user:
-            return None
-        if not self._verify_password(password, user.password):
+        if not user or not self._verify_password(password, user.password):
+            if self.login_throttle:
+                self.login_throttle.record_failure(email, client_ip)
             return None
 
+        if had_failures:
+            self.login_throttle.reset(email)
+        self._rehash_if_needed(user, password)
+        if self.cache_prewarmer:
+            self.cache_prewarmer.prewarm_user(user.id)
+
         # Clean up any existing tokens before creating a new one
         self._cleanup_previous_tokens(user.id)
         return user
 
-    def create_tokens(self, user: User) -> Dict[str, any]:
-        # Create access token
-        access_token_expiry = datetime.utcnow() + timedelta(minutes=Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token_claims = {
-            "sub": user.id,
-            "email": user.email,
-            "exp": access_token_expiry,
-            "type": "access"
+    def _encode_token(
+        self, user_id: str, email: str, token_type: str, expiry: datetime
+    ) -> tuple[str, str]:
+        jti = secrets.token_urlsafe(12)
+        claims = {
+            "sub": user_id,
+            "email": email,
+            "exp": expiry,
+            "type": token_type,
+            "jti": jti,
         }
-        access_token = jwt.encode(
-            access_token_claims, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM
+        return self.key_ring.encode(claims), jti
+
+    def _encode_tokens(self, user_id: str, email: str) -> tuple[str, str, str, str]:
+        """Create an access/refresh pair and the Redis keys of their sessions"""
+        # Create access token
+        access_token, access_jti = self._encode_token(
+            user_id,
+            email,
+            "access",
+            datetime.utcnow()
+            + timedelta(minutes=Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES),
         )
 
         # Create refresh token with longer expiration
-        refresh_token_expiry = datetime.utcnow() + timedelta(days=Config.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
-        refresh_token_claims = {
-            "sub": user.id,
-            "email": user.email,
-            "exp": refresh_token_expiry,
-            "type": "refresh"
-        }
-        refresh_token = jwt.encode(
-            refresh_token_claims, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM
+        refresh_token, refresh_jti = self._encode_token(
+            user_id,
+            email,
+            "refresh",
+            datetime.utcnow() + timedelta(days=Config.JWT_REFRESH_TOKEN_EXPIRE_DAYS),
         )
-
-        # Store token data
-        user_data = {"user_id": user.id, "email": user.email, "username": user.username}
-        
-        # Store access token
-        access_token_key = f"{self.token_prefix}{access_token}"
-        self.redis_client.setex(
-            access_token_key,
-            Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-            json.dumps(user_data)
-        )
-
-        # Store refresh token
-        refresh_token_key = f"{self.refresh_token_prefix}{refresh_token}"
-        self.redis_client.setex(
-            refresh_token_key,
-            Config.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,  # Convert days to seconds
-            json.dumps(user_data)
+        return (
+            access_token,
+            f"{self.access_key_prefix}{access_jti}",
+            refresh_token,
+            f"{self.refresh_key_prefix}{refresh_jti}",
         )
 
+    def _session_key(self, token: str, payload: Dict[str, any]) -> Optional[str]:
+        """Return the Redis key holding the session of a verified token"""
+        if payload.get("type") == "refresh":
+            compact_prefix, legacy_prefix = (
+                self.refresh_key_prefix,
+                self.refresh_token_prefix,
+            )
+        else:
+            compact_prefix, legacy_prefix = self.access_key_prefix, self.token_prefix
+
+        if payload.get("jti"):
+            return f"{compact_prefix}{payload['jti']}"
+        # Tokens issued before jti was introduced are keyed by the full JWT
+        if Config.SESSION_LEGACY_KEYS_ENABLED:
+            return f"{legacy_prefix}{token}"
+        return None
+
+    def _encode_session(
+        self, user: User, access_token_key: Optional[str] = None
+    ) -> str:
+        session = [user.id, user.email, user.username]
+        if access_token_key:
+            # Refresh sessions name their paired access token for rotation
+            session.append(access_token_key)
+        return json.dumps(session, separators=(",", ":"))
+
+    def _decode_session(self, data: bytes) -> Dict[str, str]:
+        session = json.loads(data)
+        # Legacy sessions store a JSON object instead of a positional array
+        if isinstance(session, list):
+            user_id, email, username = session[:3]
+            return {"user_id": user_id, "email": email, "username": username}
+        return session
+
+    def _token_response(self, access_token: str, refresh_token: str) -> Dict[str, any]:
         return {
             "access_token": access_token,
             "refresh_token": refresh_token,
             "expires_in": Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
         }
 
+    def create_tokens(self, user: User) -> Dict[str, any]:
+        access_token, access_token_key, refresh_token, refresh_token_key = (
+            self._encode_tokens(user.id, user.email)
+        )
+
+        # Store token data
+        session = self._encode_session(user)
+        refresh_token_ttl = Config.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+        sessions_key = self._get_user_sessions_key(user.id)
+
+        # Store both tokens and register them in the user's session index in
+        # one MULTI/EXEC round trip
+        pipe = self.redis_client.pipeline()
+        pipe.setex(
+            access_token_key, Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60, session
+        )
+        pipe.setex(
+            refresh_token_key,
+            refresh_token_ttl,
+            self._encode_session(user, access_token_key),
+        )
+        pipe.sadd(sessions_key, access_token_key, refresh_token_key)
+        # The index lives as long as the longest-lived token it references
+        pipe.expire(sessions_key, refresh_token_ttl)
+        pipe.execute()
+
+        return self._token_response(access_token, refresh_token)
+
     def refresh_access_token(self, refresh_token: str) -> Optional[Dict[str, any]]:
+        """Exchange a refresh token for a new token pair.
+
+        The old refresh token is checked, revoked and replaced by a single
+        server-side script, so a token can only be redeemed once even when
+        the same client retries concurrently. The returned dict carries the
+        session user under ``user``.
+        """
         try:
             # Verify refresh token
-            payload = jwt.decode(
-                refresh_token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
-            )
-            
+            payload = self.key_ring.decode(refresh_token)
+
             if payload.get("type") != "refresh":
                 return None
 
-            # Check if refresh token is in Redis
-            refresh_token_key = f"{self.refresh_token_prefix}{refresh_token}"
-            cached_data = self.redis_client.get(refresh_token_key)
-            
-            if not cached_data:
+            refresh_token_key = self._session_key(refresh_token, payload)
+            if not refresh_token_key:
                 return None
 
-            user_data = json.loads(cached_data)
-            user = self.user_repository.find_by_id(payload["sub"])
-            
-            if not user:
+            access_token, access_token_key, new_refresh_token, new_refresh_token_key = (
+                self._encode_tokens(payload["sub"], payload.get("email"))
+            )
+            rotated = self._rotate_refresh_token(
+                keys=[
+                    refresh_token_key,
+                    access_token_key,
+                    new_refresh_token_key,
+                    self._get_user_sessions_key(payload["sub"]),
+                ],
+                args=[
+                    Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                    Config.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+                ],
+            )
+
+            # Unknown, already rotated or revoked refresh token
+            if not rotated:
                 return None
 
-            # Create new tokens
-            return self.create_tokens(user)
+            session, revoked_access_key = rotated
+            if revoked_access_key and self.token_cache:
+                self.token_cache.revoke([revoked_access_key.decode("utf-8")])
+
+            return {
+                **self._token_response(access_token, new_refresh_token),
+                "user": self._user_from_session(self._decode_session(session)),
+            }
 
         except JWTError:
             return None
 
+    def _user_from_session(self, user_data: Dict[str, str]) -> User:
+        """Build the request user from the session payload written by create_tokens.
+
+        The password hash is not part of the session, so callers that need
+        the full record must load it from the repository.
+        """
+        return User(
+            id=user_data["user_id"],
+            username=user_data.get("username"),
+            email=user_data.get("email"),
+            password=None,
+        )
+
     def validate_token(self, token: str) -> Optional[User]:
-        try:
-            # First check if token is in Redis
-            cached_user = self.redis_client.get(f"{self.token_prefix}{token}")
-            if not cached_user:
-                return None
+        if self.token_cache:
+            user = self.token_cache.get(token)
+            if user:
+                return user
 
+        try:
             # Verify JWT
-            payload = jwt.decode(
-                token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
-            )
-            
+            payload = self.key_ring.decode(token)
+
             if payload.get("type") != "access":
                 return None
 
-            user_data = json.loads(cached_user)
-            return self.user_repository.find_by_id(user_data["user_id"])
+            # Check the session is still live in Redis
+            session_key = self._session_key(token, payload)
+            cached_user = self.redis_client.get(session_key) if session_key else None
+            if not cached_user:
+                return None
+
+            user_data = self._decode_session(cached_user)
+            if Config.AUTH_IDENTITY_MODE == "claims":
+                user = self._user_from_session(user_data)
+            else:
+                user = self.user_repository.find_by_id(user_data["user_id"])
+            if user and self.token_cache:
+                self.token_cache.set(token, user, payload["exp"], session_key)
+            return user
 
         except JWTError:
             return None
 
+    def logout_all(self, user_id: str) -> None:
+        """Revoke every access and refresh token issued to the user"""
+        self._cleanup_previous_tokens(user_id)
+
     def logout(self, token: str) -> bool:
         try:
-            payload = jwt.decode(
-                token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
-            )
+            payload = self.key_ring.decode(token)
+            # The presented token's own session is always revoked, even if it
+            # is missing from the user's index
+            session_key = self._session_key(token, payload)
             # Delete both access and refresh tokens for the user
-            self._cleanup_previous_tokens(payload["sub"])
+            self._cleanup_previous_tokens(
+                payload["sub"], [session_key] if session_key else []
+            )
             return True
         except JWTError:
             token_key = f"{self.token_prefix}{token}"
@@ -190,14 +436,12 @@ class AuthService:
             return False
 
         # Generate reset token
-        reset_token = jwt.encode(
+        reset_token = self.key_ring.encode(
             {
                 "sub": user.id,
                 "exp": datetime.utcnow()
                 + timedelta(minutes=Config.PASSWORD_RESET_EXPIRE_MINUTES),
-            },
-            Config.JWT_SECRET_KEY,
-            algorithm=Config.JWT_ALGORITHM,
+            }
         )
 
         # Store token in Redis
@@ -223,9 +467,7 @@ class AuthService:
             return False
 
         try:
-            payload = jwt.decode(
-                token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
-            )
+            payload = self.key_ring.decode(token)
             user = self.user_repository.find_by_id(payload["sub"])
             if not user:
                 return False
@@ -0,0 +1,41 @@
+import threading
+import time
+from redis import StrictRedis
+from ..config import Config
+
+
+class CacheGeneration:
+    """Global generation counter for a family of cache keys.
+
+    The current value is part of every key name, so bumping it moves all
+    readers and writers to a fresh keyspace in O(1) and the old keys age
+    out through their TTL. Each worker re-reads the counter at most every
+    ``refresh_seconds``, so a bump takes that long to reach every worker.
+    """
+
+    def __init__(self, redis_client: StrictRedis, key: str):
+        self.redis_client = redis_client
+        self.key = key
+        self.refresh_seconds = Config.TASK_CACHE_GENERATION_REFRESH_SECONDS
+        self._lock = threading.Lock()
+        self._value = 0
+        self._refreshed_at = None
+
+    def get(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._refreshed_at is None
+                or now - self._refreshed_at >= self.refresh_seconds
+            ):
+                self._value = int(self.redis_client.get(self.key) or 0)
+                self._refreshed_at = now
+            return self._value
+
+    def bump(self) -> int:
+        """Move to a new generation; returns the new value"""
+        value = self.redis_client.incr(self.key)
+        with self._lock:
+            self._value = value
+            self._refreshed_at = time.monotonic()
+        return value
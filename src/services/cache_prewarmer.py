@@ -0,0 +1,135 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from ..config import Config
+from ..repositories.task import TaskRepository
+from ..utils.logger import setup_logger
+from .cached_task import CachedTaskService
+
+logger = setup_logger("cache_prewarmer")
+
+
+class CachePrewarmer:
+    """Loads task lists into the cache ahead of the user's first GET /tasks.
+
+    Logins queue a background warm of that user's list, and
+    ``prewarm_recent_users`` bulk-loads the most recently active users after
+    a deploy or a Redis flush. Both are rate-limited and best-effort: work
+    over the limits is skipped rather than competing with live traffic.
+    """
+
+    def __init__(
+        self,
+        task_service_factory: Callable[[], CachedTaskService],
+        task_repository: TaskRepository,
+    ):
+        self.task_service_factory = task_service_factory
+        self.task_repository = task_repository
+        self.enabled = Config.CACHE_PREWARM_ON_LOGIN
+        self.max_per_second = Config.CACHE_PREWARM_MAX_PER_SECOND
+        self.max_pending = Config.CACHE_PREWARM_MAX_PENDING
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cache-prewarm"
+        )
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._tokens = float(self.max_per_second)
+        self._refilled_at = time.monotonic()
+        self.queued = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def _take_token(self) -> bool:
+        """Token bucket refilled at max_per_second; call with the lock held"""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.max_per_second),
+            self._tokens + (now - self._refilled_at) * self.max_per_second,
+        )
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def prewarm_user(self, user_id: str) -> bool:
+        """Queue a background load of the user's task list; False if skipped"""
+        if not self.enabled:
+            return False
+        with self._lock:
+            if (
+                user_id in self._pending
+                or len(self._pending) >= self.max_pending
+                or not self._take_token()
+            ):
+                self.skipped += 1
+                return False
+            self._pending.add(user_id)
+            self.queued += 1
+        self._executor.submit(self._warm_user, user_id)
+        return True
+
+    def _warm_user(self, user_id: str) -> None:
+        try:
+            # A cached list is a single HGETALL; a missing one is rebuilt once
+            self.task_service_factory().get_user_tasks(user_id)
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            logger.error(f"Error prewarming tasks for user {user_id}: {str(e)}")
+        finally:
+            with self._lock:
+                self._pending.discard(user_id)
+
+    def prewarm_recent_users(
+        self, limit: int, batch_size: int, users_per_second: float
+    ) -> dict:
+        """Bulk-load the lists of the ``limit`` most recently active users.
+
+        Users are loaded ``batch_size`` at a time with one MongoDB cursor and
+        one Redis pipeline per batch, paced to ``users_per_second``.
+        """
+        started = time.monotonic()
+        task_service = self.task_service_factory()
+        user_ids = self.task_repository.find_recent_user_ids(limit)
+        warmed = 0
+        for offset in range(0, len(user_ids), batch_size):
+            batch_started = time.monotonic()
+            batch = user_ids[offset : offset + batch_size]
+            # Only users with nothing servable cached are loaded from MongoDB
+            generations = task_service.find_uncached_users(batch)
+            if generations:
+                tasks_by_user = {user_id: [] for user_id in generations}
+                for task in self.task_repository.iter_by_user_ids(
+                    list(generations), batch_size
+                ):
+                    tasks_by_user[task.user_id].append(task)
+                for tasks in tasks_by_user.values():
+                    # ObjectIds sort by creation time, matching the MongoDB order
+                    tasks.sort(key=lambda task: task.id)
+                warmed += task_service.prime_user_tasks(tasks_by_user, generations)
+
+            if users_per_second > 0:
+                remaining = len(batch) / users_per_second - (
+                    time.monotonic() - batch_started
+                )
+                if remaining > 0:
+                    time.sleep(remaining)
+
+        return {
+            "users": len(user_ids),
+            "warmed": warmed,
+            "already_cached": len(user_ids) - warmed,
+            "seconds": round(time.monotonic() - started, 3),
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "queued": self.queued,
+                "skipped": self.skipped,
+                "failed": self.failed,
+                "pending": len(self._pending),
+            }
@@ -1,51 +1,422 @@
+import hashlib
 import json
+import math
+import random
+import secrets
+import time
+from typing import Callable, Optional
 from redis import StrictRedis
+from ..config import Config
 from ..models.task import Task
+from ..utils.cache_codec import CacheCodecError, TaskCodec, decode_task, get_task_codec
+from ..utils.logger import setup_logger
+from ..utils.pagination import decode_cursor
+from ..utils.stats import CacheMetrics
+from .cache_generation import CacheGeneration
 from .task import TaskService
+from .task_cache import TaskCache
+
+
+logger = setup_logger("cached_task_service")
+
+
+# Finishes a write: sets or removes the task's field in the user's task hash,
+# unless another writer for the same user overlapped this one, in which case
+# the hash is dropped so the next read reloads from MongoDB. An upsert also
+# clears any "missing task" marker for the task. Any change drops the
+# pre-rendered list response and stamps the hash with a new version.
+# Every completed write bumps the user's generation, so hashes in other
+# namespaces and rebuilds that loaded MongoDB before the write stop being
+# served; only the hash patched here carries the new generation forward.
+# KEYS: user task hash, in-flight writer count, contention flag, missing
+#       marker, user generation
+# ARGV: "upsert" | "remove" | "abort", task id, encoded task, ttl, new
+#       version, generation ttl
+APPLY_TASK_WRITE_SCRIPT = """
+local generation = redis.call('GET', KEYS[5]) or '0'
+local next_generation = generation
+if ARGV[1] ~= 'abort' then
+    next_generation = tostring(redis.call('INCR', KEYS[5]))
+    redis.call('EXPIRE', KEYS[5], ARGV[6])
+end
+
+local writers = redis.call('DECR', KEYS[2])
+if writers > 0 then
+    redis.call('SET', KEYS[3], 1, 'EX', ARGV[4])
+    redis.call('DEL', KEYS[1])
+    return 0
+end
+redis.call('DEL', KEYS[2])
+if redis.call('DEL', KEYS[3]) == 1 then
+    redis.call('DEL', KEYS[1])
+    return 0
+end
+if redis.call('EXISTS', KEYS[1]) == 1
+        and redis.call('HGET', KEYS[1], '__generation__') ~= generation then
+    -- Invalidated before this write; the next read rebuilds it
+    redis.call('DEL', KEYS[1])
+end
+
+if ARGV[1] == 'remove' then
+    redis.call('HDEL', KEYS[1], ARGV[2])
+elseif ARGV[1] == 'upsert' then
+    redis.call('DEL', KEYS[4])
+    redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+    redis.call('EXPIRE', KEYS[1], ARGV[4], 'NX')
+end
+if ARGV[1] ~= 'abort' and redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HDEL', KEYS[1], '__response__')
+    redis.call('HSET', KEYS[1], '__version__', ARGV[5],
+               '__generation__', next_generation)
+end
+return 1
+"""
+
+# Caches a task read from MongoDB by get_task. Nothing is written when a
+# write for the user completed after the generation was read, since the
+# loaded copy may predate it, or when the hash already holds the complete
+# list at that generation. A hash left from an older generation is replaced.
+# KEYS: user task hash, user generation
+# ARGV: generation read before the load, task id, encoded task, ttl
+FILL_TASK_SCRIPT = """
+local generation = redis.call('GET', KEYS[2]) or '0'
+if generation ~= ARGV[1] then
+    return 0
+end
+local cached_generation = redis.call('HGET', KEYS[1], '__generation__')
+if cached_generation == generation then
+    if redis.call('HEXISTS', KEYS[1], '__complete__') == 1 then
+        return 0
+    end
+elseif redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('DEL', KEYS[1])
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3], '__generation__', generation)
+-- A partial hash must still expire; a complete one keeps its TTL
+redis.call('EXPIRE', KEYS[1], ARGV[4], 'NX')
+return 1
+"""
+
+# Stores a rendered list response, unless the hash changed since the
+# snapshot it was rendered from
+# KEYS: user task hash
+# ARGV: snapshot version, ETag followed by the response body
+STORE_RESPONSE_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], '__complete__') == 0 then
+    return 0
+end
+if (redis.call('HGET', KEYS[1], '__version__') or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], '__response__', ARGV[2])
+return 1
+"""
+
+# Releases a rebuild lock only if it is still held by the caller
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
 
 
 class CachedTaskService:
-    def __init__(self, task_service: TaskService, redis_client: StrictRedis):
+    """Read-through cache over TaskService.
+
+    Each user's tasks live in one Redis hash mapping task id to the encoded
+    task. The hash may hold only the tasks read individually; the
+    ``__complete__`` field marks it as the user's full list. Empty lists and
+    unknown task ids are cached too, for a shorter negative TTL.
+
+    List rebuilds are single-flight: one request per user holds a short
+    lock and reloads from MongoDB while the others wait for its result.
+    ``__complete__`` records how long the rebuild took and when the hash
+    expires, so a hot list can be refreshed early (XFetch) while concurrent
+    readers keep being served the cached copy.
+
+    ``__version__`` changes on every rebuild and write, and
+    ``__response__`` optionally holds the rendered GET /tasks body with
+    its ETag, valid only for the version it was rendered from.
+
+    Keys are namespaced by ``SCHEMA_GENERATION`` and a global generation
+    counter, so a deploy that changes the cached layout, or a bump of the
+    counter, starts from an empty keyspace without a flush. Each user also
+    has a generation counter, bumped by every write and by
+    ``invalidate_user``; a hash is only served while its
+    ``__generation__`` matches it. The counter is read in the same
+    pipeline as the hash, so this costs no extra round trip. Tasks in the
+    per-worker L1 are keyed by that generation too, and every invalidation
+    drops the workers' copy of the counter, which orphans them all at once.
+
+    Pages of GET /tasks?limit=... are cached as their own short-lived
+    hashes, tagged with the same user generation, so the write that
+    patches the full list in place invalidates every page at once.
+    """
+
+    COMPLETE_FIELD = "__complete__"
+    VERSION_FIELD = "__version__"
+    RESPONSE_FIELD = "__response__"
+    GENERATION_FIELD = "__generation__"
+    NEXT_FIELD = "__next__"
+    ETAG_LENGTH = 16
+    # Bump when the cached layout changes in a way older workers cannot read
+    SCHEMA_GENERATION = 1
+
+    def __init__(
+        self,
+        task_service: TaskService,
+        redis_client: StrictRedis,
+        task_cache: Optional[TaskCache] = None,
+        codec: Optional[TaskCodec] = None,
+        metrics: Optional[CacheMetrics] = None,
+        generation: Optional[CacheGeneration] = None,
+    ):
         self.task_service = task_service
         self.redis_client = redis_client
-        self.cache_prefix = "task:"
-        self.user_tasks_prefix = "user_tasks:"
+        # Optional per-worker L1 in front of Redis
+        self.task_cache = task_cache
+        # Optional per-family hit, size and Redis latency counters
+        self.metrics = metrics
+        self.codec = codec or get_task_codec(
+            Config.TASK_CACHE_CODEC, Config.TASK_CACHE_COMPRESS_THRESHOLD
+        )
+        # Optional shared global generation; without it the namespace only
+        # changes with SCHEMA_GENERATION
+        self.namespace = (
+            f"{self.SCHEMA_GENERATION}.{generation.get() if generation else 0}"
+        )
+        self.cache_prefix = f"task:{self.namespace}:"
+        self.user_tasks_prefix = f"tasks:{self.namespace}:"
+        self.writers_prefix = "user_tasks_writers:"
+        self.contended_prefix = "user_tasks_contended:"
+        self.missing_task_prefix = f"missing_task:{self.namespace}:"
+        self.rebuild_lock_prefix = "tasks_rebuild:"
+        self.page_prefix = f"tasks_page:{self.namespace}:"
+        self.user_generation_prefix = "task_cache_generation:"
         self.cache_ttl = 3600  # 1 hour
+        # Outlives every hash written under an older value, so an expired
+        # counter restarting from zero cannot revive one
+        self.generation_ttl = self.cache_ttl * 2
+        self.negative_cache_ttl = Config.TASK_CACHE_NEGATIVE_TTL_SECONDS
+        self.page_cache_ttl = Config.TASK_PAGE_CACHE_TTL_SECONDS
+        self.ttl_jitter = Config.TASK_CACHE_TTL_JITTER
+        self.early_refresh_beta = Config.TASK_CACHE_EARLY_REFRESH_BETA
+        self.rebuild_lock_ms = Config.TASK_CACHE_REBUILD_LOCK_MS
+        self.rebuild_wait_ms = Config.TASK_CACHE_REBUILD_WAIT_MS
+        self.rebuild_poll_ms = 25
+        # Upper bound on a single write, so a crashed writer cannot leave the
+        # user's tasks uncacheable for long
+        self.write_lease_seconds = 30
+        self._apply_task_write = redis_client.register_script(APPLY_TASK_WRITE_SCRIPT)
+        self._release_lock = redis_client.register_script(RELEASE_LOCK_SCRIPT)
+        self._store_response = redis_client.register_script(STORE_RESPONSE_SCRIPT)
+        self._fill_task = redis_client.register_script(FILL_TASK_SCRIPT)
 
-    def _get_task_key(self, task_id: str) -> str:
-        return f"{self.cache_prefix}{task_id}"
+    def _get_task_key(self, task_id: str, user_id: str, generation: bytes) -> str:
+        # Only used for the in-process cache; Redis keeps tasks in the user hash.
+        # Tagged with the user generation, so dropping the worker's copy of the
+        # generation orphans every task it cached for the user.
+        return f"{self.cache_prefix}{user_id}:{generation.decode()}:{task_id}"
 
     def _get_user_tasks_key(self, user_id: str) -> str:
         return f"{self.user_tasks_prefix}{user_id}"
 
-    def _cache_task(self, task: Task) -> None:
+    def _get_generation_key(self, user_id: str) -> str:
+        # Not namespaced: a write must invalidate the user's hashes everywhere
+        return f"{self.user_generation_prefix}{user_id}"
+
+    def _get_page_key(self, user_id: str, after_id: Optional[str], limit: int) -> str:
+        return f"{self.page_prefix}{user_id}:{after_id or ''}:{limit}"
+
+    def _get_missing_task_key(self, task_id: str) -> str:
+        return f"{self.missing_task_prefix}{task_id}"
+
+    def _get_response_key(self, user_id: str) -> str:
+        # Only used for the in-process cache; Redis keeps it in the user hash
+        return f"{self._get_user_tasks_key(user_id)}:response"
+
+    def _encode_task(self, task: Task) -> bytes:
+        return self.codec.encode(task)
+
+    def _get_local(self, key: str):
+        if self.task_cache:
+            return self.task_cache.get(key)
+        return None
+
+    def _set_local(self, key: str, value, size: int) -> None:
+        if self.task_cache:
+            self.task_cache.set(key, value, size)
+
+    def _record_l2(self, hit: bool) -> None:
+        if self.task_cache:
+            self.task_cache.record_l2(hit)
+
+    def _record_rebuild(self, event: str) -> None:
+        if self.task_cache:
+            self.task_cache.record_rebuild(event)
+
+    def _observe(
+        self,
+        family: str,
+        operation: str,
+        started: float,
+        hit: Optional[bool] = None,
+        size: int = 0,
+    ) -> None:
+        if self.metrics:
+            self.metrics.record(
+                family, operation, time.perf_counter() - started, hit=hit, size=size
+            )
+            self.metrics.log_snapshot(logger)
+
+    def _jittered_ttl(self, ttl: int) -> int:
+        """Spread expiries so lists cached together do not expire together"""
+        return max(
+            1, round(ttl * (1 + random.uniform(-self.ttl_jitter, self.ttl_jitter)))
+        )
+
+    def _cache_task(self, task: Task, generation: bytes) -> None:
+        """Cache a task loaded from MongoDB after reading ``generation``"""
         if task and task.id:
-            self.redis_client.setex(
-                self._get_task_key(task.id),
-                self.cache_ttl,
-                json.dumps({"id": task.id, **task.to_dict()}),
+            payload = self._encode_task(task)
+            started = time.perf_counter()
+            filled = self._fill_task(
+                keys=[
+                    self._get_user_tasks_key(task.user_id),
+                    self._get_generation_key(task.user_id),
+                ],
+                args=[generation, task.id, payload, self.cache_ttl],
             )
+            self._observe("task", "set", started, size=len(payload))
+            if filled:
+                self._set_local(
+                    self._get_task_key(task.id, task.user_id, generation),
+                    task,
+                    len(payload),
+                )
+
+    def _write_through(
+        self, user_id: str, write: Callable[[], tuple[str, Optional[Task]]]
+    ) -> tuple[str, Optional[Task]]:
+        """Run a MongoDB write and apply its result to the cached entries.
+
+        ``write`` returns the task id and the task as stored, or None when
+        it was deleted. Writers are counted for the duration of the MongoDB
+        call so overlapping writes fall back to invalidation.
+        """
+        writers_key = f"{self.writers_prefix}{user_id}"
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.incr(writers_key)
+        pipe.expire(writers_key, self.write_lease_seconds)
+        pipe.execute()
+
+        try:
+            task_id, task = write()
+        except Exception:
+            self._finish_write(user_id, "abort", "")
+            raise
+
+        if task is None:
+            self._finish_write(user_id, "remove", task_id)
+        else:
+            self._finish_write(user_id, "upsert", task_id, self._encode_task(task))
+        return task_id, task
 
-    def _invalidate_user_tasks_cache(self, user_id: str) -> None:
-        self.redis_client.delete(self._get_user_tasks_key(user_id))
+    def _finish_write(
+        self, user_id: str, operation: str, task_id: str, payload: str = ""
+    ) -> None:
+        user_tasks_key = self._get_user_tasks_key(user_id)
+        started = time.perf_counter()
+        applied = self._apply_task_write(
+            keys=[
+                user_tasks_key,
+                f"{self.writers_prefix}{user_id}",
+                f"{self.contended_prefix}{user_id}",
+                self._get_missing_task_key(task_id),
+                self._get_generation_key(user_id),
+            ],
+            args=[
+                operation,
+                task_id,
+                payload,
+                self.cache_ttl,
+                secrets.token_hex(6),
+                self.generation_ttl,
+            ],
+        )
+        self._observe("task", operation, started, size=len(payload))
+        if self.metrics and not applied:
+            # Overlapping writers dropped the user's hash
+            self.metrics.record_invalidation("user_tasks")
+        if operation != "abort":
+            self._invalidate_local(user_id)
+
+    def _invalidate_local(self, user_id: str) -> None:
+        """Drop every worker's in-process copies of the user's entries"""
+        if self.task_cache:
+            self.task_cache.invalidate(
+                (
+                    self._get_generation_key(user_id),
+                    self._get_user_tasks_key(user_id),
+                    self._get_response_key(user_id),
+                )
+            )
 
     def create_task(self, title: str, description: str, user_id: str) -> str:
-        task_id = self.task_service.create_task(title, description, user_id)
-        self._invalidate_user_tasks_cache(user_id)
+        def write():
+            task_id = self.task_service.create_task(title, description, user_id)
+            return task_id, Task(
+                id=task_id, title=title, description=description, user_id=user_id
+            )
+
+        task_id, _ = self._write_through(user_id, write)
         return task_id
 
     def get_task(self, task_id: str, user_id: str) -> Task:
-        # Try to get from cache first
-        cached_task = self.redis_client.get(self._get_task_key(task_id))
-        if cached_task:
-            task_data = json.loads(cached_task)
-            task = Task(
-                id=task_data.get("id"),
-                title=task_data.get("title"),
-                description=task_data.get("description"),
-                user_id=task_data.get("user_id"),
-                completed=task_data.get("completed", False),
+        generation = self._get_local(self._get_generation_key(user_id))
+        task = None
+        if generation is not None:
+            task = self._get_local(self._get_task_key(task_id, user_id, generation))
+        if task is None:
+            # Try Redis next; another user's task is never in this user's hash
+            started = time.perf_counter()
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hmget(
+                self._get_user_tasks_key(user_id), [task_id, self.GENERATION_FIELD]
+            )
+            pipe.get(self._get_generation_key(user_id))
+            pipe.exists(self._get_missing_task_key(task_id))
+            (cached_task, cached_generation), generation, missing = pipe.execute()
+            generation = generation or b"0"
+            self._set_local(
+                self._get_generation_key(user_id), generation, len(generation)
+            )
+            if cached_generation != generation:
+                cached_task = None
+            self._observe(
+                "missing_task" if missing else "task",
+                "get",
+                started,
+                hit=bool(cached_task or missing),
+                size=len(cached_task or b""),
             )
+            self._record_l2(bool(cached_task or missing))
+            if missing:
+                return None
+            if cached_task:
+                try:
+                    task = decode_task(cached_task)
+                    self._set_local(
+                        self._get_task_key(task_id, user_id, generation),
+                        task,
+                        len(cached_task),
+                    )
+                except CacheCodecError:
+                    # Written by an incompatible version; reload it below
+                    task = None
+
+        if task is not None:
             # Verify task belongs to user
             if task.user_id != user_id:
                 raise ValueError("Unauthorized access to task")
@@ -54,52 +425,427 @@ class CachedTaskService:
         # If not in cache, get from service and cache it
         task = self.task_service.get_task(task_id, user_id)
         if task:
-            self._cache_task(task)
+            self._cache_task(task, generation)
+        else:
+            started = time.perf_counter()
+            self.redis_client.setex(
+                self._get_missing_task_key(task_id), self.negative_cache_ttl, 1
+            )
+            self._observe("missing_task", "set", started)
         return task
 
     def update_task(
         self, task_id: str, title: str | None, description: str | None, user_id: str
-    ) -> None:
-        self.task_service.update_task(task_id, title, description, user_id)
-        # Invalidate caches
-        self.redis_client.delete(self._get_task_key(task_id))
-        self._invalidate_user_tasks_cache(user_id)
+    ) -> Task:
+        _, task = self._write_through(
+            user_id,
+            lambda: (
+                task_id,
+                self.task_service.update_task(task_id, title, description, user_id),
+            ),
+        )
+        return task
 
-    def update_task_status(self, task_id: str, completed: bool, user_id: str) -> None:
-        self.task_service.update_task_status(task_id, completed, user_id)
-        # Invalidate caches
-        self.redis_client.delete(self._get_task_key(task_id))
-        self._invalidate_user_tasks_cache(user_id)
+    def update_task_status(self, task_id: str, completed: bool, user_id: str) -> Task:
+        _, task = self._write_through(
+            user_id,
+            lambda: (
+                task_id,
+                self.task_service.update_task_status(task_id, completed, user_id),
+            ),
+        )
+        return task
 
     def delete_task(self, task_id: str, user_id: str) -> None:
-        self.task_service.delete_task(task_id, user_id)
-        # Invalidate caches
-        self.redis_client.delete(self._get_task_key(task_id))
-        self._invalidate_user_tasks_cache(user_id)
+        def write():
+            self.task_service.delete_task(task_id, user_id)
+            return task_id, None
 
-    def get_user_tasks(self, user_id: str) -> list[Task]:
-        # Try to get from cache first
-        cached_tasks = self.redis_client.get(self._get_user_tasks_key(user_id))
-        if cached_tasks:
-            tasks_data = json.loads(cached_tasks)
-            return [
-                Task(
-                    id=task_data.get("id"),
-                    title=task_data.get("title"),
-                    description=task_data.get("description"),
-                    user_id=task_data.get("user_id"),
-                    completed=task_data.get("completed", False),
-                )
-                for task_data in tasks_data
-            ]
+        self._write_through(user_id, write)
 
-        # If not in cache, get from service and cache it
-        tasks = self.task_service.get_user_tasks(user_id)
-        if tasks:
-            tasks_data = [{"id": task.id, **task.to_dict()} for task in tasks]
-            self.redis_client.setex(
-                self._get_user_tasks_key(user_id),
-                self.cache_ttl,
-                json.dumps(tasks_data),
+    def _bulk_write_through(
+        self, user_id: str, write: Callable[[], list[dict]]
+    ) -> list[dict]:
+        """Run a bulk MongoDB write, then invalidate the user's cache once.
+
+        Patching the hash item by item would cost a script call per task, so
+        the whole user is invalidated in one pipeline instead: the user
+        generation is bumped, which also retires cached pages and rebuilds
+        that read MongoDB before the write, and the hash is dropped so a
+        single-task write racing this one cannot carry it forward.
+        """
+        try:
+            results = write()
+        except Exception:
+            # An unordered batch may have been partly applied
+            self._invalidate_after_bulk(user_id)
+            raise
+        if any(result["status"] < 300 for result in results):
+            self._invalidate_after_bulk(user_id)
+        return results
+
+    def _invalidate_after_bulk(self, user_id: str) -> None:
+        user_tasks_key = self._get_user_tasks_key(user_id)
+        generation_key = self._get_generation_key(user_id)
+        started = time.perf_counter()
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.incr(generation_key)
+        pipe.expire(generation_key, self.generation_ttl)
+        pipe.delete(user_tasks_key)
+        pipe.execute()
+        self._observe("user_tasks", "invalidate", started)
+        if self.metrics:
+            self.metrics.record_invalidation("user_tasks")
+        self._invalidate_local(user_id)
+
+    def bulk_create_tasks(
+        self, tasks: list[tuple[str, str]], user_id: str
+    ) -> list[dict]:
+        return self._bulk_write_through(
+            user_id, lambda: self.task_service.bulk_create_tasks(tasks, user_id)
+        )
+
+    def bulk_update_tasks(
+        self, updates: list[tuple[str, dict]], user_id: str
+    ) -> list[dict]:
+        return self._bulk_write_through(
+            user_id, lambda: self.task_service.bulk_update_tasks(updates, user_id)
+        )
+
+    def bulk_delete_tasks(self, task_ids: list[str], user_id: str) -> list[dict]:
+        return self._bulk_write_through(
+            user_id, lambda: self.task_service.bulk_delete_tasks(task_ids, user_id)
+        )
+
+    def _read_user_tasks(self, user_id: str) -> tuple[dict, bytes]:
+        """Fetch the user's hash and generation in one round trip.
+
+        A hash written under an older generation is returned as empty.
+        """
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hgetall(self._get_user_tasks_key(user_id))
+        pipe.get(self._get_generation_key(user_id))
+        cached_tasks, generation = pipe.execute()
+        generation = generation or b"0"
+        if cached_tasks.get(self.GENERATION_FIELD.encode()) != generation:
+            cached_tasks = {}
+        return cached_tasks, generation
+
+    def _decode_user_tasks(
+        self, cached_tasks: dict
+    ) -> Optional[tuple[list[Task], int]]:
+        """Decode a complete hash, or return None if any entry is unreadable"""
+        size = 0
+        tasks = []
+        for field, payload in cached_tasks.items():
+            # Skip bookkeeping fields; task ids never start with "__"
+            if field.startswith(b"__"):
+                continue
+            size += len(payload)
+            try:
+                tasks.append(decode_task(payload))
+            except CacheCodecError:
+                return None
+        # ObjectIds sort by creation time, matching the MongoDB order
+        tasks.sort(key=lambda task: task.id)
+        return tasks, size
+
+    def _should_refresh_early(self, complete_marker: bytes) -> bool:
+        """XFetch: refresh with a probability that grows as expiry nears"""
+        if self.early_refresh_beta <= 0:
+            return False
+        try:
+            marker = json.loads(complete_marker)
+            delta, expires_at = marker["delta"], marker["expires_at"]
+        except (ValueError, TypeError, KeyError):
+            return False
+        jitter = -delta * self.early_refresh_beta * math.log(1 - random.random())
+        return time.time() + jitter >= expires_at
+
+    def _acquire_rebuild_lock(self, user_id: str) -> Optional[str]:
+        token = secrets.token_hex(8)
+        acquired = self.redis_client.set(
+            f"{self.rebuild_lock_prefix}{user_id}",
+            token,
+            nx=True,
+            px=self.rebuild_lock_ms,
+        )
+        return token if acquired else None
+
+    def _queue_user_tasks(
+        self, pipe, user_id: str, tasks: list[Task], delta: float, generation: bytes
+    ) -> int:
+        """Add the commands that store a user's complete list to ``pipe``"""
+        user_tasks_key = self._get_user_tasks_key(user_id)
+        # An empty list is a negative entry; creating a task fills it in place
+        ttl = self._jittered_ttl(self.cache_ttl if tasks else self.negative_cache_ttl)
+        mapping = {task.id: self._encode_task(task) for task in tasks}
+        mapping[self.COMPLETE_FIELD] = json.dumps(
+            {"delta": round(delta, 4), "expires_at": time.time() + ttl}
+        )
+        mapping[self.VERSION_FIELD] = secrets.token_hex(6)
+        # The generation read before loading; a write since then bumped it
+        mapping[self.GENERATION_FIELD] = generation
+        # Replace any partial hash so no stale field survives
+        pipe.delete(user_tasks_key)
+        pipe.hset(user_tasks_key, mapping=mapping)
+        pipe.expire(user_tasks_key, ttl)
+        return sum(len(payload) for payload in mapping.values())
+
+    def _rebuild_user_tasks(
+        self, user_id: str, lock_token: str, generation: bytes
+    ) -> list[Task]:
+        try:
+            started = time.monotonic()
+            tasks = self.task_service.get_user_tasks(user_id)
+            delta = time.monotonic() - started
+
+            started = time.perf_counter()
+            pipe = self.redis_client.pipeline()
+            size = self._queue_user_tasks(pipe, user_id, tasks, delta, generation)
+            pipe.execute()
+            self._observe("user_tasks", "set", started, size=size)
+        finally:
+            self._release_lock(
+                keys=[f"{self.rebuild_lock_prefix}{user_id}"], args=[lock_token]
             )
+        self._set_local(self._get_user_tasks_key(user_id), tuple(tasks), size)
         return tasks
+
+    def find_uncached_users(self, user_ids: list[str]) -> dict[str, bytes]:
+        """Map each user without a servable list to their current generation.
+
+        Read this before loading the users' tasks and pass it to
+        ``prime_user_tasks``.
+        """
+        if not user_ids:
+            return {}
+        pipe = self.redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.hmget(
+                self._get_user_tasks_key(user_id),
+                [self.COMPLETE_FIELD, self.GENERATION_FIELD],
+            )
+            pipe.get(self._get_generation_key(user_id))
+        results = pipe.execute()
+        uncached = {}
+        for index, user_id in enumerate(user_ids):
+            (complete, cached_generation), generation = results[
+                2 * index : 2 * index + 2
+            ]
+            generation = generation or b"0"
+            if complete is None or cached_generation != generation:
+                uncached[user_id] = generation
+        return uncached
+
+    def prime_user_tasks(
+        self, tasks_by_user: dict[str, list[Task]], generations: dict[str, bytes]
+    ) -> int:
+        """Store complete lists loaded after ``find_uncached_users``.
+
+        A list that a write made outdated in the meantime is stored under
+        its old generation and never served. Returns how many users were
+        written.
+        """
+        if not tasks_by_user:
+            return 0
+        started = time.perf_counter()
+        pipe = self.redis_client.pipeline(transaction=False)
+        size = sum(
+            self._queue_user_tasks(pipe, user_id, tasks, 0.0, generations[user_id])
+            for user_id, tasks in tasks_by_user.items()
+        )
+        pipe.execute()
+        self._observe("user_tasks", "prime", started, size=size)
+        return len(tasks_by_user)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Stop serving every cached entry of the user in O(1)"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.incr(self._get_generation_key(user_id))
+        pipe.expire(self._get_generation_key(user_id), self.generation_ttl)
+        pipe.execute()
+        if self.metrics:
+            self.metrics.record_invalidation("user_tasks")
+        self._invalidate_local(user_id)
+
+    def get_user_tasks_response(
+        self, user_id: str, render: Callable[[list[Task]], bytes]
+    ) -> tuple[bytes, str]:
+        """Return the rendered task list body and its ETag.
+
+        On a hit this is a single HGET with no decoding or re-serialization.
+        On a miss the body is rendered from a snapshot of the user's hash and
+        stored only if no write changed the hash in the meantime.
+        """
+        response_key = self._get_response_key(user_id)
+        local_response = self._get_local(response_key)
+        if local_response is not None:
+            return local_response
+
+        user_tasks_key = self._get_user_tasks_key(user_id)
+        started = time.perf_counter()
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hmget(user_tasks_key, [self.RESPONSE_FIELD, self.GENERATION_FIELD])
+        pipe.get(self._get_generation_key(user_id))
+        (cached_response, cached_generation), generation = pipe.execute()
+        if cached_generation != (generation or b"0"):
+            cached_response = None
+        self._observe(
+            "task_list_response",
+            "get",
+            started,
+            hit=bool(cached_response),
+            size=len(cached_response or b""),
+        )
+        if cached_response:
+            response = (
+                cached_response[self.ETAG_LENGTH :],
+                cached_response[: self.ETAG_LENGTH].decode(),
+            )
+            self._set_local(response_key, response, len(cached_response))
+            return response
+
+        cached_tasks, _ = self._read_user_tasks(user_id)
+        decoded = None
+        if self.COMPLETE_FIELD.encode() in cached_tasks:
+            decoded = self._decode_user_tasks(cached_tasks)
+        if decoded is None:
+            # Rebuild the list; the response is stored on the next request
+            body = render(self.get_user_tasks(user_id))
+            return body, self._etag(body)
+
+        body = render(decoded[0])
+        etag = self._etag(body)
+        version = cached_tasks.get(self.VERSION_FIELD.encode(), b"")
+        started = time.perf_counter()
+        stored = self._store_response(
+            keys=[user_tasks_key], args=[version, etag.encode() + body]
+        )
+        self._observe("task_list_response", "set", started, size=len(body))
+        if stored:
+            self._set_local(response_key, (body, etag), len(body) + len(etag))
+        return body, etag
+
+    def _etag(self, body: bytes) -> str:
+        return hashlib.blake2b(body, digest_size=self.ETAG_LENGTH // 2).hexdigest()
+
+    def _wait_for_rebuild(self, user_id: str) -> Optional[list[Task]]:
+        user_tasks_key = self._get_user_tasks_key(user_id)
+        deadline = time.monotonic() + self.rebuild_wait_ms / 1000
+        while time.monotonic() < deadline:
+            time.sleep(self.rebuild_poll_ms / 1000)
+            cached_tasks, _ = self._read_user_tasks(user_id)
+            if self.COMPLETE_FIELD.encode() in cached_tasks:
+                decoded = self._decode_user_tasks(cached_tasks)
+                if decoded is None:
+                    return None
+                tasks, size = decoded
+                self._set_local(user_tasks_key, tuple(tasks), size)
+                return tasks
+        return None
+
+    def get_user_tasks(self, user_id: str) -> list[Task]:
+        user_tasks_key = self._get_user_tasks_key(user_id)
+        local_tasks = self._get_local(user_tasks_key)
+        if local_tasks is not None:
+            return list(local_tasks)
+
+        # Try Redis next; only a complete hash can answer a listing
+        started = time.perf_counter()
+        cached_tasks, generation = self._read_user_tasks(user_id)
+        complete_marker = cached_tasks.get(self.COMPLETE_FIELD.encode())
+        decoded = None
+        if complete_marker is not None:
+            decoded = self._decode_user_tasks(cached_tasks)
+        self._observe(
+            "user_tasks",
+            "get",
+            started,
+            hit=decoded is not None,
+            size=decoded[1] if decoded else 0,
+        )
+        self._record_l2(decoded is not None)
+        if decoded is not None:
+            tasks, size = decoded
+            if self._should_refresh_early(complete_marker):
+                lock_token = self._acquire_rebuild_lock(user_id)
+                if lock_token:
+                    self._record_rebuild("early_refreshes")
+                    return self._rebuild_user_tasks(user_id, lock_token, generation)
+            self._set_local(user_tasks_key, tuple(tasks), size)
+            return tasks
+
+        # If not in cache, one request rebuilds it while the others wait
+        lock_token = self._acquire_rebuild_lock(user_id)
+        if lock_token:
+            self._record_rebuild("rebuilds")
+            return self._rebuild_user_tasks(user_id, lock_token, generation)
+
+        self._record_rebuild("coalesced")
+        tasks = self._wait_for_rebuild(user_id)
+        if tasks is not None:
+            return tasks
+
+        # The rebuild is taking too long; read MongoDB without caching
+        self._record_rebuild("wait_timeouts")
+        return self.task_service.get_user_tasks(user_id)
+
+    def get_user_tasks_page(
+        self, user_id: str, cursor: Optional[str], limit: int
+    ) -> tuple[list[Task], Optional[str]]:
+        # Validates the cursor before it becomes part of a key
+        page_key = self._get_page_key(user_id, decode_cursor(cursor), limit)
+        started = time.perf_counter()
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hgetall(page_key)
+        pipe.get(self._get_generation_key(user_id))
+        cached_page, generation = pipe.execute()
+        generation = generation or b"0"
+
+        page = None
+        if cached_page.get(self.GENERATION_FIELD.encode()) == generation:
+            try:
+                page = [
+                    decode_task(cached_page[str(index).encode()])
+                    for index in range(len(cached_page) - 2)
+                ]
+            except (CacheCodecError, KeyError):
+                page = None
+        self._observe(
+            "user_tasks_page",
+            "get",
+            started,
+            hit=page is not None,
+            size=(
+                sum(len(payload) for payload in cached_page.values())
+                if page is not None
+                else 0
+            ),
+        )
+        if page is not None:
+            next_cursor = cached_page[self.NEXT_FIELD.encode()].decode()
+            return page, next_cursor or None
+
+        tasks, next_cursor = self.task_service.get_user_tasks_page(
+            user_id, cursor, limit
+        )
+        mapping = {
+            str(index): self._encode_task(task) for index, task in enumerate(tasks)
+        }
+        # The generation read before loading; a write since then bumped it
+        mapping[self.GENERATION_FIELD] = generation
+        mapping[self.NEXT_FIELD] = next_cursor or ""
+        started = time.perf_counter()
+        pipe = self.redis_client.pipeline()
+        pipe.delete(page_key)
+        pipe.hset(page_key, mapping=mapping)
+        pipe.expire(page_key, self.page_cache_ttl)
+        pipe.execute()
+        self._observe(
+            "user_tasks_page",
+            "set",
+            started,
+            size=sum(len(payload) for payload in mapping.values()),
+        )
+        return tasks, next_cursor
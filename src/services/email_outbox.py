@@ -0,0 +1,190 @@
+import json
+import socket
+import threading
+import time
+import uuid
+from typing import Optional
+from redis import StrictRedis
+from ..config import Config
+from ..utils.logger import setup_logger
+from ..utils.stats import LatencyRecorder
+from .email import EmailService
+
+logger = setup_logger("email_outbox")
+
+# Moves retries whose backoff has elapsed back onto the pending queue. Each
+# entry is removed and requeued in one step, so a crash cannot lose it and
+# concurrent workers cannot requeue it twice.
+# KEYS: retry set, pending queue
+# ARGV: now, max entries to move
+PROMOTE_DUE_RETRIES_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], 0, ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, raw in ipairs(due) do
+    redis.call('ZREM', KEYS[1], raw)
+    redis.call('LPUSH', KEYS[2], raw)
+end
+return #due
+"""
+
+# Fields send_email writes; a message missing any of them cannot be sent
+MESSAGE_FIELDS = ("id", "to", "subject", "body", "enqueued_at", "attempts")
+
+
+class EmailOutbox:
+    """Redis-backed outbox in front of the SMTP ``EmailService``.
+
+    ``send_email`` only enqueues the message so HTTP requests never wait on
+    the mail relay. A worker (``flask outbox work``) drains the queue, moving
+    each message to its own processing list while it is being sent so a
+    crashed worker can requeue it on restart. Failed sends are retried with
+    exponential backoff and end up in a dead-letter list after
+    ``EMAIL_OUTBOX_MAX_ATTEMPTS``. Messages that cannot be decoded go
+    straight to the dead-letter list.
+    """
+
+    def __init__(self, redis_client: StrictRedis, email_service: EmailService):
+        self.redis_client = redis_client
+        self.email_service = email_service
+        self.queue_key = "email_outbox:pending"
+        self.retry_key = "email_outbox:retry"
+        self.dead_letter_key = "email_outbox:dead"
+        self.processing_prefix = "email_outbox:processing:"
+        self.latency_key = "email_outbox:send_latency"
+        self.max_attempts = Config.EMAIL_OUTBOX_MAX_ATTEMPTS
+        self.backoff_seconds = Config.EMAIL_OUTBOX_BACKOFF_SECONDS
+        self.max_backoff_seconds = Config.EMAIL_OUTBOX_MAX_BACKOFF_SECONDS
+        self.send_latency = LatencyRecorder()
+        self._promote_due_retries = redis_client.register_script(
+            PROMOTE_DUE_RETRIES_SCRIPT
+        )
+
+    def send_email(self, to_email: str, subject: str, body: str) -> None:
+        if not Config.EMAIL_OUTBOX_ENABLED:
+            self.email_service.send_email(to_email, subject, body)
+            return
+        message = {
+            "id": uuid.uuid4().hex,
+            "to": to_email,
+            "subject": subject,
+            "body": body,
+            "enqueued_at": time.time(),
+            "attempts": 0,
+        }
+        self.redis_client.lpush(self.queue_key, json.dumps(message))
+
+    def _get_processing_key(self, worker_id: str) -> str:
+        return f"{self.processing_prefix}{worker_id}"
+
+    def _retry_delay(self, attempts: int) -> float:
+        return min(self.backoff_seconds * 2 ** (attempts - 1), self.max_backoff_seconds)
+
+    def promote_due_retries(self, limit: int = 100) -> int:
+        """Move retries whose backoff has elapsed back onto the pending queue"""
+        return self._promote_due_retries(
+            keys=[self.retry_key, self.queue_key], args=[time.time(), limit]
+        )
+
+    def requeue_in_flight(self, worker_id: str) -> int:
+        """Return messages a previous run of this worker never finished"""
+        processing_key = self._get_processing_key(worker_id)
+        requeued = 0
+        while self.redis_client.rpoplpush(processing_key, self.queue_key):
+            requeued += 1
+        return requeued
+
+    def process_next(self, worker_id: str, timeout: int = 1) -> bool:
+        processing_key = self._get_processing_key(worker_id)
+        raw = self.redis_client.brpoplpush(self.queue_key, processing_key, timeout)
+        if raw is None:
+            return False
+
+        try:
+            message = json.loads(raw)
+            missing = [field for field in MESSAGE_FIELDS if field not in message]
+            if missing:
+                raise ValueError(f"missing {', '.join(missing)}")
+        except (ValueError, TypeError) as e:
+            # Requeueing a message that can never be sent would loop forever
+            logger.error(f"Dead-lettering undecodable email: {str(e)}")
+            pipe = self.redis_client.pipeline()
+            pipe.lpush(self.dead_letter_key, raw)
+            pipe.lrem(processing_key, 1, raw)
+            pipe.execute()
+            return True
+
+        try:
+            self.email_service.send_email(
+                message["to"], message["subject"], message["body"]
+            )
+            self.send_latency.record(time.time() - message["enqueued_at"])
+        except Exception as e:
+            self._handle_failure(message, e)
+        finally:
+            self.redis_client.lrem(processing_key, 1, raw)
+        return True
+
+    def _handle_failure(self, message: dict, error: Exception) -> None:
+        message["attempts"] += 1
+        if message["attempts"] >= self.max_attempts:
+            logger.error(
+                f"Giving up on email {message['id']} after "
+                f"{message['attempts']} attempts: {str(error)}"
+            )
+            self.redis_client.lpush(self.dead_letter_key, json.dumps(message))
+            return
+        delay = self._retry_delay(message["attempts"])
+        logger.warning(
+            f"Email {message['id']} failed (attempt {message['attempts']}), "
+            f"retrying in {delay}s: {str(error)}"
+        )
+        self.redis_client.zadd(
+            self.retry_key, {json.dumps(message): time.time() + delay}
+        )
+
+    def publish_stats(self) -> None:
+        """Share this worker's enqueue-to-send latency with the API processes"""
+        self.redis_client.setex(
+            self.latency_key, 300, json.dumps(self.send_latency.snapshot())
+        )
+
+    def run(
+        self,
+        worker_id: Optional[str] = None,
+        stop_event: Optional[threading.Event] = None,
+        stats_interval: float = 10.0,
+    ) -> None:
+        worker_id = worker_id or socket.gethostname()
+        stop_event = stop_event or threading.Event()
+        requeued = self.requeue_in_flight(worker_id)
+        logger.info(f"Email outbox worker {worker_id} started, requeued {requeued}")
+
+        stats_published_at = time.monotonic()
+        while not stop_event.is_set():
+            try:
+                self.promote_due_retries()
+                self.process_next(worker_id)
+                if time.monotonic() - stats_published_at >= stats_interval:
+                    self.publish_stats()
+                    stats_published_at = time.monotonic()
+            except Exception as e:
+                logger.error(f"Email outbox worker error: {str(e)}")
+                stop_event.wait(1)
+
+    def stats(self) -> dict:
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.llen(self.queue_key)
+        pipe.zcard(self.retry_key)
+        pipe.llen(self.dead_letter_key)
+        # Pending messages are pushed on the left, so the oldest is on the right
+        pipe.lindex(self.queue_key, -1)
+        pipe.get(self.latency_key)
+        pending, retrying, dead, oldest, latency = pipe.execute()
+        return {
+            "pending": pending,
+            "retrying": retrying,
+            "dead": dead,
+            "oldest_pending_age_seconds": (
+                time.time() - json.loads(oldest)["enqueued_at"] if oldest else 0.0
+            ),
+            "send_latency": json.loads(latency) if latency else None,
+        }
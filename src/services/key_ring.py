@@ -0,0 +1,151 @@
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from ..config import Config
+from ..utils.logger import setup_logger
+
+logger = setup_logger("key_ring")
+
+# Tokens issued before kid headers existed are verified with this key
+DEFAULT_KID = "default"
+
+
+class SigningKey:
+    def __init__(
+        self,
+        kid: str,
+        algorithm: str,
+        verifying_key: Key,
+        signing_key: Optional[Key] = None,
+    ):
+        self.kid = kid
+        self.algorithm = algorithm
+        self.verifying_key = verifying_key
+        self.signing_key = signing_key
+
+    @staticmethod
+    def from_dict(data: dict) -> "SigningKey":
+        algorithm = data.get("alg", "HS256")
+        if "secret" in data:
+            # Symmetric keys sign and verify with the same material
+            key = jwk.construct(data["secret"], algorithm)
+            return SigningKey(data["kid"], algorithm, key, key)
+        private_key = data.get("private_key")
+        return SigningKey(
+            kid=data["kid"],
+            algorithm=algorithm,
+            verifying_key=jwk.construct(data["public_key"], algorithm),
+            signing_key=jwk.construct(private_key, algorithm) if private_key else None,
+        )
+
+
+class KeySet(NamedTuple):
+    """Keys and active kid of one load, published together."""
+
+    keys: Mapping[str, SigningKey]
+    active_kid: str
+
+
+class KeyRing:
+    """Set of JWT keys selected by the ``kid`` header.
+
+    Keys are parsed once when the ring is loaded. When ``JWT_KEYRING_FILE``
+    is set the file is re-read whenever it changes, so keys can be rotated
+    without a restart: publish the new key first, then switch
+    ``active_kid`` once every node has picked it up. Nodes whose file only
+    holds public keys can verify tokens but not issue them.
+
+    Without a file the ring holds a single ``default`` key built from
+    ``JWT_SECRET_KEY``. With a file that key is only added when
+    ``JWT_KEYRING_INCLUDE_DEFAULT_KEY`` is set, so the shared secret can be
+    retired.
+    """
+
+    def __init__(self):
+        self.key_file = Config.JWT_KEYRING_FILE
+        self.reload_interval = Config.JWT_KEYRING_RELOAD_SECONDS
+        self.include_default_key = Config.JWT_KEYRING_INCLUDE_DEFAULT_KEY
+        self._lock = threading.Lock()
+        self._key_set = KeySet(MappingProxyType({}), DEFAULT_KID)
+        self._file_mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._load()
+
+    def _default_key(self) -> SigningKey:
+        return SigningKey.from_dict(
+            {
+                "kid": DEFAULT_KID,
+                "alg": Config.JWT_ALGORITHM,
+                "secret": Config.JWT_SECRET_KEY,
+            }
+        )
+
+    def _load(self) -> None:
+        keys = {}
+        active_kid = DEFAULT_KID
+        if not self.key_file or self.include_default_key:
+            keys[DEFAULT_KID] = self._default_key()
+        if self.key_file:
+            mtime = os.path.getmtime(self.key_file)
+            with open(self.key_file) as f:
+                data = json.load(f)
+            for key_data in data.get("keys", []):
+                key = SigningKey.from_dict(key_data)
+                keys[key.kid] = key
+            active_kid = data.get("active_kid", DEFAULT_KID)
+            if active_kid not in keys:
+                raise ValueError(f"Active key {active_kid} is not in the key ring")
+            self._file_mtime = mtime
+        # A single assignment, so readers never pair old keys with a new kid
+        self._key_set = KeySet(MappingProxyType(keys), active_kid)
+
+    def _maybe_reload(self, force: bool = False) -> None:
+        if not self.key_file:
+            return
+        now = time.monotonic()
+        # A forced reload (unknown kid) is still limited to once per second
+        min_interval = 1.0 if force else self.reload_interval
+        if now - self._checked_at < min_interval:
+            return
+        with self._lock:
+            if now - self._checked_at < min_interval:
+                return
+            self._checked_at = now
+            try:
+                if os.path.getmtime(self.key_file) != self._file_mtime:
+                    self._load()
+                    logger.info(f"Key ring reloaded, active key {self.active_kid}")
+            except Exception as e:
+                # Keep serving with the previous keys rather than failing tokens
+                logger.error(f"Failed to reload key ring: {str(e)}")
+
+    @property
+    def active_kid(self) -> str:
+        return self._key_set.active_kid
+
+    def encode(self, claims: dict) -> str:
+        self._maybe_reload()
+        key_set = self._key_set
+        key = key_set.keys[key_set.active_kid]
+        if key.signing_key is None:
+            raise JWTError(f"Key {key.kid} can only verify tokens")
+        return jwt.encode(
+            claims, key.signing_key, algorithm=key.algorithm, headers={"kid": key.kid}
+        )
+
+    def decode(self, token: str) -> dict:
+        self._maybe_reload()
+        kid = jwt.get_unverified_header(token).get("kid", DEFAULT_KID)
+        key = self._key_set.keys.get(kid)
+        if key is None:
+            # The token may be signed with a key published after our last reload
+            self._maybe_reload(force=True)
+            key = self._key_set.keys.get(kid)
+        if key is None:
+            raise JWTError(f"Unknown signing key {kid}")
+        return jwt.decode(token, key.verifying_key, algorithms=[key.algorithm])
@@ -0,0 +1,81 @@
+import time
+from typing import Optional
+from redis import StrictRedis
+from ..config import Config
+
+
+class LoginThrottledError(Exception):
+    """Raised when a login is refused because of too many recent failures."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Too many failed login attempts")
+        self.retry_after = retry_after
+
+
+class LoginThrottle:
+    """Sliding-window counters of failed logins per email and per client IP.
+
+    Each scope keeps a counter for the current and the previous fixed window;
+    the previous one is weighted by how much of it still overlaps the
+    sliding window. Checking costs one MGET and recording a failure one
+    pipelined round trip, both before any bcrypt work is done.
+    """
+
+    def __init__(self, redis_client: StrictRedis):
+        self.redis_client = redis_client
+        self.prefix = "login_failures:"
+        self.window_seconds = Config.LOGIN_THROTTLE_WINDOW_SECONDS
+        self.email_limit = Config.LOGIN_THROTTLE_EMAIL_LIMIT
+        self.ip_limit = Config.LOGIN_THROTTLE_IP_LIMIT
+
+    def _get_keys(self, scope: str, value: str, now: float) -> tuple[str, str]:
+        window = int(now // self.window_seconds)
+        return (
+            f"{self.prefix}{scope}:{value}:{window}",
+            f"{self.prefix}{scope}:{value}:{window - 1}",
+        )
+
+    def _scopes(
+        self, email: str, client_ip: Optional[str]
+    ) -> list[tuple[str, str, int]]:
+        scopes = [("email", email.lower(), self.email_limit)]
+        if client_ip:
+            scopes.append(("ip", client_ip, self.ip_limit))
+        return scopes
+
+    def check(self, email: str, client_ip: Optional[str] = None) -> bool:
+        """Raise LoginThrottledError when a limit is reached.
+
+        Returns whether the email has recent failures, so callers only pay
+        for a reset when there is something to clear.
+        """
+        now = time.time()
+        scopes = self._scopes(email, client_ip)
+        keys = [
+            key
+            for scope, value, _ in scopes
+            for key in self._get_keys(scope, value, now)
+        ]
+        counts = [int(count or 0) for count in self.redis_client.mget(keys)]
+
+        # Share of the previous window still inside the sliding window
+        overlap = 1 - (now % self.window_seconds) / self.window_seconds
+        retry_after = int(self.window_seconds - now % self.window_seconds) + 1
+        for i, (_, _, limit) in enumerate(scopes):
+            current, previous = counts[2 * i], counts[2 * i + 1]
+            if current + previous * overlap >= limit:
+                raise LoginThrottledError(retry_after)
+        return counts[0] + counts[1] > 0
+
+    def record_failure(self, email: str, client_ip: Optional[str] = None) -> None:
+        now = time.time()
+        pipe = self.redis_client.pipeline(transaction=False)
+        for scope, value, _ in self._scopes(email, client_ip):
+            current_key, _ = self._get_keys(scope, value, now)
+            pipe.incr(current_key)
+            # Kept for the next window too, where it is weighted as "previous"
+            pipe.expire(current_key, self.window_seconds * 2)
+        pipe.execute()
+
+    def reset(self, email: str) -> None:
+        self.redis_client.delete(*self._get_keys("email", email.lower(), time.time()))
@@ -21,8 +21,10 @@ class MetricsService:
     def get_metrics(self) -> Metrics:
         """Get current metrics from repositories and update stored metrics"""
         try:
-            # Get all tasks and users
-            tasks = self.task_repository.find_all()
+            # Get all tasks and users; only the status is needed per task
+            tasks = self.task_repository.find_all(
+                projection=TaskRepository.STATUS_PROJECTION
+            )
             total_users = len(self.user_repository.find_all())
 
             # Calculate task metrics
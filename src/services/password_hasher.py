@@ -0,0 +1,87 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt
+from ..config import Config
+from ..utils.logger import setup_logger
+from ..utils.stats import LatencyRecorder
+
+logger = setup_logger("password_hasher")
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when too many password operations are already queued."""
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, size-limited pool of threads.
+
+    bcrypt releases the GIL, so a small pool bounds the CPU spent on
+    hashing while request threads stay free for cheap endpoints. Work
+    beyond ``BCRYPT_MAX_WORKERS + BCRYPT_MAX_QUEUE`` is rejected at once
+    instead of piling up behind a login burst.
+    """
+
+    def __init__(self):
+        self.rounds = Config.BCRYPT_ROUNDS
+        self.max_workers = Config.BCRYPT_MAX_WORKERS
+        self.max_queue = Config.BCRYPT_MAX_QUEUE
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="bcrypt"
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self.queue_wait = LatencyRecorder()
+        self.hash_time = LatencyRecorder()
+        self.rejected = 0
+
+    def hash(self, password: str) -> str:
+        return self._run(
+            lambda: bcrypt.hashpw(
+                password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)
+            ).decode("utf-8")
+        )
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(
+            lambda: bcrypt.checkpw(
+                plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+            )
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a stored hash was made with a different cost factor"""
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (AttributeError, IndexError, ValueError):
+            return False
+
+    def _run(self, operation):
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            logger.warning("Password hashing queue is full, rejecting request")
+            raise PasswordHasherBusyError("Too many password operations in progress")
+
+        enqueued = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            self.queue_wait.record(started - enqueued)
+            try:
+                return operation()
+            finally:
+                self.hash_time.record(time.perf_counter() - started)
+
+        try:
+            return self.executor.submit(task).result()
+        finally:
+            self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.snapshot(),
+            "hash_time": self.hash_time.snapshot(),
+        }
@@ -0,0 +1,41 @@
+from redis import StrictRedis
+
+
+class SessionReportService:
+    """Measures the Redis memory spent per stored login session"""
+
+    # Key patterns of the access and refresh halves of a session
+    FORMATS = {
+        "legacy": ("token:*", "refresh:*"),
+        "compact": ("at:*", "rt:*"),
+    }
+
+    def __init__(self, redis_client: StrictRedis):
+        self.redis_client = redis_client
+
+    def _sample_key_sizes(self, pattern: str, sample_size: int) -> list[int]:
+        sizes = []
+        for key in self.redis_client.scan_iter(match=pattern, count=1000):
+            usage = self.redis_client.memory_usage(key, samples=0)
+            if usage:
+                sizes.append(usage)
+            if len(sizes) >= sample_size:
+                break
+        return sizes
+
+    def get_report(self, sample_size: int = 1000) -> dict:
+        report = {}
+        for name, (access_pattern, refresh_pattern) in self.FORMATS.items():
+            access_sizes = self._sample_key_sizes(access_pattern, sample_size)
+            refresh_sizes = self._sample_key_sizes(refresh_pattern, sample_size)
+            bytes_per_session = None
+            if access_sizes and refresh_sizes:
+                bytes_per_session = sum(access_sizes) / len(access_sizes) + sum(
+                    refresh_sizes
+                ) / len(refresh_sizes)
+            report[name] = {
+                "access_keys_sampled": len(access_sizes),
+                "refresh_keys_sampled": len(refresh_sizes),
+                "bytes_per_session": bytes_per_session,
+            }
+        return report
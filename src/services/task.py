@@ -1,13 +1,23 @@
+from typing import Optional
+from ..config import Config
 from ..models.task import Task
 from ..repositories.task import TaskRepository
 from ..services.user import UserService
 from bson.objectid import ObjectId
 from ..utils.logger import setup_logger
+from ..utils.pagination import decode_cursor, encode_cursor
 
 logger = setup_logger("task_service")
 
 
+class TaskNotFoundError(ValueError):
+    """Raised when a task to change does not exist; routes answer 404"""
+
+
 class TaskService:
+    # Fields a bulk update may set
+    BULK_UPDATE_FIELDS = ("title", "description", "completed")
+
     def __init__(self, task_repository: TaskRepository, user_service: UserService):
         self.task_repository = task_repository
         self.user_service = user_service
@@ -40,87 +50,238 @@ class TaskService:
             raise ValueError("Unauthorized access to task")
         return task
 
+    def _raise_unmatched(self, task_id: str, user_id: str, action: str) -> None:
+        """Explain why an ownership-filtered write matched nothing.
+
+        Only reached on the failure path, so successful writes stay at a
+        single round trip.
+        """
+        if self.task_repository.exists(task_id):
+            logger.warning(
+                f"Unauthorized {action} attempt for task {task_id} by user {user_id}"
+            )
+            raise ValueError("Unauthorized access to task")
+        logger.error(f"Attempt to {action} non-existent task: {task_id}")
+        raise TaskNotFoundError("Task not found")
+
     def update_task(
         self,
         task_id: str,
         title: str | None = None,
         description: str | None = None,
         user_id: str = None,
-    ) -> None:
+    ) -> Task:
         if not ObjectId.is_valid(task_id):
             raise ValueError("Invalid task ID format")
 
-        existing_task = self.task_repository.find_by_id(task_id)
-        if existing_task is None:
-            raise ValueError("Task not found")
-
-        if existing_task.user_id != user_id:
-            raise ValueError("Unauthorized access to task")
+        # Fields left as None keep their stored value
+        fields = {}
+        if title is not None:
+            if title.strip() == "":
+                raise ValueError("Title cannot be empty")
+            fields["title"] = title
+        if description is not None:
+            fields["description"] = description
 
-        updated_title = title if title is not None else existing_task.title
-        updated_description = (
-            description if description is not None else existing_task.description
-        )
-
-        if updated_title.strip() == "":
-            raise ValueError("Title cannot be empty")
-
-        task = Task(
-            title=updated_title,
-            description=updated_description,
-            user_id=existing_task.user_id,
-            completed=existing_task.completed,  # Preserve the existing completed status
-        )
-        self.task_repository.update(task_id, task)
+        task = self.task_repository.update_owned(task_id, user_id, fields)
+        if task is None:
+            self._raise_unmatched(task_id, user_id, "update")
+        return task
 
-    def update_task_status(self, task_id: str, completed: bool, user_id: str) -> None:
+    def update_task_status(self, task_id: str, completed: bool, user_id: str) -> Task:
         if not ObjectId.is_valid(task_id):
             logger.error(f"Invalid task ID format: {task_id}")
             raise ValueError("Invalid task ID format")
 
-        existing_task = self.task_repository.find_by_id(task_id)
-        if existing_task is None:
-            logger.error(f"Task not found: {task_id}")
-            raise ValueError("Task not found")
-
-        if existing_task.user_id != user_id:
-            logger.warning(
-                f"Unauthorized status update attempt for task {task_id} by user {user_id}"
-            )
-            raise ValueError("Unauthorized access to task")
-
-        task = Task(
-            title=existing_task.title,
-            description=existing_task.description,
-            user_id=existing_task.user_id,
-            completed=completed,
+        task = self.task_repository.update_owned(
+            task_id, user_id, {"completed": completed}
         )
-        self.task_repository.update(task_id, task)
+        if task is None:
+            self._raise_unmatched(task_id, user_id, "status update")
         logger.info(
             f"Task {task_id} completed status updated to {completed} by user {user_id}"
         )
+        return task
 
     def delete_task(self, task_id: str, user_id: str) -> None:
         if not ObjectId.is_valid(task_id):
             logger.error(f"Invalid task ID format: {task_id}")
             raise ValueError("Invalid task ID format")
 
-        existing_task = self.task_repository.find_by_id(task_id)
-        if existing_task is None:
-            logger.error(f"Attempt to delete non-existent task: {task_id}")
-            raise ValueError("Task not found")
+        if not self.task_repository.delete_owned(task_id, user_id):
+            self._raise_unmatched(task_id, user_id, "delete")
+        logger.info(f"Task {task_id} deleted successfully by user {user_id}")
+
+    @staticmethod
+    def _bulk_result(
+        task_id: Optional[str], status: int, error: Optional[str] = None
+    ) -> dict:
+        """Outcome of one bulk item, with the status its single endpoint would return"""
+        return {"id": task_id, "status": status, "error": error}
 
-        if existing_task.user_id != user_id:
-            logger.warning(
-                f"Unauthorized deletion attempt for task {task_id} by user {user_id}"
+    def _check_bulk_size(self, count: int) -> None:
+        if not 1 <= count <= Config.TASK_BULK_MAX_ITEMS:
+            raise ValueError(
+                f"A bulk request takes between 1 and {Config.TASK_BULK_MAX_ITEMS} tasks"
             )
-            raise ValueError("Unauthorized access to task")
 
-        self.task_repository.delete(task_id)
-        logger.info(f"Task {task_id} deleted successfully by user {user_id}")
+    def _apply_bulk_errors(
+        self, results: list, indexes: list[int], errors: dict[int, str], action: str
+    ) -> None:
+        # ``errors`` is keyed by position in the batch, ``indexes`` maps it back
+        for position, error in errors.items():
+            index = indexes[position]
+            logger.error(f"Bulk {action} failed for item {index}: {error}")
+            # A failed insert never stored its pre-generated id
+            task_id = None if action == "create" else results[index]["id"]
+            results[index] = self._bulk_result(task_id, 500, "Internal server error")
+
+    def _check_bulk_targets(
+        self, task_ids: list[str], user_id: str, results: list, action: str
+    ) -> list[int]:
+        """Fill in the result of every item that cannot be applied.
+
+        Items that already have a result are skipped. Ownership of the rest
+        is read in one query. Returns the indexes of the items left to write.
+        """
+        seen = set()
+        candidates = []
+        for index, task_id in enumerate(task_ids):
+            if results[index] is not None:
+                continue
+            if not ObjectId.is_valid(task_id):
+                results[index] = self._bulk_result(
+                    task_id, 400, "Invalid task ID format"
+                )
+            elif task_id in seen:
+                # Unordered writes to one task would race each other
+                results[index] = self._bulk_result(task_id, 400, "Duplicate task ID")
+            else:
+                seen.add(task_id)
+                candidates.append(index)
+        if not candidates:
+            return []
+
+        owners = self.task_repository.find_owners(
+            [task_ids[index] for index in candidates]
+        )
+        writable = []
+        for index in candidates:
+            task_id = task_ids[index]
+            if task_id not in owners:
+                results[index] = self._bulk_result(task_id, 404, "Task not found")
+            elif owners[task_id] != user_id:
+                logger.warning(
+                    f"Unauthorized bulk {action} attempt for task {task_id} "
+                    f"by user {user_id}"
+                )
+                results[index] = self._bulk_result(
+                    task_id, 400, "Unauthorized access to task"
+                )
+            else:
+                writable.append(index)
+        return writable
+
+    def bulk_create_tasks(
+        self, tasks: list[tuple[str, str]], user_id: str
+    ) -> list[dict]:
+        """Create (title, description) pairs in one batch; one result per pair"""
+        self._check_bulk_size(len(tasks))
+        # One existence check covers the whole batch
+        self.user_service.get_user_by_id(user_id)
+
+        results = [None] * len(tasks)
+        indexes, new_tasks = [], []
+        for index, (title, description) in enumerate(tasks):
+            if not title or title.strip() == "":
+                results[index] = self._bulk_result(None, 400, "Title cannot be empty")
+                continue
+            indexes.append(index)
+            new_tasks.append(
+                Task(title=title, description=description, user_id=user_id)
+            )
+
+        if new_tasks:
+            task_ids, errors = self.task_repository.bulk_create(new_tasks)
+            for position, index in enumerate(indexes):
+                results[index] = self._bulk_result(task_ids[position], 201)
+            self._apply_bulk_errors(results, indexes, errors, "create")
+        logger.info(
+            f"Bulk created {len(new_tasks)} of {len(tasks)} tasks for user {user_id}"
+        )
+        return results
+
+    def bulk_update_tasks(
+        self, updates: list[tuple[str, dict]], user_id: str
+    ) -> list[dict]:
+        """Set fields on many tasks in one batch; one result per (task id, fields).
+
+        A task deleted between the ownership query and the batch is
+        reported as updated, as it would be by a single-task update that
+        ran just before the delete.
+        """
+        self._check_bulk_size(len(updates))
+        results = [None] * len(updates)
+        for index, (task_id, fields) in enumerate(updates):
+            unknown = set(fields) - set(self.BULK_UPDATE_FIELDS)
+            if unknown:
+                raise ValueError(f"Cannot update fields: {', '.join(sorted(unknown))}")
+            title = fields.get("title")
+            if title is not None and title.strip() == "":
+                results[index] = self._bulk_result(
+                    task_id, 400, "Title cannot be empty"
+                )
+
+        task_ids = [task_id for task_id, _ in updates]
+        writable = self._check_bulk_targets(task_ids, user_id, results, "update")
+        for index in writable:
+            results[index] = self._bulk_result(task_ids[index], 200)
+        # Items with no fields to set are done once ownership is confirmed
+        indexes = [index for index in writable if updates[index][1]]
+        errors = self.task_repository.bulk_update_owned(
+            [updates[index] for index in indexes], user_id
+        )
+        self._apply_bulk_errors(results, indexes, errors, "update")
+        logger.info(
+            f"Bulk updated {len(indexes)} of {len(updates)} tasks for user {user_id}"
+        )
+        return results
+
+    def bulk_delete_tasks(self, task_ids: list[str], user_id: str) -> list[dict]:
+        """Delete many tasks in one batch; one result per task id"""
+        self._check_bulk_size(len(task_ids))
+        results = [None] * len(task_ids)
+        indexes = self._check_bulk_targets(task_ids, user_id, results, "delete")
+        for index in indexes:
+            results[index] = self._bulk_result(task_ids[index], 200)
+        errors = self.task_repository.bulk_delete_owned(
+            [task_ids[index] for index in indexes], user_id
+        )
+        self._apply_bulk_errors(results, indexes, errors, "delete")
+        logger.info(
+            f"Bulk deleted {len(indexes)} of {len(task_ids)} tasks for user {user_id}"
+        )
+        return results
 
     def get_all_tasks(self) -> list[Task]:
         return self.task_repository.find_all()
 
     def get_user_tasks(self, user_id: str) -> list[Task]:
         return self.task_repository.find_by_user_id(user_id)
+
+    def get_user_tasks_page(
+        self, user_id: str, cursor: Optional[str], limit: int
+    ) -> tuple[list[Task], Optional[str]]:
+        """Return one page of the user's tasks and the cursor of the next page"""
+        if not 1 <= limit <= Config.TASK_LIST_MAX_LIMIT:
+            raise ValueError(
+                f"limit must be between 1 and {Config.TASK_LIST_MAX_LIMIT}"
+            )
+        after_id = decode_cursor(cursor)
+
+        # One extra task tells whether another page follows
+        tasks = self.task_repository.find_page_by_user_id(user_id, after_id, limit + 1)
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            return tasks, encode_cursor(tasks[-1].id)
+        return tasks, None
@@ -0,0 +1,93 @@
+import json
+import threading
+from typing import Any, Iterable, Optional
+from redis import StrictRedis
+from ..config import Config
+from ..utils.pubsub import InvalidationSubscriber
+from ..utils.ttl_cache import TTLCache
+
+
+class TaskCache:
+    """Per-worker L1 in front of the Redis task cache.
+
+    Entries are keyed by their Redis key and live for a few seconds at most.
+    Every mutation publishes the keys it touched so other workers drop their
+    copies. Redis (L2) lookups and list rebuilds are counted here too, so
+    both tiers report hit ratios side by side.
+    """
+
+    def __init__(self, redis_client: StrictRedis):
+        self.redis_client = redis_client
+        self.enabled = Config.TASK_L1_CACHE_ENABLED
+        self.channel = Config.TASK_CACHE_INVALIDATION_CHANNEL
+        self.cache = TTLCache(
+            max_entries=Config.TASK_L1_CACHE_MAX_ENTRIES,
+            ttl_seconds=Config.TASK_L1_CACHE_TTL_SECONDS,
+            max_bytes=Config.TASK_L1_CACHE_MAX_BYTES,
+        )
+        self.subscriber = InvalidationSubscriber(
+            redis_client,
+            self.channel,
+            handler=self._handle_invalidation,
+            on_reconnect=self.cache.clear,
+        )
+        self._lock = threading.Lock()
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.rebuilds = {
+            "rebuilds": 0,
+            "early_refreshes": 0,
+            "coalesced": 0,
+            "wait_timeouts": 0,
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        self.subscriber.start()
+        return self.cache.get(key)
+
+    def set(self, key: str, value: Any, size: int) -> None:
+        if not self.enabled:
+            return
+        self.subscriber.start()
+        self.cache.set(key, value, size=size)
+
+    def record_l2(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.l2_hits += 1
+            else:
+                self.l2_misses += 1
+
+    def record_rebuild(self, event: str) -> None:
+        with self._lock:
+            self.rebuilds[event] += 1
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Drop keys locally and tell every other worker to do the same"""
+        keys = list(keys)
+        for key in keys:
+            self.cache.delete(key)
+        if self.enabled:
+            self.redis_client.publish(self.channel, json.dumps(keys))
+
+    def _handle_invalidation(self, data: bytes) -> None:
+        for key in json.loads(data):
+            self.cache.delete(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.l2_hits + self.l2_misses
+            l2 = {
+                "hits": self.l2_hits,
+                "misses": self.l2_misses,
+                "hit_ratio": self.l2_hits / lookups if lookups else 0.0,
+            }
+            rebuilds = dict(self.rebuilds)
+        return {
+            "enabled": self.enabled,
+            "l1": self.cache.stats(),
+            "l2": l2,
+            "rebuilds": rebuilds,
+        }
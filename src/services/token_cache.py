@@ -0,0 +1,84 @@
+import json
+import time
+from typing import Iterable, Optional
+from redis import StrictRedis
+from ..config import Config
+from ..models.user import User
+from ..utils.pubsub import InvalidationSubscriber
+from ..utils.ttl_cache import TTLCache
+
+
+class TokenCache:
+    """Per-worker cache of access tokens that already passed validation.
+
+    Entries never outlive the token's ``exp`` claim. Revocations name the
+    token's session key and are published on a Redis channel so every
+    worker evicts the same tokens.
+
+    A token is only served while its session key still maps to it, so
+    evicting the mapping under memory pressure also stops the token from
+    being served and a revocation can never miss a cached token.
+    """
+
+    def __init__(self, redis_client: StrictRedis):
+        self.redis_client = redis_client
+        self.channel = Config.TOKEN_REVOCATION_CHANNEL
+        self.cache = TTLCache(
+            max_entries=Config.TOKEN_CACHE_MAX_ENTRIES,
+            ttl_seconds=Config.TOKEN_CACHE_TTL_SECONDS,
+        )
+        # Maps session keys to cached tokens so revocations can find them;
+        # every hit touches it, keeping both in the same LRU order
+        self.session_tokens = TTLCache(
+            max_entries=Config.TOKEN_CACHE_MAX_ENTRIES,
+            ttl_seconds=Config.TOKEN_CACHE_TTL_SECONDS,
+        )
+        self.subscriber = InvalidationSubscriber(
+            redis_client,
+            self.channel,
+            handler=self._handle_revocation,
+            on_reconnect=self.clear,
+        )
+
+    def get(self, token: str) -> Optional[User]:
+        self.subscriber.start()
+        entry = self.cache.get(token)
+        if entry is None:
+            return None
+        user, session_key = entry
+        if self.session_tokens.get(session_key) != token:
+            # The mapping was evicted, so a revocation could not reach this entry
+            self.cache.delete(token)
+            return None
+        return user
+
+    def set(self, token: str, user: User, expires_at: float, session_key: str) -> None:
+        self.subscriber.start()
+        ttl_seconds = expires_at - time.time()
+        self.cache.set(token, (user, session_key), ttl_seconds=ttl_seconds)
+        self.session_tokens.set(session_key, token, ttl_seconds=ttl_seconds)
+
+    def revoke(self, session_keys: Iterable[str]) -> None:
+        """Evict sessions locally and tell every other worker to do the same"""
+        session_keys = list(session_keys)
+        if not session_keys:
+            return
+        self._evict(session_keys)
+        self.redis_client.publish(self.channel, json.dumps(session_keys))
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.session_tokens.clear()
+
+    def _evict(self, session_keys: Iterable[str]) -> None:
+        for session_key in session_keys:
+            token = self.session_tokens.get(session_key)
+            if token:
+                self.session_tokens.delete(session_key)
+                self.cache.delete(token)
+
+    def _handle_revocation(self, data: bytes) -> None:
+        self._evict(json.loads(data))
+
+    def stats(self) -> dict:
+        return self.cache.stats()
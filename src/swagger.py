@@ -120,6 +120,12 @@ swagger_config = {
                         },
                     },
                     "401": {"description": "Invalid credentials"},
+                    "429": {
+                        "description": "Too many failed login attempts for this email or client"
+                    },
+                    "503": {
+                        "description": "Password hashing capacity exhausted, retry later"
+                    },
                 },
             }
         },
@@ -254,8 +260,28 @@ swagger_config = {
             "get": {
                 "tags": ["Tasks"],
                 "summary": "Get all tasks for authenticated user",
-                "description": "Returns a list of all tasks belonging to the authenticated user",
+                "description": "Returns the tasks belonging to the authenticated user, oldest first. "
+                "Without limit or cursor the whole list is returned; with either, one page is "
+                "returned and `next` holds the cursor of the following page.",
                 "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "in": "query",
+                        "name": "limit",
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 500,
+                        "required": False,
+                        "description": "Page size (default 50)",
+                    },
+                    {
+                        "in": "query",
+                        "name": "cursor",
+                        "type": "string",
+                        "required": False,
+                        "description": "The `next` value of the previous page",
+                    },
+                ],
                 "responses": {
                     "200": {
                         "description": "List of tasks",
@@ -272,14 +298,29 @@ swagger_config = {
                                             "description": {"type": "string"},
                                             "user_id": {"type": "string"},
                                             "completed": {"type": "boolean"},
-                                            "created_at": {"type": "string", "format": "date-time"},
-                                            "updated_at": {"type": "string", "format": "date-time"},
+                                            "created_at": {
+                                                "type": "string",
+                                                "format": "date-time",
+                                            },
+                                            "updated_at": {
+                                                "type": "string",
+                                                "format": "date-time",
+                                            },
                                         },
                                     },
-                                }
+                                },
+                                "next": {
+                                    "type": "string",
+                                    "x-nullable": True,
+                                    "description": "Cursor of the next page, null on the last page",
+                                },
                             },
                         },
                     },
+                    "304": {
+                        "description": "Task list unchanged since the ETag sent in If-None-Match"
+                    },
+                    "400": {"description": "Invalid limit or cursor"},
                     "401": {"description": "Unauthorized"},
                 },
             },
@@ -329,6 +370,279 @@ swagger_config = {
                 },
             },
         },
+        "/tasks/bulk": {
+            "post": {
+                "tags": ["Tasks"],
+                "summary": "Create tasks in bulk",
+                "description": "Creates up to TASK_BULK_MAX_ITEMS tasks for the authenticated user in one batch. "
+                "Each item gets its own result, in request order.",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "in": "body",
+                        "name": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "required": ["tasks"],
+                            "properties": {
+                                "tasks": {
+                                    "type": "array",
+                                    "minItems": 1,
+                                    "maxItems": 1000,
+                                    "items": {
+                                        "type": "object",
+                                        "required": ["title", "description"],
+                                        "properties": {
+                                            "title": {
+                                                "type": "string",
+                                                "minLength": 1,
+                                                "maxLength": 100,
+                                            },
+                                            "description": {
+                                                "type": "string",
+                                                "minLength": 1,
+                                                "maxLength": 500,
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Per-item results",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "results": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "id": {
+                                                "type": "string",
+                                                "x-nullable": True,
+                                            },
+                                            "status": {
+                                                "type": "integer",
+                                                "description": "Status the single-task endpoint would return, e.g. 201, 200, 400, 404",
+                                            },
+                                            "error": {
+                                                "type": "string",
+                                                "x-nullable": True,
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "400": {"description": "Invalid input or too many items"},
+                    "401": {"description": "Unauthorized"},
+                },
+            },
+            "put": {
+                "tags": ["Tasks"],
+                "summary": "Update tasks in bulk",
+                "description": "Updates tasks owned by the authenticated user in one batch. "
+                "Each item gets its own result, in request order.",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "in": "body",
+                        "name": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "required": ["tasks"],
+                            "properties": {
+                                "tasks": {
+                                    "type": "array",
+                                    "minItems": 1,
+                                    "maxItems": 1000,
+                                    "items": {
+                                        "type": "object",
+                                        "required": ["id", "title"],
+                                        "properties": {
+                                            "id": {"type": "string"},
+                                            "title": {
+                                                "type": "string",
+                                                "minLength": 1,
+                                                "maxLength": 100,
+                                            },
+                                            "description": {
+                                                "type": "string",
+                                                "maxLength": 500,
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Per-item results",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "results": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "id": {
+                                                "type": "string",
+                                                "x-nullable": True,
+                                            },
+                                            "status": {
+                                                "type": "integer",
+                                                "description": "Status the single-task endpoint would return, e.g. 201, 200, 400, 404",
+                                            },
+                                            "error": {
+                                                "type": "string",
+                                                "x-nullable": True,
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "400": {"description": "Invalid input or too many items"},
+                    "401": {"description": "Unauthorized"},
+                },
+            },
+            "delete": {
+                "tags": ["Tasks"],
+                "summary": "Delete tasks in bulk",
+                "description": "Deletes tasks owned by the authenticated user in one batch. "
+                "Each id gets its own result, in request order.",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "in": "body",
+                        "name": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "required": ["ids"],
+                            "properties": {
+                                "ids": {
+                                    "type": "array",
+                                    "minItems": 1,
+                                    "maxItems": 1000,
+                                    "items": {"type": "string"},
+                                },
+                            },
+                        },
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Per-item results",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "results": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "id": {
+                                                "type": "string",
+                                                "x-nullable": True,
+                                            },
+                                            "status": {
+                                                "type": "integer",
+                                                "description": "Status the single-task endpoint would return, e.g. 201, 200, 400, 404",
+                                            },
+                                            "error": {
+                                                "type": "string",
+                                                "x-nullable": True,
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "400": {"description": "Invalid input or too many items"},
+                    "401": {"description": "Unauthorized"},
+                },
+            },
+        },
+        "/tasks/bulk/status": {
+            "patch": {
+                "tags": ["Tasks"],
+                "summary": "Update task completion status in bulk",
+                "description": "Sets the completion status of tasks owned by the authenticated user in one batch. "
+                "Each item gets its own result, in request order.",
+                "security": [{"Bearer": []}],
+                "parameters": [
+                    {
+                        "in": "body",
+                        "name": "body",
+                        "required": True,
+                        "schema": {
+                            "type": "object",
+                            "required": ["tasks"],
+                            "properties": {
+                                "tasks": {
+                                    "type": "array",
+                                    "minItems": 1,
+                                    "maxItems": 1000,
+                                    "items": {
+                                        "type": "object",
+                                        "required": ["id", "completed"],
+                                        "properties": {
+                                            "id": {"type": "string"},
+                                            "completed": {"type": "boolean"},
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Per-item results",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "results": {
+                                    "type": "array",
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "id": {
+                                                "type": "string",
+                                                "x-nullable": True,
+                                            },
+                                            "status": {
+                                                "type": "integer",
+                                                "description": "Status the single-task endpoint would return, e.g. 201, 200, 400, 404",
+                                            },
+                                            "error": {
+                                                "type": "string",
+                                                "x-nullable": True,
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "400": {"description": "Invalid input or too many items"},
+                    "401": {"description": "Unauthorized"},
+                },
+            },
+        },
         "/tasks/{task_id}": {
             "parameters": [
                 {
@@ -361,7 +675,9 @@ swagger_config = {
                         },
                     },
                     "404": {"description": "Task not found"},
-                    "401": {"description": "Unauthorized or task belongs to another user"},
+                    "401": {
+                        "description": "Unauthorized or task belongs to another user"
+                    },
                 },
             },
             "put": {
@@ -400,7 +716,9 @@ swagger_config = {
                         },
                     },
                     "404": {"description": "Task not found"},
-                    "401": {"description": "Unauthorized or task belongs to another user"},
+                    "401": {
+                        "description": "Unauthorized or task belongs to another user"
+                    },
                     "400": {"description": "Invalid input"},
                 },
             },
@@ -418,7 +736,9 @@ swagger_config = {
                         },
                     },
                     "404": {"description": "Task not found"},
-                    "401": {"description": "Unauthorized or task belongs to another user"},
+                    "401": {
+                        "description": "Unauthorized or task belongs to another user"
+                    },
                 },
             },
         },
@@ -449,7 +769,7 @@ swagger_config = {
                                 "completed": {
                                     "type": "boolean",
                                     "example": True,
-                                    "description": "New completion status of the task"
+                                    "description": "New completion status of the task",
                                 }
                             },
                         },
@@ -464,7 +784,9 @@ swagger_config = {
                         },
                     },
                     "404": {"description": "Task not found"},
-                    "401": {"description": "Unauthorized or task belongs to another user"},
+                    "401": {
+                        "description": "Unauthorized or task belongs to another user"
+                    },
                     "400": {"description": "Invalid input"},
                 },
             },
@@ -481,10 +803,72 @@ swagger_config = {
                         "schema": {
                             "type": "object",
                             "properties": {
-                                "total_users": {"type": "integer", "description": "Total number of registered users"},
-                                "total_tasks": {"type": "integer", "description": "Total number of tasks in the system"},
-                                "completed_tasks": {"type": "integer", "description": "Number of completed tasks"},
-                                "active_tasks": {"type": "integer", "description": "Number of active (incomplete) tasks"},
+                                "total_users": {
+                                    "type": "integer",
+                                    "description": "Total number of registered users",
+                                },
+                                "total_tasks": {
+                                    "type": "integer",
+                                    "description": "Total number of tasks in the system",
+                                },
+                                "completed_tasks": {
+                                    "type": "integer",
+                                    "description": "Number of completed tasks",
+                                },
+                                "active_tasks": {
+                                    "type": "integer",
+                                    "description": "Number of active (incomplete) tasks",
+                                },
+                            },
+                        },
+                    },
+                    "401": {"description": "Unauthorized"},
+                    "500": {
+                        "description": "Internal server error",
+                        "schema": {
+                            "type": "object",
+                            "properties": {"error": {"type": "string"}},
+                        },
+                    },
+                },
+            }
+        },
+        "/metrics/runtime": {
+            "get": {
+                "tags": ["Metrics"],
+                "summary": "Get runtime metrics",
+                "description": "Returns in-process counters for the worker that served the request",
+                "security": [{"Bearer": []}],
+                "responses": {
+                    "200": {
+                        "description": "Runtime metrics retrieved successfully",
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "token_cache": {
+                                    "type": "object",
+                                    "description": "Verified-token cache hit, miss and eviction counters",
+                                },
+                                "password_hasher": {
+                                    "type": "object",
+                                    "description": "bcrypt pool queue wait and hash time",
+                                },
+                                "email_outbox": {
+                                    "type": "object",
+                                    "description": "Email outbox queue depth and enqueue-to-send latency",
+                                },
+                                "task_cache": {
+                                    "type": "object",
+                                    "description": "Task cache hit ratios for the in-process L1 and Redis L2, and list rebuild counters",
+                                },
+                                "cache_operations": {
+                                    "type": "object",
+                                    "description": "Task cache calls, hits, payload bytes and Redis latency per key family and operation",
+                                },
+                                "cache_prewarm": {
+                                    "type": "object",
+                                    "description": "Login-triggered task list prewarms queued, skipped and failed",
+                                },
                             },
                         },
                     },
@@ -0,0 +1,236 @@
+import json
+import zlib
+from typing import Optional
+import msgpack
+from ..models.task import Task
+
+
+COMPRESSED_FLAG = 0x80
+VERSION_MASK = 0x7F
+
+# Binary layout flags
+_COMPLETED = 0x01
+_HAS_DESCRIPTION = 0x02
+_ID_IS_OBJECT_ID = 0x04
+_USER_ID_IS_OBJECT_ID = 0x08
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cached payload cannot be decoded; callers treat it as a miss"""
+
+
+class TaskCodec:
+    """Encodes tasks for the Redis cache.
+
+    Every payload starts with a header byte holding the schema version, with
+    the top bit set when the body is zlib-compressed. Decoding dispatches on
+    that byte rather than on the configured codec, so during a rolling
+    deploy every worker reads whatever the others wrote.
+    """
+
+    name = ""
+    version = 0
+
+    def __init__(self, compress_threshold: int = 0):
+        self.compress_threshold = compress_threshold
+
+    def encode(self, task: Task) -> bytes:
+        body = self._encode_body(task)
+        header = self.version
+        if self.compress_threshold and len(body) > self.compress_threshold:
+            compressed = zlib.compress(body)
+            if len(compressed) < len(body):
+                body = compressed
+                header |= COMPRESSED_FLAG
+        return bytes((header,)) + body
+
+    def _encode_body(self, task: Task) -> bytes:
+        raise NotImplementedError
+
+    def _decode_body(self, body: bytes) -> Task:
+        raise NotImplementedError
+
+
+class JsonTaskCodec(TaskCodec):
+    name = "json"
+    version = 1
+
+    def _encode_body(self, task: Task) -> bytes:
+        return json.dumps({"id": task.id, **task.to_dict()}).encode()
+
+    def _decode_body(self, body: bytes) -> Task:
+        try:
+            return _task_from_data(json.loads(body))
+        except ValueError as e:
+            raise CacheCodecError(f"Corrupt JSON task payload: {str(e)}")
+
+
+class BinaryTaskCodec(TaskCodec):
+    """Length-prefixed fields, with ObjectId strings stored as their 12 raw bytes"""
+
+    name = "binary"
+    version = 2
+
+    def _encode_body(self, task: Task) -> bytes:
+        flags = _COMPLETED if task.completed else 0
+        parts = []
+        for value, object_id_flag in (
+            (task.id or "", _ID_IS_OBJECT_ID),
+            (task.user_id or "", _USER_ID_IS_OBJECT_ID),
+        ):
+            raw = _object_id_bytes(value)
+            if raw is not None:
+                flags |= object_id_flag
+                parts.append(raw)
+            else:
+                parts.append(_pack_str(value))
+        parts.append(_pack_str(task.title or ""))
+        if task.description is not None:
+            flags |= _HAS_DESCRIPTION
+            parts.append(_pack_str(task.description))
+        return bytes((flags,)) + b"".join(parts)
+
+    def _decode_body(self, body: bytes) -> Task:
+        try:
+            flags = body[0]
+            offset = 1
+            if flags & _ID_IS_OBJECT_ID:
+                task_id, offset = _unpack_object_id(body, offset)
+            else:
+                task_id, offset = _unpack_str(body, offset)
+            if flags & _USER_ID_IS_OBJECT_ID:
+                user_id, offset = _unpack_object_id(body, offset)
+            else:
+                user_id, offset = _unpack_str(body, offset)
+            title, offset = _unpack_str(body, offset)
+            description = None
+            if flags & _HAS_DESCRIPTION:
+                description, offset = _unpack_str(body, offset)
+        except (IndexError, UnicodeDecodeError) as e:
+            raise CacheCodecError(f"Corrupt binary task payload: {str(e)}")
+        return Task(
+            id=task_id or None,
+            title=title,
+            description=description,
+            user_id=user_id,
+            completed=bool(flags & _COMPLETED),
+        )
+
+
+class MsgpackTaskCodec(TaskCodec):
+    name = "msgpack"
+    version = 3
+
+    def _encode_body(self, task: Task) -> bytes:
+        return msgpack.packb(
+            [task.id, task.title, task.description, task.user_id, task.completed]
+        )
+
+    def _decode_body(self, body: bytes) -> Task:
+        try:
+            task_id, title, description, user_id, completed = msgpack.unpackb(body)
+        except (msgpack.UnpackException, ValueError, TypeError, KeyError) as e:
+            raise CacheCodecError(f"Corrupt msgpack task payload: {str(e)}")
+        return Task(
+            id=task_id,
+            title=title,
+            description=description,
+            user_id=user_id,
+            completed=completed,
+        )
+
+
+CODECS = {
+    codec.name: codec for codec in (JsonTaskCodec, BinaryTaskCodec, MsgpackTaskCodec)
+}
+_DECODERS = {codec.version: codec() for codec in CODECS.values()}
+
+
+def get_task_codec(name: str, compress_threshold: int = 0) -> TaskCodec:
+    if name not in CODECS:
+        raise ValueError(f"Unknown task cache codec: {name}")
+    return CODECS[name](compress_threshold=compress_threshold)
+
+
+def decode_task(payload: bytes) -> Task:
+    """Decode a payload written by any codec version"""
+    if not payload:
+        raise CacheCodecError("Empty task payload")
+    # Entries written before payloads were versioned are plain JSON objects
+    if payload[:1] == b"{":
+        try:
+            return _task_from_data(json.loads(payload))
+        except ValueError as e:
+            raise CacheCodecError(f"Corrupt JSON task payload: {str(e)}")
+
+    header = payload[0]
+    decoder: Optional[TaskCodec] = _DECODERS.get(header & VERSION_MASK)
+    if decoder is None:
+        raise CacheCodecError(f"Unknown task payload version: {header & VERSION_MASK}")
+    body = payload[1:]
+    if header & COMPRESSED_FLAG:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as e:
+            raise CacheCodecError(f"Corrupt compressed task payload: {str(e)}")
+    return decoder._decode_body(body)
+
+
+def _task_from_data(task_data: dict) -> Task:
+    return Task(
+        id=task_data.get("id"),
+        title=task_data.get("title"),
+        description=task_data.get("description"),
+        user_id=task_data.get("user_id"),
+        completed=task_data.get("completed", False),
+    )
+
+
+def _object_id_bytes(value: str) -> Optional[bytes]:
+    if len(value) != 24:
+        return None
+    try:
+        raw = bytes.fromhex(value)
+    except ValueError:
+        return None
+    # Only when decoding with bytes.hex() gives back the exact same string
+    return raw if raw.hex() == value else None
+
+
+def _pack_str(value: str) -> bytes:
+    data = value.encode()
+    length = len(data)
+    if length < 0x80:
+        return bytes((length,)) + data
+    prefix = bytearray()
+    while length >= 0x80:
+        prefix.append((length & 0x7F) | 0x80)
+        length >>= 7
+    prefix.append(length)
+    return bytes(prefix) + data
+
+
+def _unpack_object_id(body: bytes, offset: int) -> tuple[str, int]:
+    end = offset + 12
+    if end > len(body):
+        raise IndexError("ObjectId runs past end of payload")
+    return body[offset:end].hex(), end
+
+
+def _unpack_str(body: bytes, offset: int) -> tuple[str, int]:
+    length = body[offset]
+    offset += 1
+    if length >= 0x80:
+        length &= 0x7F
+        shift = 7
+        while True:
+            byte = body[offset]
+            offset += 1
+            length |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+    end = offset + length
+    if end > len(body):
+        raise IndexError("string runs past end of payload")
+    return body[offset:end].decode(), end
@@ -0,0 +1,22 @@
+import base64
+import binascii
+from typing import Optional
+from bson.objectid import ObjectId
+
+
+def encode_cursor(task_id: str) -> str:
+    """Opaque token for the page that starts after ``task_id``"""
+    return base64.urlsafe_b64encode(ObjectId(task_id).binary).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[str]:
+    """Return the task id a cursor points after, or None for the first page"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid cursor")
+    if len(raw) != 12:
+        raise ValueError("Invalid cursor")
+    return str(ObjectId(raw))
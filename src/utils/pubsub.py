@@ -0,0 +1,74 @@
+import threading
+from typing import Callable, Optional
+from redis import StrictRedis
+from .logger import setup_logger
+
+logger = setup_logger("pubsub")
+
+
+class InvalidationSubscriber:
+    """Background listener that hands every message on a Redis channel to a handler.
+
+    Messages published while the subscription is down are lost, so
+    ``on_reconnect`` is called each time the subscription is (re)established
+    to let the owner drop anything it may have missed.
+    """
+
+    def __init__(
+        self,
+        redis_client: StrictRedis,
+        channel: str,
+        handler: Callable[[bytes], None],
+        on_reconnect: Optional[Callable[[], None]] = None,
+        retry_delay: float = 1.0,
+    ):
+        self.redis_client = redis_client
+        self.channel = channel
+        self.handler = handler
+        self.on_reconnect = on_reconnect
+        self.retry_delay = retry_delay
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"subscriber:{self.channel}", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            pubsub = None
+            try:
+                pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                if self.on_reconnect:
+                    self.on_reconnect()
+                for message in pubsub.listen():
+                    if self._stopped.is_set():
+                        break
+                    if message and message.get("type") == "message":
+                        self._dispatch(message["data"])
+            except Exception as e:
+                logger.error(f"Subscription to {self.channel} failed: {str(e)}")
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            self._stopped.wait(self.retry_delay)
+
+    def _dispatch(self, data: bytes) -> None:
+        try:
+            self.handler(data)
+        except Exception as e:
+            logger.error(f"Error handling message on {self.channel}: {str(e)}")
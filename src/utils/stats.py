@@ -0,0 +1,129 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class LatencyRecorder:
+    """Thread-safe latency summary; percentiles cover the most recent samples."""
+
+    def __init__(self, max_samples: int = 1024):
+        self._samples: deque[float] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    @contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(time.perf_counter() - started)
+
+    @staticmethod
+    def _percentile(ordered: list[float], quantile: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[int(round(quantile * (len(ordered) - 1)))]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            ordered = sorted(self._samples)
+            return {
+                "count": self.count,
+                "avg_ms": (self.total / self.count) * 1000 if self.count else 0.0,
+                "p50_ms": self._percentile(ordered, 0.50) * 1000,
+                "p99_ms": self._percentile(ordered, 0.99) * 1000,
+                "max_ms": self.max * 1000,
+            }
+
+
+class CacheMetrics:
+    """Per key family and operation counters: calls, hits, bytes and latency.
+
+    ``log_snapshot`` emits the whole snapshot as one JSON log line, at most
+    once per ``log_interval`` seconds, so log pipelines can chart it too.
+    """
+
+    def __init__(self, log_interval: float = 60.0, max_samples: int = 1024):
+        self.log_interval = log_interval
+        self.max_samples = max_samples
+        self._operations: dict[tuple[str, str], dict] = {}
+        self._invalidations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._last_logged = time.monotonic()
+
+    def _operation(self, family: str, operation: str) -> dict:
+        key = (family, operation)
+        entry = self._operations.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._operations.setdefault(
+                    key,
+                    {
+                        "calls": 0,
+                        "hits": 0,
+                        "misses": 0,
+                        "bytes": 0,
+                        "latency": LatencyRecorder(self.max_samples),
+                    },
+                )
+        return entry
+
+    def record(
+        self,
+        family: str,
+        operation: str,
+        seconds: float,
+        hit: bool | None = None,
+        size: int = 0,
+    ) -> None:
+        entry = self._operation(family, operation)
+        entry["latency"].record(seconds)
+        with self._lock:
+            entry["calls"] += 1
+            entry["bytes"] += size
+            if hit is True:
+                entry["hits"] += 1
+            elif hit is False:
+                entry["misses"] += 1
+
+    def record_invalidation(self, family: str, count: int = 1) -> None:
+        with self._lock:
+            self._invalidations[family] = self._invalidations.get(family, 0) + count
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            operations = {key: dict(entry) for key, entry in self._operations.items()}
+            invalidations = dict(self._invalidations)
+        families: dict[str, dict] = {}
+        for (family, operation), entry in sorted(operations.items()):
+            lookups = entry["hits"] + entry["misses"]
+            families.setdefault(family, {})[operation] = {
+                "calls": entry["calls"],
+                "hits": entry["hits"],
+                "misses": entry["misses"],
+                "hit_ratio": entry["hits"] / lookups if lookups else 0.0,
+                "bytes": entry["bytes"],
+                "avg_bytes": entry["bytes"] / entry["calls"] if entry["calls"] else 0.0,
+                "latency": entry["latency"].snapshot(),
+            }
+        return {"families": families, "invalidations": invalidations}
+
+    def log_snapshot(self, logger) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_logged < self.log_interval:
+                return
+            self._last_logged = now
+        logger.info(json.dumps({"event": "cache_metrics", **self.snapshot()}))
@@ -89,6 +89,8 @@ def redis_client():
     mock = Mock()
     # Set up scan_iter to return empty list by default
     mock.scan_iter.return_value = []
+    # Set up smembers to return an empty session index by default
+    mock.smembers.return_value = set()
     # Set up get to return None by default
     mock.get.return_value = None
     return mock
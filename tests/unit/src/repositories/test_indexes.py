@@ -0,0 +1,169 @@
+from unittest.mock import MagicMock
+import pytest
+from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
+from src.repositories.indexes import (
+    IndexCheckError,
+    check_indexes,
+    create_missing_indexes,
+    diff_indexes,
+)
+
+
+def _db(indexes_by_collection):
+    collections = {}
+    for name, indexes in indexes_by_collection.items():
+        collection = MagicMock()
+        collection.index_information.return_value = indexes
+        collections[name] = collection
+    db = MagicMock()
+    db.get_collection.side_effect = lambda name: collections[name]
+    return db
+
+
+ID_INDEX = {"_id_": {"key": [("_id", 1)], "v": 2}}
+TASK_INDEX = {"user_id_1__id_1": {"key": [("user_id", 1), ("_id", 1)], "v": 2}}
+EMAIL_INDEX = {"email_1": {"key": [("email", 1)], "unique": True, "v": 2}}
+
+
+def _statuses(rows):
+    return {(row["collection"], row["name"]): row["status"] for row in rows}
+
+
+def test_diff_indexes_all_present():
+    # Arrange
+    db = _db(
+        {"tasks": {**ID_INDEX, **TASK_INDEX}, "users": {**ID_INDEX, **EMAIL_INDEX}}
+    )
+
+    # Act
+    rows = diff_indexes(db)
+
+    # Assert
+    assert _statuses(rows) == {
+        ("tasks", "user_id_1__id_1"): "ok",
+        ("users", "email_1"): "ok",
+    }
+
+
+def test_diff_indexes_reports_missing_conflicting_and_extra():
+    # Arrange - email is indexed but not unique; tasks has an old index only
+    db = _db(
+        {
+            "tasks": {**ID_INDEX, "title_1": {"key": [("title", 1)], "v": 2}},
+            "users": {**ID_INDEX, "email_1": {"key": [("email", 1)], "v": 2}},
+        }
+    )
+
+    # Act
+    rows = diff_indexes(db)
+
+    # Assert
+    assert _statuses(rows) == {
+        ("tasks", "user_id_1__id_1"): "missing",
+        ("tasks", "title_1"): "extra",
+        ("users", "email_1"): "conflict",
+    }
+
+
+def test_diff_indexes_matches_on_keys_not_name():
+    # Arrange
+    db = _db(
+        {
+            "tasks": {
+                **ID_INDEX,
+                "by_user": {"key": [("user_id", 1), ("_id", 1)], "v": 2},
+            },
+            "users": {**ID_INDEX, **EMAIL_INDEX},
+        }
+    )
+
+    # Act
+    rows = diff_indexes(db)
+
+    # Assert
+    assert _statuses(rows)[("tasks", "user_id_1__id_1")] == "ok"
+
+
+def test_create_missing_indexes_builds_only_missing():
+    # Arrange
+    db = _db({"tasks": dict(ID_INDEX), "users": {**ID_INDEX, **EMAIL_INDEX}})
+    tasks = db.get_collection("tasks")
+    tasks.create_indexes.side_effect = (
+        lambda models: tasks.index_information.return_value.update(TASK_INDEX)
+    )
+
+    # Act
+    rows = create_missing_indexes(db)
+
+    # Assert
+    (model,) = tasks.create_indexes.call_args.args[0]
+    assert model.document["name"] == "user_id_1__id_1"
+    db.get_collection("users").create_indexes.assert_not_called()
+    assert set(_statuses(rows).values()) == {"ok"}
+
+
+def test_create_missing_indexes_reports_failed_build():
+    # Arrange
+    db = _db({"tasks": {**ID_INDEX, **TASK_INDEX}, "users": dict(ID_INDEX)})
+    db.get_collection("users").create_indexes.side_effect = OperationFailure(
+        "E11000 duplicate key error"
+    )
+
+    # Act
+    rows = create_missing_indexes(db)
+
+    # Assert
+    (row,) = [row for row in rows if row["collection"] == "users"]
+    assert row["status"] == "failed"
+    assert "duplicate key" in row["detail"]
+
+
+def test_check_indexes_fail_mode_raises():
+    # Arrange
+    db = _db({"tasks": dict(ID_INDEX), "users": {**ID_INDEX, **EMAIL_INDEX}})
+
+    # Act & Assert
+    with pytest.raises(IndexCheckError, match="tasks.user_id_1__id_1"):
+        check_indexes(db, "fail")
+
+
+def test_check_indexes_warn_mode_logs():
+    # Arrange
+    db = _db({"tasks": dict(ID_INDEX), "users": {**ID_INDEX, **EMAIL_INDEX}})
+
+    # Act
+    rows = check_indexes(db, "warn")
+
+    # Assert
+    assert _statuses(rows)[("tasks", "user_id_1__id_1")] == "missing"
+
+
+def test_check_indexes_warn_mode_tolerates_unreachable_mongo():
+    # Arrange
+    db = MagicMock()
+    db.get_collection.return_value.index_information.side_effect = (
+        ServerSelectionTimeoutError("no servers")
+    )
+
+    # Act
+    rows = check_indexes(db, "warn")
+
+    # Assert
+    assert rows == []
+
+
+def test_check_indexes_off_mode_skips_mongo():
+    # Arrange
+    db = MagicMock()
+
+    # Act
+    check_indexes(db, "off")
+
+    # Assert
+    db.get_collection.assert_not_called()
+
+
+def test_check_indexes_unknown_mode():
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unknown index check mode"):
+        check_indexes(MagicMock(), "strict")
@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock
 import pytest
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 from src.repositories.task import TaskRepository
 from src.models.task import Task
 
@@ -56,7 +58,9 @@ def test_find_by_id_existing_task(task_repository, sample_task_dict, mock_collec
     assert isinstance(result, Task)
     assert result.title == sample_task_dict["title"]
     assert result.description == sample_task_dict["description"]
-    mock_collection.find_one.assert_called_once_with({"_id": ObjectId(task_id)})
+    mock_collection.find_one.assert_called_once_with(
+        {"_id": ObjectId(task_id)}, TaskRepository.TASK_PROJECTION
+    )
 
 
 def test_find_by_id_non_existing_task(task_repository, mock_collection):
@@ -69,7 +73,9 @@ def test_find_by_id_non_existing_task(task_repository, mock_collection):
 
     # Assert
     assert result is None
-    mock_collection.find_one.assert_called_once_with({"_id": ObjectId(task_id)})
+    mock_collection.find_one.assert_called_once_with(
+        {"_id": ObjectId(task_id)}, TaskRepository.TASK_PROJECTION
+    )
 
 
 def test_update_task(task_repository, sample_task, mock_collection):
@@ -108,4 +114,214 @@ def test_find_all_tasks(task_repository, sample_task_dict, mock_collection):
     assert all(isinstance(task, Task) for task in results)
     assert all(task.title == sample_task_dict["title"] for task in results)
     assert all(task.description == sample_task_dict["description"] for task in results)
-    mock_collection.find.assert_called_once_with({})
+    mock_collection.find.assert_called_once_with({}, TaskRepository.TASK_PROJECTION)
+
+
+def test_find_all_with_projection(task_repository, mock_collection):
+    # Arrange
+    mock_collection.find.return_value = [
+        {"_id": ObjectId("507f1f77bcf86cd799439011"), "completed": True}
+    ]
+
+    # Act
+    results = task_repository.find_all(projection=TaskRepository.STATUS_PROJECTION)
+
+    # Assert
+    assert results[0].completed is True
+    assert results[0].title is None
+    mock_collection.find.assert_called_once_with({}, {"completed": 1})
+
+
+def test_find_recent_user_ids(task_repository, mock_collection):
+    # Arrange
+    mock_collection.aggregate.return_value = [{"_id": "user2"}, {"_id": "user1"}]
+
+    # Act
+    result = task_repository.find_recent_user_ids(2)
+
+    # Assert
+    assert result == ["user2", "user1"]
+    pipeline = mock_collection.aggregate.call_args.args[0]
+    assert {"$limit": 2} in pipeline
+
+
+def test_iter_by_user_ids(task_repository, sample_task_dict, mock_collection):
+    # Arrange
+    cursor = mock_collection.find.return_value.batch_size.return_value
+    cursor.__iter__.return_value = iter([{**sample_task_dict, "user_id": "user1"}])
+
+    # Act
+    result = list(task_repository.iter_by_user_ids(["user1"], 50))
+
+    # Assert
+    assert [task.user_id for task in result] == ["user1"]
+    mock_collection.find.assert_called_once_with(
+        {"user_id": {"$in": ["user1"]}}, TaskRepository.TASK_PROJECTION
+    )
+    mock_collection.find.return_value.batch_size.assert_called_once_with(50)
+
+
+def test_find_page_by_user_id(task_repository, sample_task_dict, mock_collection):
+    # Arrange
+    after_id = "507f1f77bcf86cd799439011"
+    cursor = mock_collection.find.return_value.sort.return_value.limit.return_value
+    cursor.__iter__.return_value = iter([sample_task_dict])
+
+    # Act
+    result = task_repository.find_page_by_user_id("user1", after_id, 51)
+
+    # Assert
+    assert [task.title for task in result] == ["Test Task"]
+    mock_collection.find.assert_called_once_with(
+        {"user_id": "user1", "_id": {"$gt": ObjectId(after_id)}},
+        TaskRepository.TASK_PROJECTION,
+    )
+    mock_collection.find.return_value.sort.assert_called_once_with("_id", 1)
+    mock_collection.find.return_value.sort.return_value.limit.assert_called_once_with(
+        51
+    )
+
+
+def test_find_page_by_user_id_first_page(task_repository, mock_collection):
+    # Act
+    task_repository.find_page_by_user_id("user1", None, 10)
+
+    # Assert
+    mock_collection.find.assert_called_once_with(
+        {"user_id": "user1"}, TaskRepository.TASK_PROJECTION
+    )
+
+
+def test_find_by_user_id_projects_rendered_fields(task_repository, mock_collection):
+    # Act
+    task_repository.find_by_user_id("user1")
+
+    # Assert
+    mock_collection.find.assert_called_once_with(
+        {"user_id": "user1"},
+        {"title": 1, "description": 1, "user_id": 1, "completed": 1},
+    )
+
+
+def test_update_owned_filters_on_owner(
+    task_repository, sample_task_dict, mock_collection
+):
+    # Arrange
+    task_id = str(sample_task_dict["_id"])
+    mock_collection.find_one_and_update.return_value = {
+        **sample_task_dict,
+        "completed": True,
+    }
+
+    # Act
+    result = task_repository.update_owned(task_id, "user1", {"completed": True})
+
+    # Assert
+    assert result.completed is True
+    assert result.id == task_id
+    query, update = mock_collection.find_one_and_update.call_args.args
+    assert query == {"_id": ObjectId(task_id), "user_id": "user1"}
+    assert update == {"$set": {"completed": True}}
+    assert (
+        mock_collection.find_one_and_update.call_args.kwargs["return_document"]
+        == ReturnDocument.AFTER
+    )
+    assert (
+        mock_collection.find_one_and_update.call_args.kwargs["projection"]
+        == TaskRepository.TASK_PROJECTION
+    )
+
+
+def test_update_owned_no_match(task_repository, mock_collection):
+    # Arrange
+    mock_collection.find_one_and_update.return_value = None
+
+    # Act
+    result = task_repository.update_owned(
+        "507f1f77bcf86cd799439011", "user1", {"title": "T"}
+    )
+
+    # Assert
+    assert result is None
+
+
+def test_delete_owned(task_repository, mock_collection):
+    # Arrange
+    task_id = "507f1f77bcf86cd799439011"
+    mock_collection.delete_one.return_value.deleted_count = 0
+
+    # Act
+    deleted = task_repository.delete_owned(task_id, "user1")
+
+    # Assert
+    assert deleted is False
+    mock_collection.delete_one.assert_called_once_with(
+        {"_id": ObjectId(task_id), "user_id": "user1"}
+    )
+
+
+def test_exists(task_repository, mock_collection):
+    # Arrange
+    task_id = "507f1f77bcf86cd799439011"
+    mock_collection.count_documents.return_value = 1
+
+    # Act & Assert
+    assert task_repository.exists(task_id) is True
+    mock_collection.count_documents.assert_called_once_with(
+        {"_id": ObjectId(task_id)}, limit=1
+    )
+
+
+def test_find_owners(task_repository, mock_collection):
+    # Arrange
+    task_id = "507f1f77bcf86cd799439011"
+    mock_collection.find.return_value = [{"_id": ObjectId(task_id), "user_id": "user1"}]
+
+    # Act
+    owners = task_repository.find_owners([task_id, "507f1f77bcf86cd799439012"])
+
+    # Assert
+    assert owners == {task_id: "user1"}
+    query, projection = mock_collection.find.call_args.args
+    assert len(query["_id"]["$in"]) == 2
+    assert projection == {"user_id": 1}
+
+
+def test_bulk_create_assigns_ids(task_repository, sample_task, mock_collection):
+    # Act
+    task_ids, errors = task_repository.bulk_create([sample_task, sample_task])
+
+    # Assert
+    operations = mock_collection.bulk_write.call_args.args[0]
+    assert [str(operation._doc["_id"]) for operation in operations] == task_ids
+    assert operations[0]._doc["title"] == sample_task.title
+    assert mock_collection.bulk_write.call_args.kwargs == {"ordered": False}
+    assert errors == {}
+
+
+def test_bulk_update_owned_reports_failed_items(task_repository, mock_collection):
+    # Arrange
+    task_id = "507f1f77bcf86cd799439011"
+    mock_collection.bulk_write.side_effect = BulkWriteError(
+        {"writeErrors": [{"index": 1, "errmsg": "Document failed validation"}]}
+    )
+
+    # Act
+    errors = task_repository.bulk_update_owned(
+        [(task_id, {"completed": True}), (task_id, {"title": "T"})], "user1"
+    )
+
+    # Assert
+    assert errors == {1: "Document failed validation"}
+    operations = mock_collection.bulk_write.call_args.args[0]
+    assert operations[0]._filter == {"_id": ObjectId(task_id), "user_id": "user1"}
+    assert operations[0]._doc == {"$set": {"completed": True}}
+
+
+def test_bulk_delete_owned_skips_empty_batch(task_repository, mock_collection):
+    # Act
+    errors = task_repository.bulk_delete_owned([], "user1")
+
+    # Assert
+    assert errors == {}
+    mock_collection.bulk_write.assert_not_called()
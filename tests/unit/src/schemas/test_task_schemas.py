@@ -0,0 +1,41 @@
+import pytest
+from pydantic import ValidationError
+from src.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkStatusUpdate,
+    TaskBulkUpdate,
+)
+
+ITEMS = {
+    TaskBulkCreate: ("tasks", {"title": "T", "description": "d"}),
+    TaskBulkUpdate: ("tasks", {"id": "507f1f77bcf86cd799439011", "title": "T"}),
+    TaskBulkStatusUpdate: (
+        "tasks",
+        {"id": "507f1f77bcf86cd799439011", "completed": True},
+    ),
+    TaskBulkDelete: ("ids", "507f1f77bcf86cd799439011"),
+}
+
+
+@pytest.mark.parametrize("schema", list(ITEMS))
+def test_bulk_schema_rejects_oversized_body(schema):
+    # Arrange
+    field, item = ITEMS[schema]
+
+    # Act & Assert
+    with pytest.raises(ValidationError) as error:
+        schema(**{field: [item] * 1001})
+    assert [e["type"] for e in error.value.errors()] == ["too_long"]
+
+
+@pytest.mark.parametrize("schema", list(ITEMS))
+def test_bulk_schema_accepts_max_items(schema):
+    # Arrange
+    field, item = ITEMS[schema]
+
+    # Act
+    body = schema(**{field: [item] * 1000})
+
+    # Assert
+    assert len(getattr(body, field)) == 1000
@@ -2,10 +2,13 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 import json
+import fakeredis
 from jose import jwt
+from pymongo.errors import DuplicateKeyError
 
 from src.config import Config
 from src.services.auth import AuthService
+from src.services.login_throttle import LoginThrottledError
 from src.models.user import User
 
 
@@ -19,6 +22,8 @@ def redis_client():
     mock = Mock()
     # Set up scan_iter to return empty list by default
     mock.scan_iter.return_value = []
+    # Set up smembers to return an empty session index by default
+    mock.smembers.return_value = set()
     # Set up get to return None by default
     mock.get.return_value = None
     return mock
@@ -34,6 +39,13 @@ def auth_service(user_repository, redis_client, email_service):
     return AuthService(user_repository, redis_client, email_service)
 
 
+@pytest.fixture
+def legacy_session_keys():
+    # Tokens built without a jti are only accepted with legacy keys enabled
+    with patch.object(Config, "SESSION_LEGACY_KEYS_ENABLED", True):
+        yield
+
+
 @pytest.fixture
 def test_user():
     return User(
@@ -72,6 +84,20 @@ def test_register_existing_email(auth_service, user_repository, test_user):
         )
 
 
+def test_register_concurrent_duplicate_email(auth_service, user_repository):
+    # Arrange - Another registration inserted the email after the lookup
+    user_repository.find_by_email.return_value = None
+    user_repository.create.side_effect = DuplicateKeyError("E11000 duplicate key error")
+
+    # Act & Assert
+    with patch("bcrypt.hashpw", return_value=b"hashed"), pytest.raises(
+        ValueError, match="Email already registered"
+    ):
+        auth_service.register(
+            username="new_user", email="test@example.com", password="password123"
+        )
+
+
 def test_authenticate_success(auth_service, user_repository, test_user, redis_client):
     # Arrange
     user_repository.find_by_email.return_value = test_user
@@ -142,34 +168,55 @@ def test_create_tokens(auth_service, test_user, redis_client):
     assert decoded_refresh["email"] == test_user.email
     assert decoded_refresh["type"] == "refresh"
 
-    # Verify tokens are stored in Redis
-    redis_client.setex.assert_any_call(
-        f"token:{token_data['access_token']}",
+    # Verify tokens are stored in Redis under their jti with a compact payload
+    session = json.dumps(
+        [test_user.id, test_user.email, test_user.username], separators=(",", ":")
+    )
+    access_key = f"at:{decoded_access['jti']}"
+    refresh_key = f"rt:{decoded_refresh['jti']}"
+    pipe = redis_client.pipeline.return_value
+    pipe.setex.assert_any_call(
+        access_key,
         Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        json.dumps({"user_id": test_user.id, "email": test_user.email, "username": test_user.username}),
+        session,
     )
 
-    redis_client.setex.assert_any_call(
-        f"refresh:{token_data['refresh_token']}",
+    # The refresh session also names its paired access token
+    pipe.setex.assert_any_call(
+        refresh_key,
         7 * 24 * 60 * 60,  # 7 days in seconds
-        json.dumps({"user_id": test_user.id, "email": test_user.email, "username": test_user.username}),
+        json.dumps(
+            [test_user.id, test_user.email, test_user.username, access_key],
+            separators=(",", ":"),
+        ),
+    )
+
+    # Verify tokens are registered in the user's session index
+    pipe.sadd.assert_called_once_with(
+        f"user_sessions:{test_user.id}", access_key, refresh_key
+    )
+    pipe.expire.assert_called_once_with(
+        f"user_sessions:{test_user.id}", 7 * 24 * 60 * 60
     )
+    pipe.execute.assert_called_once()
 
 
-def test_refresh_access_token_success(auth_service, test_user, redis_client):
+def test_refresh_access_token_success(
+    auth_service, test_user, redis_client, legacy_session_keys
+):
     # Arrange
     refresh_token = jwt.encode(
         {
             "sub": test_user.id,
             "email": test_user.email,
             "exp": datetime.utcnow() + timedelta(days=7),
-            "type": "refresh"
+            "type": "refresh",
         },
         Config.JWT_SECRET_KEY,
         algorithm=Config.JWT_ALGORITHM,
     )
 
-    # Mock Redis to return user data for the refresh token
+    # Mock the rotation script to return the session stored for the refresh token
     cached_data = json.dumps(
         {
             "user_id": test_user.id,
@@ -177,10 +224,8 @@ def test_refresh_access_token_success(auth_service, test_user, redis_client):
             "username": test_user.username,
         }
     ).encode("utf-8")
-    redis_client.get.return_value = cached_data
-
-    # Set up user repository to return the user
-    auth_service.user_repository.find_by_id.return_value = test_user
+    rotate_script = redis_client.register_script.return_value
+    rotate_script.return_value = [cached_data, b""]
 
     # Act
     result = auth_service.refresh_access_token(refresh_token)
@@ -190,6 +235,9 @@ def test_refresh_access_token_success(auth_service, test_user, redis_client):
     assert "access_token" in result
     assert "refresh_token" in result
     assert "expires_in" in result
+    assert result["user"].id == test_user.id
+    assert result["user"].username == test_user.username
+    auth_service.user_repository.find_by_id.assert_not_called()
 
     # Verify new tokens
     decoded_access = jwt.decode(
@@ -200,6 +248,99 @@ def test_refresh_access_token_success(auth_service, test_user, redis_client):
     assert decoded_access["sub"] == test_user.id
     assert decoded_access["type"] == "access"
 
+    # Verify the old token is redeemed and the new pair stored in one call
+    rotate_script.assert_called_once()
+    new_refresh = jwt.decode(
+        result["refresh_token"],
+        Config.JWT_SECRET_KEY,
+        algorithms=[Config.JWT_ALGORITHM],
+    )
+    keys = rotate_script.call_args.kwargs["keys"]
+    assert keys == [
+        # Issued without jti, so stored under the legacy key
+        f"refresh:{refresh_token}",
+        f"at:{decoded_access['jti']}",
+        f"rt:{new_refresh['jti']}",
+        f"user_sessions:{test_user.id}",
+    ]
+
+
+def test_refresh_rotation_script_redeems_once(
+    user_repository, email_service, test_user
+):
+    # Arrange - The real script, run by fakeredis
+    redis_client = fakeredis.FakeStrictRedis()
+    auth_service = AuthService(user_repository, redis_client, email_service)
+    user_repository.find_by_id.return_value = test_user
+    tokens = auth_service.create_tokens(test_user)
+    old_refresh_jti = jwt.decode(
+        tokens["refresh_token"],
+        Config.JWT_SECRET_KEY,
+        algorithms=[Config.JWT_ALGORITHM],
+    )["jti"]
+
+    # Act
+    rotated = auth_service.refresh_access_token(tokens["refresh_token"])
+    replayed = auth_service.refresh_access_token(tokens["refresh_token"])
+
+    # Assert
+    assert rotated["user"].id == test_user.id
+    assert replayed is None
+    new_refresh_jti = jwt.decode(
+        rotated["refresh_token"],
+        Config.JWT_SECRET_KEY,
+        algorithms=[Config.JWT_ALGORITHM],
+    )["jti"]
+    index = redis_client.smembers(f"user_sessions:{test_user.id}")
+    assert f"rt:{old_refresh_jti}".encode() not in index
+    assert f"rt:{new_refresh_jti}".encode() in index
+    assert not redis_client.exists(f"rt:{old_refresh_jti}")
+    assert redis_client.ttl(f"rt:{new_refresh_jti}") > 0
+    assert auth_service.validate_token(rotated["access_token"]).id == test_user.id
+
+
+def test_repeated_refreshes_keep_only_the_live_pair_indexed(
+    user_repository, email_service, test_user
+):
+    # Arrange
+    redis_client = fakeredis.FakeStrictRedis()
+    auth_service = AuthService(user_repository, redis_client, email_service)
+    tokens = auth_service.create_tokens(test_user)
+    first_access_token = tokens["access_token"]
+
+    # Act
+    for _ in range(5):
+        tokens = auth_service.refresh_access_token(tokens["refresh_token"])
+
+    # Assert
+    index = redis_client.smembers(f"user_sessions:{test_user.id}")
+    assert len(index) == 2
+    assert all(redis_client.exists(key) for key in index)
+    assert tokens["user"].username == test_user.username
+    assert auth_service.validate_token(first_access_token) is None
+
+
+def test_refresh_access_token_already_used(auth_service, test_user, redis_client):
+    # Arrange
+    refresh_token = jwt.encode(
+        {
+            "sub": test_user.id,
+            "email": test_user.email,
+            "exp": datetime.utcnow() + timedelta(days=7),
+            "type": "refresh",
+        },
+        Config.JWT_SECRET_KEY,
+        algorithm=Config.JWT_ALGORITHM,
+    )
+    # The script finds no stored session once the token has been rotated
+    redis_client.register_script.return_value.return_value = None
+
+    # Act
+    result = auth_service.refresh_access_token(refresh_token)
+
+    # Assert
+    assert result is None
+
 
 def test_refresh_access_token_invalid_token(auth_service, redis_client):
     # Act
@@ -216,7 +357,7 @@ def test_refresh_access_token_wrong_type(auth_service, test_user, redis_client):
             "sub": test_user.id,
             "email": test_user.email,
             "exp": datetime.utcnow() + timedelta(days=7),
-            "type": "access"  # Wrong type
+            "type": "access",  # Wrong type
         },
         Config.JWT_SECRET_KEY,
         algorithm=Config.JWT_ALGORITHM,
@@ -236,7 +377,7 @@ def test_refresh_access_token_expired(auth_service, test_user):
             "sub": test_user.id,
             "email": test_user.email,
             "exp": datetime.utcnow() - timedelta(days=1),
-            "type": "refresh"
+            "type": "refresh",
         },
         Config.JWT_SECRET_KEY,
         algorithm=Config.JWT_ALGORITHM,
@@ -249,14 +390,17 @@ def test_refresh_access_token_expired(auth_service, test_user):
     assert result is None
 
 
-def test_validate_token_success(auth_service, user_repository, test_user, redis_client):
+def test_validate_token_success(
+    auth_service, user_repository, test_user, redis_client, legacy_session_keys
+):
     # Arrange
     token = jwt.encode(
         {
             "sub": test_user.id,
             "email": test_user.email,
-            "exp": datetime.utcnow() + timedelta(minutes=Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES),
-            "type": "access"
+            "exp": datetime.utcnow()
+            + timedelta(minutes=Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES),
+            "type": "access",
         },
         Config.JWT_SECRET_KEY,
         algorithm=Config.JWT_ALGORITHM,
@@ -288,7 +432,7 @@ def test_validate_token_expired(auth_service, redis_client):
             "sub": "test_id",
             "email": "test@example.com",
             "exp": datetime.utcnow() - timedelta(minutes=1),
-            "type": "access"
+            "type": "access",
         },
         Config.JWT_SECRET_KEY,
         algorithm=Config.JWT_ALGORITHM,
@@ -315,67 +459,34 @@ def test_validate_token_invalid(auth_service, redis_client):
 
 def test_cleanup_previous_tokens(auth_service, redis_client, test_user):
     # Arrange
-    # Mock Redis to return both access and refresh tokens
-    token1 = "token:123"
-    token2 = "token:456"
-    refresh1 = "refresh:789"
-    refresh2 = "refresh:012"
-    redis_client.scan_iter.side_effect = [
-        [token1, token2],  # First call for access tokens
-        [refresh1, refresh2]  # Second call for refresh tokens
-    ]
+    # Mock the user's session index to return both access and refresh tokens
+    redis_client.smembers.return_value = {b"token:123", b"refresh:789"}
 
-    # Setup mock data for each token
-    token1_data = json.dumps(
-        {
-            "user_id": test_user.id,
-            "email": test_user.email,
-            "username": test_user.username,
-        }
-    ).encode("utf-8")
-    token2_data = json.dumps(
-        {
-            "user_id": "other_user_id",
-            "email": "other@example.com",
-            "username": "other_user",
-        }
-    ).encode("utf-8")
-    refresh1_data = json.dumps(
-        {
-            "user_id": test_user.id,
-            "email": test_user.email,
-            "username": test_user.username,
-        }
-    ).encode("utf-8")
-    refresh2_data = json.dumps(
-        {
-            "user_id": "other_user_id",
-            "email": "other@example.com",
-            "username": "other_user",
-        }
-    ).encode("utf-8")
+    # Act
+    auth_service._cleanup_previous_tokens(test_user.id)
+
+    # Assert
+    # Should only look at the user's own index, never the whole keyspace
+    redis_client.scan_iter.assert_not_called()
+    redis_client.get.assert_not_called()
+    redis_client.smembers.assert_called_once_with(f"user_sessions:{test_user.id}")
+    args = redis_client.delete.call_args[0]
+    assert args[0] == f"user_sessions:{test_user.id}"
+    assert set(args[1:]) == {"token:123", "refresh:789"}
+    assert redis_client.delete.call_count == 1
 
-    def mock_get(key):
-        if key == token1:
-            return token1_data
-        if key == token2:
-            return token2_data
-        if key == refresh1:
-            return refresh1_data
-        if key == refresh2:
-            return refresh2_data
-        return None
 
-    redis_client.get.side_effect = mock_get
+def test_logout_all(auth_service, redis_client, test_user):
+    # Arrange
+    redis_client.smembers.return_value = {b"token:123"}
 
     # Act
-    auth_service._cleanup_previous_tokens(test_user.id)
+    auth_service.logout_all(test_user.id)
 
     # Assert
-    # Should only delete tokens belonging to test_user
-    redis_client.delete.assert_any_call(token1)
-    redis_client.delete.assert_any_call(refresh1)
-    assert redis_client.delete.call_count == 2
+    redis_client.delete.assert_called_once_with(
+        f"user_sessions:{test_user.id}", "token:123"
+    )
 
 
 def test_logout_success(auth_service, redis_client):
@@ -385,7 +496,7 @@ def test_logout_success(auth_service, redis_client):
             "sub": "test_id",
             "email": "test@example.com",
             "exp": datetime.utcnow() + timedelta(minutes=15),
-            "type": "access"
+            "type": "access",
         },
         Config.JWT_SECRET_KEY,
         algorithm=Config.JWT_ALGORITHM,
@@ -397,8 +508,76 @@ def test_logout_success(auth_service, redis_client):
     # Assert
     assert result is True
     # Verify cleanup was called
-    redis_client.scan_iter.assert_any_call("token:*")
-    redis_client.scan_iter.assert_any_call("refresh:*")
+    redis_client.smembers.assert_called_once_with("user_sessions:test_id")
+    redis_client.scan_iter.assert_not_called()
+
+
+def test_logout_revokes_presented_legacy_session(
+    auth_service, redis_client, legacy_session_keys
+):
+    # Arrange - A token issued before the session index existed
+    token = jwt.encode(
+        {
+            "sub": "test_id",
+            "email": "test@example.com",
+            "exp": datetime.utcnow() + timedelta(minutes=15),
+            "type": "access",
+        },
+        Config.JWT_SECRET_KEY,
+        algorithm=Config.JWT_ALGORITHM,
+    )
+
+    # Act
+    auth_service.logout(token)
+
+    # Assert
+    args = redis_client.delete.call_args[0]
+    assert args[0] == "user_sessions:test_id"
+    assert f"token:{token}" in args[1:]
+
+
+def test_cleanup_never_scans_the_keyspace(user_repository, email_service, test_user):
+    # Arrange - A fresh Redis holding many other users' sessions
+    redis_client = fakeredis.FakeStrictRedis()
+    auth_service = AuthService(user_repository, redis_client, email_service)
+    for i in range(50):
+        auth_service.create_tokens(
+            User(id=f"other{i}", username="u", email="o@example.com", password="x")
+        )
+    tokens = auth_service.create_tokens(test_user)
+
+    # Act
+    with patch.object(
+        redis_client, "scan_iter", side_effect=AssertionError
+    ), patch.object(Config, "SESSION_LEGACY_KEYS_ENABLED", True):
+        auth_service.logout(tokens["access_token"])
+
+    # Assert
+    assert not redis_client.exists(f"user_sessions:{test_user.id}")
+    assert redis_client.exists("user_sessions:other0")
+
+
+def test_migrated_legacy_sessions_are_revoked_by_logout(user_repository, email_service):
+    # Arrange
+    redis_client = fakeredis.FakeStrictRedis()
+    auth_service = AuthService(user_repository, redis_client, email_service)
+    legacy = json.dumps({"user_id": "test_id", "email": "test@example.com"})
+    redis_client.setex("token:old-access", 300, legacy)
+    redis_client.setex("refresh:old-refresh", 3600, legacy)
+    redis_client.setex("token:other-user", 300, json.dumps({"user_id": "other"}))
+    tokens = auth_service.create_tokens(
+        User(id="test_id", username="u", email="test@example.com", password="x")
+    )
+
+    # Act
+    migrated = auth_service.migrate_legacy_sessions(batch_size=2)
+    with patch.object(redis_client, "scan_iter", side_effect=AssertionError):
+        auth_service.logout(tokens["access_token"])
+
+    # Assert
+    assert migrated == 3
+    assert not redis_client.exists("token:old-access", "refresh:old-refresh")
+    assert redis_client.exists("token:other-user")
 
 
 def test_logout_token_not_found(auth_service, redis_client):
@@ -412,3 +591,264 @@ def test_logout_token_not_found(auth_service, redis_client):
     # Assert
     assert result is False
     redis_client.delete.assert_called_once_with(f"token:{token}")
+
+
+def test_validate_token_uses_token_cache(
+    user_repository, redis_client, email_service, test_user
+):
+    # Arrange
+    token_cache = Mock()
+    token_cache.get.return_value = test_user
+    auth_service = AuthService(
+        user_repository, redis_client, email_service, token_cache
+    )
+
+    # Act
+    validated_user = auth_service.validate_token("cached_token")
+
+    # Assert
+    assert validated_user == test_user
+    redis_client.get.assert_not_called()
+    user_repository.find_by_id.assert_not_called()
+
+
+def test_validate_token_populates_token_cache(
+    user_repository, redis_client, email_service, test_user, legacy_session_keys
+):
+    # Arrange
+    token_cache = Mock()
+    token_cache.get.return_value = None
+    auth_service = AuthService(
+        user_repository, redis_client, email_service, token_cache
+    )
+    exp = datetime.utcnow() + timedelta(minutes=5)
+    token = jwt.encode(
+        {"sub": test_user.id, "email": test_user.email, "exp": exp, "type": "access"},
+        Config.JWT_SECRET_KEY,
+        algorithm=Config.JWT_ALGORITHM,
+    )
+    redis_client.get.return_value = json.dumps({"user_id": test_user.id}).encode(
+        "utf-8"
+    )
+    user_repository.find_by_id.return_value = test_user
+
+    # Act
+    auth_service.validate_token(token)
+
+    # Assert
+    token_cache.set.assert_called_once()
+    args = token_cache.set.call_args[0]
+    assert args[:2] == (token, test_user)
+    assert args[3] == f"token:{token}"
+
+
+def test_cleanup_previous_tokens_revokes_cached_tokens(
+    user_repository, redis_client, email_service, test_user
+):
+    # Arrange
+    token_cache = Mock()
+    auth_service = AuthService(
+        user_repository, redis_client, email_service, token_cache
+    )
+    redis_client.smembers.return_value = {b"at:abc", b"token:legacy", b"rt:def"}
+
+    # Act
+    auth_service._cleanup_previous_tokens(test_user.id)
+
+    # Assert
+    assert sorted(token_cache.revoke.call_args[0][0]) == ["at:abc", "token:legacy"]
+
+
+def test_validate_token_claims_mode_skips_user_lookup(
+    auth_service, user_repository, test_user, redis_client, legacy_session_keys
+):
+    # Arrange
+    token = jwt.encode(
+        {
+            "sub": test_user.id,
+            "email": test_user.email,
+            "exp": datetime.utcnow() + timedelta(minutes=5),
+            "type": "access",
+        },
+        Config.JWT_SECRET_KEY,
+        algorithm=Config.JWT_ALGORITHM,
+    )
+    redis_client.get.return_value = json.dumps(
+        {
+            "user_id": test_user.id,
+            "email": test_user.email,
+            "username": test_user.username,
+        }
+    ).encode("utf-8")
+
+    # Act
+    with patch.object(Config, "AUTH_IDENTITY_MODE", "claims"):
+        validated_user = auth_service.validate_token(token)
+
+    # Assert
+    user_repository.find_by_id.assert_not_called()
+    assert validated_user.id == test_user.id
+    assert validated_user.email == test_user.email
+    assert validated_user.username == test_user.username
+    assert validated_user.password is None
+
+
+def test_authenticate_rehashes_outdated_hash(
+    user_repository, redis_client, email_service, test_user
+):
+    # Arrange
+    password_hasher = Mock()
+    password_hasher.verify.return_value = True
+    password_hasher.needs_rehash.return_value = True
+    password_hasher.hash.return_value = "new_hash"
+    auth_service = AuthService(
+        user_repository, redis_client, email_service, password_hasher=password_hasher
+    )
+    user_repository.find_by_email.return_value = test_user
+
+    # Act
+    authenticated_user = auth_service.authenticate(test_user.email, "correct_password")
+
+    # Assert
+    assert authenticated_user.password == "new_hash"
+    user_repository.update.assert_called_once_with(test_user.id, test_user)
+
+
+def test_authenticate_keeps_current_hash(
+    user_repository, redis_client, email_service, test_user
+):
+    # Arrange
+    password_hasher = Mock()
+    password_hasher.verify.return_value = True
+    password_hasher.needs_rehash.return_value = False
+    auth_service = AuthService(
+        user_repository, redis_client, email_service, password_hasher=password_hasher
+    )
+    user_repository.find_by_email.return_value = test_user
+
+    # Act
+    auth_service.authenticate(test_user.email, "correct_password")
+
+    # Assert
+    password_hasher.hash.assert_not_called()
+    user_repository.update.assert_not_called()
+
+
+def test_validate_token_reads_compact_session(
+    auth_service, user_repository, test_user, redis_client
+):
+    # Arrange
+    token_data = auth_service.create_tokens(test_user)
+    decoded = jwt.decode(
+        token_data["access_token"],
+        Config.JWT_SECRET_KEY,
+        algorithms=[Config.JWT_ALGORITHM],
+    )
+    redis_client.get.return_value = json.dumps(
+        [test_user.id, test_user.email, test_user.username]
+    ).encode("utf-8")
+    user_repository.find_by_id.return_value = test_user
+
+    # Act
+    validated_user = auth_service.validate_token(token_data["access_token"])
+
+    # Assert
+    assert validated_user == test_user
+    redis_client.get.assert_called_once_with(f"at:{decoded['jti']}")
+    user_repository.find_by_id.assert_called_once_with(test_user.id)
+
+
+def test_validate_token_rejects_legacy_session_after_migration(
+    auth_service, test_user, redis_client
+):
+    # Arrange - A token issued before jti was introduced
+    token = jwt.encode(
+        {
+            "sub": test_user.id,
+            "email": test_user.email,
+            "exp": datetime.utcnow() + timedelta(minutes=5),
+            "type": "access",
+        },
+        Config.JWT_SECRET_KEY,
+        algorithm=Config.JWT_ALGORITHM,
+    )
+
+    # Act
+    with patch.object(Config, "SESSION_LEGACY_KEYS_ENABLED", False):
+        validated_user = auth_service.validate_token(token)
+
+    # Assert
+    assert validated_user is None
+    redis_client.get.assert_not_called()
+
+
+def test_authenticate_throttled_skips_password_check(
+    user_repository, redis_client, email_service, test_user
+):
+    # Arrange
+    password_hasher = Mock()
+    login_throttle = Mock()
+    login_throttle.check.side_effect = LoginThrottledError(30)
+    auth_service = AuthService(
+        user_repository,
+        redis_client,
+        email_service,
+        password_hasher=password_hasher,
+        login_throttle=login_throttle,
+    )
+
+    # Act & Assert
+    with pytest.raises(LoginThrottledError):
+        auth_service.authenticate(test_user.email, "guess", client_ip="10.0.0.1")
+    user_repository.find_by_email.assert_not_called()
+    password_hasher.verify.assert_not_called()
+
+
+def test_authenticate_records_failure_and_resets_on_success(
+    user_repository, redis_client, email_service, test_user
+):
+    # Arrange
+    password_hasher = Mock()
+    password_hasher.needs_rehash.return_value = False
+    login_throttle = Mock()
+    login_throttle.check.return_value = True
+    auth_service = AuthService(
+        user_repository,
+        redis_client,
+        email_service,
+        password_hasher=password_hasher,
+        login_throttle=login_throttle,
+    )
+    user_repository.find_by_email.return_value = test_user
+
+    # Act
+    password_hasher.verify.return_value = False
+    failed = auth_service.authenticate(test_user.email, "wrong", client_ip="10.0.0.1")
+    password_hasher.verify.return_value = True
+    succeeded = auth_service.authenticate(
+        test_user.email, "right", client_ip="10.0.0.1"
+    )
+
+    # Assert
+    assert failed is None
+    assert succeeded == test_user
+    login_throttle.record_failure.assert_called_once_with(test_user.email, "10.0.0.1")
+    login_throttle.reset.assert_called_once_with(test_user.email)
+
+
+def test_authenticate_queues_cache_prewarm(
+    user_repository, redis_client, email_service, test_user
+):
+    # Arrange
+    cache_prewarmer = Mock()
+    auth_service = AuthService(
+        user_repository, redis_client, email_service, cache_prewarmer=cache_prewarmer
+    )
+    user_repository.find_by_email.return_value = test_user
+
+    with patch("bcrypt.checkpw", return_value=True):
+        # Act
+        auth_service.authenticate(email="test@example.com", password="correct_password")
+
+    # Assert
+    cache_prewarmer.prewarm_user.assert_called_once_with("test_id")
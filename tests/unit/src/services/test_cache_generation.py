@@ -0,0 +1,52 @@
+from unittest.mock import Mock, patch
+from src.services.cache_generation import CacheGeneration
+
+
+def test_get_reads_counter_once_per_refresh_interval():
+    # Arrange
+    redis_client = Mock()
+    redis_client.get.return_value = b"3"
+    generation = CacheGeneration(redis_client, "task_cache_generation")
+    generation.refresh_seconds = 5
+
+    # Act
+    with patch(
+        "src.services.cache_generation.time.monotonic",
+        side_effect=[100.0, 102.0, 106.0],
+    ):
+        values = [generation.get(), generation.get(), generation.get()]
+
+    # Assert
+    assert values == [3, 3, 3]
+    assert redis_client.get.call_count == 2
+    redis_client.get.assert_called_with("task_cache_generation")
+
+
+def test_get_defaults_to_zero():
+    # Arrange
+    redis_client = Mock()
+    redis_client.get.return_value = None
+
+    # Act
+    value = CacheGeneration(redis_client, "task_cache_generation").get()
+
+    # Assert
+    assert value == 0
+
+
+def test_bump_is_visible_without_waiting_for_refresh():
+    # Arrange
+    redis_client = Mock()
+    redis_client.get.return_value = b"3"
+    redis_client.incr.return_value = 4
+    generation = CacheGeneration(redis_client, "task_cache_generation")
+    generation.get()
+
+    # Act
+    bumped = generation.bump()
+
+    # Assert
+    assert bumped == 4
+    assert generation.get() == 4
+    redis_client.incr.assert_called_once_with("task_cache_generation")
+    assert redis_client.get.call_count == 1
@@ -0,0 +1,125 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.cache_prewarmer import CachePrewarmer
+from src.models.task import Task
+
+
+@pytest.fixture
+def task_service():
+    mock = Mock()
+    mock.prime_user_tasks.side_effect = lambda tasks_by_user, generations: len(
+        tasks_by_user
+    )
+    return mock
+
+
+@pytest.fixture
+def task_repository():
+    return Mock()
+
+
+@pytest.fixture
+def prewarmer(task_service, task_repository):
+    prewarmer = CachePrewarmer(lambda: task_service, task_repository)
+    prewarmer.enabled = True
+    # Run queued warms inline so tests can assert on them
+    prewarmer._executor = Mock()
+    prewarmer._executor.submit.side_effect = lambda fn, *args: fn(*args)
+    return prewarmer
+
+
+def test_prewarm_user_loads_task_list(prewarmer, task_service):
+    # Act
+    queued = prewarmer.prewarm_user("user1")
+
+    # Assert
+    assert queued is True
+    task_service.get_user_tasks.assert_called_once_with("user1")
+    assert prewarmer.stats()["queued"] == 1
+    assert prewarmer.stats()["pending"] == 0
+
+
+def test_prewarm_user_skips_pending_user(prewarmer, task_service):
+    # Arrange
+    prewarmer._pending.add("user1")
+
+    # Act
+    queued = prewarmer.prewarm_user("user1")
+
+    # Assert
+    assert queued is False
+    task_service.get_user_tasks.assert_not_called()
+    assert prewarmer.stats()["skipped"] == 1
+
+
+def test_prewarm_user_rate_limited(prewarmer, task_service):
+    # Arrange
+    prewarmer.max_per_second = 2
+    prewarmer._tokens = 2
+
+    # Act
+    with patch("src.services.cache_prewarmer.time.monotonic", return_value=100.0):
+        prewarmer._refilled_at = 100.0
+        results = [prewarmer.prewarm_user(f"user{i}") for i in range(3)]
+
+    # Assert
+    assert results == [True, True, False]
+    assert task_service.get_user_tasks.call_count == 2
+
+
+def test_prewarm_user_disabled(prewarmer, task_service):
+    # Arrange
+    prewarmer.enabled = False
+
+    # Act
+    queued = prewarmer.prewarm_user("user1")
+
+    # Assert
+    assert queued is False
+    task_service.get_user_tasks.assert_not_called()
+
+
+def test_prewarm_user_records_failure(prewarmer, task_service):
+    # Arrange
+    task_service.get_user_tasks.side_effect = Exception("Redis down")
+
+    # Act
+    prewarmer.prewarm_user("user1")
+
+    # Assert
+    assert prewarmer.stats()["failed"] == 1
+    assert prewarmer.stats()["pending"] == 0
+
+
+def test_prewarm_recent_users_batches(prewarmer, task_service, task_repository):
+    # Arrange
+    task_repository.find_recent_user_ids.return_value = ["u1", "u2", "u3", "u4"]
+    task_service.find_uncached_users.side_effect = [
+        {"u1": b"0", "u2": b"0"},
+        {"u3": b"1"},
+    ]
+    task_repository.iter_by_user_ids.side_effect = [
+        iter(
+            [
+                Task(id="b", title="B", description=None, user_id="u1"),
+                Task(id="a", title="A", description=None, user_id="u1"),
+            ]
+        ),
+        iter([]),
+    ]
+
+    # Act
+    result = prewarmer.prewarm_recent_users(limit=4, batch_size=2, users_per_second=0)
+
+    # Assert
+    assert result["users"] == 4
+    assert result["warmed"] == 3
+    assert result["already_cached"] == 1
+    task_repository.find_recent_user_ids.assert_called_once_with(4)
+    task_service.find_uncached_users.assert_any_call(["u3", "u4"])
+    task_repository.iter_by_user_ids.assert_any_call(["u1", "u2"], 2)
+    task_repository.iter_by_user_ids.assert_any_call(["u3"], 2)
+    first_batch, generations = task_service.prime_user_tasks.call_args_list[0].args
+    assert generations == {"u1": b"0", "u2": b"0"}
+    assert [task.id for task in first_batch["u1"]] == ["a", "b"]
+    assert first_batch["u2"] == []
@@ -0,0 +1,308 @@
+"""CachedTaskService against fakeredis, so the Lua scripts actually run.
+
+The MongoDB side is a Mock whose side effects interleave other requests
+at the points where real requests can overlap.
+"""
+
+from unittest.mock import Mock
+import fakeredis
+import pytest
+from src.models.task import Task
+from src.services.cached_task import CachedTaskService
+from src.services.task_cache import TaskCache
+from src.utils.cache_codec import decode_task
+
+USER_ID = "user123"
+TASK_ID = "507f1f77bcf86cd799439011"
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeStrictRedis()
+
+
+@pytest.fixture
+def task_service():
+    return Mock()
+
+
+def _service(task_service, redis_client, task_cache=None) -> CachedTaskService:
+    service = CachedTaskService(task_service, redis_client, task_cache)
+    service.ttl_jitter = 0
+    service.early_refresh_beta = 0
+    return service
+
+
+def _task(title: str, task_id: str = TASK_ID) -> Task:
+    return Task(id=task_id, title=title, description="d", user_id=USER_ID)
+
+
+def _task_cache(redis_client) -> TaskCache:
+    task_cache = TaskCache(redis_client)
+    task_cache.enabled = True
+    task_cache.subscriber = Mock()
+    return task_cache
+
+
+def _cache_list(service, task_service, tasks: list[Task]) -> None:
+    task_service.get_user_tasks.return_value = tasks
+    service.get_user_tasks(USER_ID)
+    task_service.get_user_tasks.reset_mock()
+
+
+def _cached_titles(redis_client) -> dict:
+    cached = redis_client.hgetall(f"tasks:1.0:{USER_ID}")
+    return {
+        field.decode(): decode_task(payload).title
+        for field, payload in cached.items()
+        if not field.startswith(b"__")
+    }
+
+
+def test_fill_after_concurrent_update_is_dropped(task_service, redis_client):
+    # Arrange - The update completes while the reader is loading the old copy
+    reader = _service(task_service, redis_client)
+    writer = _service(task_service, redis_client)
+    task_service.update_task.return_value = _task("New")
+
+    def load_old_copy(task_id, user_id):
+        writer.update_task(task_id, "New", None, user_id)
+        return _task("Old")
+
+    task_service.get_task.side_effect = load_old_copy
+
+    # Act
+    result = reader.get_task(TASK_ID, USER_ID)
+
+    # Assert
+    assert result.title == "Old"
+    assert _cached_titles(redis_client) == {TASK_ID: "New"}
+
+
+def test_fill_after_delete_and_rebuild_keeps_list_clean(task_service, redis_client):
+    # Arrange - The task is deleted and the list rebuilt during the load
+    reader = _service(task_service, redis_client)
+    other = _service(task_service, redis_client)
+    task_service.get_user_tasks.return_value = []
+
+    def load_deleted_task(task_id, user_id):
+        other.delete_task(task_id, user_id)
+        assert other.get_user_tasks(user_id) == []
+        return _task("Deleted")
+
+    task_service.get_task.side_effect = load_deleted_task
+
+    # Act
+    reader.get_task(TASK_ID, USER_ID)
+
+    # Assert
+    assert _cached_titles(redis_client) == {}
+    assert _service(task_service, redis_client).get_user_tasks(USER_ID) == []
+    task_service.get_user_tasks.assert_called_once_with(USER_ID)
+
+
+def test_fill_skips_complete_list(task_service, redis_client):
+    # Arrange - A complete list at the current generation is authoritative
+    service = _service(task_service, redis_client)
+    task_service.get_user_tasks.return_value = [_task("Listed", "other_task")]
+    service.get_user_tasks(USER_ID)
+    task_service.get_task.return_value = _task("Outside")
+
+    # Act
+    service.get_task(TASK_ID, USER_ID)
+
+    # Assert
+    assert _cached_titles(redis_client) == {"other_task": "Listed"}
+
+
+def test_fill_replaces_hash_from_older_generation(task_service, redis_client):
+    # Arrange
+    service = _service(task_service, redis_client)
+    redis_client.hset(
+        f"tasks:1.0:{USER_ID}",
+        mapping={
+            "stale_task": service._encode_task(_task("Stale")),
+            "__generation__": 1,
+        },
+    )
+    redis_client.set(f"task_cache_generation:{USER_ID}", 2)
+    task_service.get_task.return_value = _task("Fresh")
+
+    # Act
+    service.get_task(TASK_ID, USER_ID)
+
+    # Assert
+    assert _cached_titles(redis_client) == {TASK_ID: "Fresh"}
+    assert redis_client.hget(f"tasks:1.0:{USER_ID}", "__generation__") == b"2"
+    assert redis_client.ttl(f"tasks:1.0:{USER_ID}") == 3600
+
+
+def test_write_patches_complete_list_in_place(task_service, redis_client):
+    # Arrange
+    service = _service(task_service, redis_client)
+    _cache_list(service, task_service, [_task("Old")])
+    version = redis_client.hget(f"tasks:1.0:{USER_ID}", "__version__")
+    redis_client.hset(f"tasks:1.0:{USER_ID}", "__response__", b"stale body")
+    task_service.update_task.return_value = _task("New")
+
+    # Act
+    service.update_task(TASK_ID, "New", None, USER_ID)
+
+    # Assert
+    cached = redis_client.hgetall(f"tasks:1.0:{USER_ID}")
+    assert b"__complete__" in cached
+    assert b"__response__" not in cached
+    assert cached[b"__version__"] != version
+    assert cached[b"__generation__"] == redis_client.get(
+        f"task_cache_generation:{USER_ID}"
+    )
+    assert [task.title for task in service.get_user_tasks(USER_ID)] == ["New"]
+    task_service.get_user_tasks.assert_not_called()
+    assert not redis_client.exists(f"user_tasks_writers:{USER_ID}")
+
+
+def test_overlapping_writers_drop_the_list(task_service, redis_client):
+    # Arrange - The second write starts and finishes inside the first one
+    first = _service(task_service, redis_client)
+    second = _service(task_service, redis_client)
+    _cache_list(first, task_service, [_task("A"), _task("B", "other_task")])
+
+    def update(task_id, title, description, user_id):
+        if task_id == TASK_ID:
+            second.update_task("other_task", "B2", None, user_id)
+        return _task(title, task_id)
+
+    task_service.update_task.side_effect = update
+
+    # Act
+    first.update_task(TASK_ID, "A2", None, USER_ID)
+
+    # Assert - Neither writer could patch safely, so the next read reloads
+    assert not redis_client.exists(f"tasks:1.0:{USER_ID}")
+    assert not redis_client.exists(f"user_tasks_writers:{USER_ID}")
+    assert not redis_client.exists(f"user_tasks_contended:{USER_ID}")
+    assert redis_client.get(f"task_cache_generation:{USER_ID}") == b"2"
+
+
+def test_aborted_write_leaves_list_untouched(task_service, redis_client):
+    # Arrange
+    service = _service(task_service, redis_client)
+    _cache_list(service, task_service, [_task("Kept")])
+    before = redis_client.hgetall(f"tasks:1.0:{USER_ID}")
+    task_service.update_task.side_effect = ValueError("Title cannot be empty")
+
+    # Act
+    with pytest.raises(ValueError):
+        service.update_task(TASK_ID, " ", None, USER_ID)
+
+    # Assert
+    assert redis_client.hgetall(f"tasks:1.0:{USER_ID}") == before
+    assert not redis_client.exists(f"user_tasks_writers:{USER_ID}")
+    assert redis_client.get(f"task_cache_generation:{USER_ID}") is None
+
+
+def test_create_clears_missing_marker(task_service, redis_client):
+    # Arrange
+    service = _service(task_service, redis_client)
+    redis_client.set(f"missing_task:1.0:{TASK_ID}", 1)
+    task_service.create_task.return_value = TASK_ID
+
+    # Act
+    service.create_task("Created", "d", USER_ID)
+
+    # Assert
+    assert not redis_client.exists(f"missing_task:1.0:{TASK_ID}")
+    assert _cached_titles(redis_client) == {TASK_ID: "Created"}
+
+
+def test_fill_interleaved_with_write_in_flight(task_service, redis_client):
+    # Arrange - The reader fills while a writer is still inside MongoDB
+    reader = _service(task_service, redis_client)
+    writer = _service(task_service, redis_client)
+
+    def update(task_id, title, description, user_id):
+        assert reader.get_task(task_id, user_id).title == "Old"
+        return _task(title)
+
+    task_service.get_task.return_value = _task("Old")
+    task_service.update_task.side_effect = update
+
+    # Act
+    writer.update_task(TASK_ID, "New", None, USER_ID)
+
+    # Assert - The writer's result replaces the copy filled before it finished
+    assert _cached_titles(redis_client) == {TASK_ID: "New"}
+
+
+def test_response_not_stored_after_concurrent_write(task_service, redis_client):
+    # Arrange
+    service = _service(task_service, redis_client)
+    writer = _service(task_service, redis_client)
+    _cache_list(service, task_service, [_task("Old")])
+    task_service.update_task.return_value = _task("New")
+
+    def render(tasks):
+        writer.update_task(TASK_ID, "New", None, USER_ID)
+        return b"rendered " + tasks[0].title.encode()
+
+    # Act
+    body, _ = service.get_user_tasks_response(USER_ID, render)
+
+    # Assert
+    assert body == b"rendered Old"
+    assert not redis_client.hexists(f"tasks:1.0:{USER_ID}", "__response__")
+
+
+def test_response_stored_for_unchanged_list(task_service, redis_client):
+    # Arrange
+    service = _service(task_service, redis_client)
+    _cache_list(service, task_service, [_task("Listed")])
+
+    # Act
+    body, etag = service.get_user_tasks_response(USER_ID, lambda tasks: b"body")
+
+    # Assert
+    stored = redis_client.hget(f"tasks:1.0:{USER_ID}", "__response__")
+    assert stored == etag.encode() + b"body"
+
+
+def test_release_lock_only_releases_own_lock(task_service, redis_client):
+    # Arrange
+    service = _service(task_service, redis_client)
+    redis_client.set(f"tasks_rebuild:{USER_ID}", "other-token")
+
+    # Act
+    released = service._release_lock(
+        keys=[f"tasks_rebuild:{USER_ID}"], args=["my-token"]
+    )
+
+    # Assert
+    assert released == 0
+    assert redis_client.get(f"tasks_rebuild:{USER_ID}") == b"other-token"
+    assert (
+        service._release_lock(keys=[f"tasks_rebuild:{USER_ID}"], args=["other-token"])
+        == 1
+    )
+
+
+def test_invalidate_user_drops_tasks_cached_by_other_workers(
+    task_service, redis_client
+):
+    # Arrange - Another worker holds the task in its in-process cache
+    reader_cache = _task_cache(redis_client)
+    reader = _service(task_service, redis_client, reader_cache)
+    admin = _service(task_service, redis_client, _task_cache(redis_client))
+    task_service.get_task.return_value = _task("Old")
+    reader.get_task(TASK_ID, USER_ID)
+    task_service.get_task.return_value = _task("Changed outside the service")
+    pubsub = redis_client.pubsub()
+    pubsub.subscribe(reader_cache.channel)
+    assert pubsub.get_message(timeout=1)["type"] == "subscribe"
+
+    # Act
+    admin.invalidate_user(USER_ID)
+    reader_cache._handle_invalidation(pubsub.get_message(timeout=1)["data"])
+
+    # Assert
+    result = reader.get_task(TASK_ID, USER_ID)
+    assert result.title == "Changed outside the service"
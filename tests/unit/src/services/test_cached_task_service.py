@@ -1,7 +1,10 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import json
 from src.services.cached_task import CachedTaskService
+from src.utils.cache_codec import decode_task
+from src.utils.pagination import encode_cursor
+from src.utils.stats import CacheMetrics
 from src.models.task import Task
 
 
@@ -12,12 +15,17 @@ def task_service():
 
 @pytest.fixture
 def redis_client():
-    return Mock()
+    mock = Mock()
+    # Shaped like a get_task lookup: [task, hash generation], user generation, missing
+    mock.pipeline.return_value.execute.return_value = [[None, None], None, 0]
+    return mock
 
 
 @pytest.fixture
 def cached_task_service(task_service, redis_client):
-    return CachedTaskService(task_service, redis_client)
+    cached_task_service = CachedTaskService(task_service, redis_client)
+    cached_task_service.ttl_jitter = 0
+    return cached_task_service
 
 
 @pytest.fixture
@@ -44,7 +52,14 @@ def test_create_task(cached_task_service, task_service, redis_client):
     task_service.create_task.assert_called_once_with(
         "New Task", "New Description", "user123"
     )
-    redis_client.delete.assert_called_once_with("user_tasks:user123")
+    apply_write = redis_client.register_script.return_value
+    keys = apply_write.call_args.kwargs["keys"]
+    operation, task_id, payload, _, _, _ = apply_write.call_args.kwargs["args"]
+    assert keys[0] == "tasks:1.0:user123"
+    assert keys[4] == "task_cache_generation:user123"
+    assert (operation, task_id) == ("upsert", "new_task_id")
+    assert decode_task(payload).title == "New Task"
+    redis_client.delete.assert_not_called()
     assert result == "new_task_id"
 
 
@@ -59,55 +74,143 @@ def test_get_task_from_cache(cached_task_service, redis_client, sample_task):
             "completed": sample_task.completed,
         }
     )
-    redis_client.get.return_value = cached_data
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [[cached_data.encode(), b"0"], None, 0]
 
     # Act
     result = cached_task_service.get_task(sample_task.id, sample_task.user_id)
 
     # Assert
-    redis_client.get.assert_called_once_with(f"task:{sample_task.id}")
+    pipe.hmget.assert_called_once_with(
+        f"tasks:1.0:{sample_task.user_id}", [sample_task.id, "__generation__"]
+    )
+    pipe.get.assert_called_once_with(f"task_cache_generation:{sample_task.user_id}")
+    pipe.exists.assert_called_once_with(f"missing_task:1.0:{sample_task.id}")
     assert result.id == sample_task.id
     assert result.title == sample_task.title
     assert result.description == sample_task.description
     assert result.user_id == sample_task.user_id
 
 
-def test_get_task_unauthorized(cached_task_service, redis_client, sample_task):
+def test_get_task_of_other_user_misses_cache(
+    cached_task_service, task_service, redis_client, sample_task
+):
     # Arrange
-    cached_data = json.dumps(
-        {
-            "id": sample_task.id,
-            "title": sample_task.title,
-            "description": sample_task.description,
-            "user_id": sample_task.user_id,
-            "completed": sample_task.completed,
-        }
-    )
-    redis_client.get.return_value = cached_data
+    task_service.get_task.side_effect = ValueError("Unauthorized access to task")
 
     # Act & Assert
     with pytest.raises(ValueError, match="Unauthorized access to task"):
         cached_task_service.get_task(sample_task.id, "wrong_user")
+    redis_client.pipeline.return_value.hmget.assert_called_once_with(
+        "tasks:1.0:wrong_user", [sample_task.id, "__generation__"]
+    )
 
 
 def test_get_task_from_service(
     cached_task_service, task_service, redis_client, sample_task
 ):
     # Arrange
-    redis_client.get.return_value = None
+    task_service.get_task.return_value = sample_task
+    pipe = redis_client.pipeline.return_value
+
+    # Act
+    result = cached_task_service.get_task(sample_task.id, sample_task.user_id)
+
+    # Assert
+    task_service.get_task.assert_called_once_with(sample_task.id, sample_task.user_id)
+    assert result == sample_task
+    fill = redis_client.register_script.return_value
+    assert fill.call_args.kwargs["keys"] == [
+        f"tasks:1.0:{sample_task.user_id}",
+        f"task_cache_generation:{sample_task.user_id}",
+    ]
+    generation, task_id, payload, ttl = fill.call_args.kwargs["args"]
+    assert (generation, task_id, ttl) == (b"0", sample_task.id, 3600)
+    assert decode_task(payload).title == sample_task.title
+    pipe.hset.assert_not_called()
+
+
+def test_get_task_ignores_hash_from_older_generation(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Arrange - The user was invalidated after this entry was cached
+    payload = cached_task_service._encode_task(sample_task)
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [[payload, b"3"], b"4", 0]
     task_service.get_task.return_value = sample_task
 
     # Act
     result = cached_task_service.get_task(sample_task.id, sample_task.user_id)
 
     # Assert
+    assert result == sample_task
     task_service.get_task.assert_called_once_with(sample_task.id, sample_task.user_id)
+    # The fill is checked against the generation read before the load
+    fill = redis_client.register_script.return_value
+    assert fill.call_args.kwargs["args"][0] == b"4"
+
+
+def test_get_task_caches_missing_task(cached_task_service, task_service, redis_client):
+    # Arrange
+    valid_task_id = "507f1f77bcf86cd799439011"
+    task_service.get_task.return_value = None
+
+    # Act
+    result = cached_task_service.get_task(valid_task_id, "user123")
+
+    # Assert
+    assert result is None
+    redis_client.setex.assert_called_once_with(
+        f"missing_task:1.0:{valid_task_id}", 60, 1
+    )
+
+
+def test_get_task_served_from_negative_cache(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Arrange
+    redis_client.pipeline.return_value.execute.return_value = [[None, None], None, 1]
+
+    # Act
+    result = cached_task_service.get_task(sample_task.id, sample_task.user_id)
+
+    # Assert
+    assert result is None
+    task_service.get_task.assert_not_called()
+
+
+def test_get_task_unreadable_payload_is_a_miss(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Arrange - Written by a newer deploy with an unknown schema version
+    redis_client.pipeline.return_value.execute.return_value = [
+        [b"\x7e\x00", b"0"],
+        None,
+        0,
+    ]
+    task_service.get_task.return_value = sample_task
+
+    # Act
+    result = cached_task_service.get_task(sample_task.id, sample_task.user_id)
+
+    # Assert
     assert result == sample_task
+    task_service.get_task.assert_called_once_with(sample_task.id, sample_task.user_id)
 
 
 def test_update_task(cached_task_service, task_service, redis_client, sample_task):
+    # Arrange
+    updated_task = Task(
+        id=sample_task.id,
+        title="Updated Title",
+        description="Updated Description",
+        user_id=sample_task.user_id,
+    )
+    task_service.update_task.return_value = updated_task
+    pipe = redis_client.pipeline.return_value
+
     # Act
-    cached_task_service.update_task(
+    result = cached_task_service.update_task(
         task_id=sample_task.id,
         title="Updated Title",
         description="Updated Description",
@@ -118,34 +221,77 @@ def test_update_task(cached_task_service, task_service, redis_client, sample_tas
     task_service.update_task.assert_called_once_with(
         sample_task.id, "Updated Title", "Updated Description", sample_task.user_id
     )
-    redis_client.delete.assert_any_call(f"task:{sample_task.id}")
-    redis_client.delete.assert_any_call(f"user_tasks:{sample_task.user_id}")
+    assert result == updated_task
+    pipe.incr.assert_called_once_with(f"user_tasks_writers:{sample_task.user_id}")
+    apply_write = redis_client.register_script.return_value
+    operation, task_id, payload, _, _, generation_ttl = apply_write.call_args.kwargs[
+        "args"
+    ]
+    assert (operation, task_id) == ("upsert", sample_task.id)
+    assert generation_ttl == 7200
+    assert decode_task(payload).title == "Updated Title"
+
+
+def test_delete_task_removes_from_cached_list(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Act
+    cached_task_service.delete_task(sample_task.id, sample_task.user_id)
+
+    # Assert
+    apply_write = redis_client.register_script.return_value
+    assert apply_write.call_args.kwargs["args"][:2] == ["remove", sample_task.id]
 
 
-def test_get_user_tasks_from_cache(cached_task_service, redis_client):
+def test_failed_write_releases_writer_without_patching(
+    cached_task_service, task_service, redis_client, sample_task
+):
     # Arrange
-    tasks_data = [
-        {
-            "id": "task1",
-            "title": "Task 1",
-            "description": "Description 1",
-            "user_id": "user123",
-            "completed": False,
-        },
-        {
-            "id": "task2",
-            "title": "Task 2",
-            "description": "Description 2",
-            "user_id": "user123",
-            "completed": True,
-        },
-    ]
-    redis_client.get.return_value = json.dumps(tasks_data)
+    task_service.update_task_status.side_effect = ValueError("Task not found")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task not found"):
+        cached_task_service.update_task_status(
+            sample_task.id, True, sample_task.user_id
+        )
+    apply_write = redis_client.register_script.return_value
+    assert apply_write.call_args.kwargs["args"][0] == "abort"
+
+
+def test_get_user_tasks_from_cache(cached_task_service, task_service, redis_client):
+    # Arrange
+    pipe = redis_client.pipeline.return_value
+    cached_tasks = {
+        b"task2": json.dumps(
+            {
+                "id": "task2",
+                "title": "Task 2",
+                "description": "Description 2",
+                "user_id": "user123",
+                "completed": True,
+            }
+        ).encode(),
+        b"task1": json.dumps(
+            {
+                "id": "task1",
+                "title": "Task 1",
+                "description": "Description 1",
+                "user_id": "user123",
+                "completed": False,
+            }
+        ).encode(),
+        b"__complete__": b"1",
+        b"__generation__": b"0",
+    }
+    pipe.execute.return_value = [cached_tasks, None]
 
     # Act
     results = cached_task_service.get_user_tasks("user123")
 
     # Assert
+    pipe.hgetall.assert_called_once_with("tasks:1.0:user123")
+    pipe.get.assert_called_once_with("task_cache_generation:user123")
+    task_service.get_user_tasks.assert_not_called()
     assert len(results) == 2
     assert results[0].id == "task1"
     assert results[1].id == "task2"
@@ -153,6 +299,68 @@ def test_get_user_tasks_from_cache(cached_task_service, redis_client):
     assert results[1].completed == True
 
 
+def test_get_user_tasks_ignores_partial_hash(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange - Only a single task was cached by get_task
+    redis_client.pipeline.return_value.execute.return_value = [
+        {
+            b"task1": json.dumps({"id": "task1", "user_id": "user123"}).encode(),
+            b"__generation__": b"0",
+        },
+        None,
+    ]
+    task_service.get_user_tasks.return_value = []
+
+    # Act
+    cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    task_service.get_user_tasks.assert_called_once_with("user123")
+
+
+def test_get_user_tasks_ignores_hash_from_older_generation(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange - Complete, but a write landed while it was being rebuilt
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [{b"__complete__": b"1", b"__generation__": b"1"}, b"2"]
+    task_service.get_user_tasks.return_value = []
+
+    # Act
+    cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    task_service.get_user_tasks.assert_called_once_with("user123")
+    assert pipe.hset.call_args.kwargs["mapping"]["__generation__"] == b"2"
+
+
+def test_get_user_tasks_caches_empty_list(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange
+    task_service.get_user_tasks.return_value = []
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [{}, None]
+
+    # Act
+    results = cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    assert results == []
+    mapping = pipe.hset.call_args.kwargs["mapping"]
+    assert set(mapping) == {"__complete__", "__version__", "__generation__"}
+    pipe.expire.assert_called_once_with("tasks:1.0:user123", 60)
+
+    # Act - The empty list is now answered from Redis
+    pipe.execute.return_value = [{b"__complete__": b"1", b"__generation__": b"0"}, None]
+    results = cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    assert results == []
+    task_service.get_user_tasks.assert_called_once()
+
+
 def test_get_user_tasks_from_service(cached_task_service, task_service, redis_client):
     # Arrange
     redis_client.get.return_value = None
@@ -174,6 +382,9 @@ def test_get_user_tasks_from_service(cached_task_service, task_service, redis_cl
     ]
     task_service.get_user_tasks.return_value = tasks
 
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [{}, b"5"]
+
     # Act
     results = cached_task_service.get_user_tasks("user123")
 
@@ -181,3 +392,500 @@ def test_get_user_tasks_from_service(cached_task_service, task_service, redis_cl
     task_service.get_user_tasks.assert_called_once_with("user123")
     assert len(results) == 2
     assert results == tasks
+    pipe.delete.assert_called_once_with("tasks:1.0:user123")
+    mapping = pipe.hset.call_args.kwargs["mapping"]
+    assert set(mapping) == {
+        "task1",
+        "task2",
+        "__complete__",
+        "__version__",
+        "__generation__",
+    }
+    assert mapping["__generation__"] == b"5"
+    pipe.expire.assert_called_once_with("tasks:1.0:user123", 3600)
+
+
+def test_get_user_tasks_served_from_l1(task_service, redis_client):
+    # Arrange
+    task_cache = Mock()
+    task_cache.get.return_value = None
+    cached_task_service = CachedTaskService(task_service, redis_client, task_cache)
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [
+        {
+            b"task1": json.dumps(
+                {"id": "task1", "title": "Task 1", "user_id": "user123"}
+            ).encode(),
+            b"__complete__": b"1",
+            b"__generation__": b"0",
+        },
+        None,
+    ]
+
+    # Act
+    results = cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    task_cache.record_l2.assert_called_once_with(True)
+    key, stored, _ = task_cache.set.call_args[0]
+    assert key == "tasks:1.0:user123"
+    assert [task.id for task in stored] == ["task1"]
+
+    # Act - The next read is answered from L1 without touching Redis
+    task_cache.get.return_value = stored
+    pipe.hgetall.reset_mock()
+    results = cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    pipe.hgetall.assert_not_called()
+    assert [task.id for task in results] == ["task1"]
+
+
+def test_mutation_invalidates_l1(task_service, redis_client, sample_task):
+    # Arrange
+    task_cache = Mock()
+    cached_task_service = CachedTaskService(task_service, redis_client, task_cache)
+
+    # Act
+    cached_task_service.delete_task(sample_task.id, sample_task.user_id)
+
+    # Assert
+    task_cache.invalidate.assert_called_once_with(
+        (
+            f"task_cache_generation:{sample_task.user_id}",
+            f"tasks:1.0:{sample_task.user_id}",
+            f"tasks:1.0:{sample_task.user_id}:response",
+        )
+    )
+
+
+def test_invalidate_user_bumps_generation(task_service, redis_client):
+    # Arrange
+    task_cache = Mock()
+    cached_task_service = CachedTaskService(task_service, redis_client, task_cache)
+    pipe = redis_client.pipeline.return_value
+
+    # Act
+    cached_task_service.invalidate_user("user123")
+
+    # Assert
+    pipe.incr.assert_called_once_with("task_cache_generation:user123")
+    pipe.expire.assert_called_once_with("task_cache_generation:user123", 7200)
+    redis_client.delete.assert_not_called()
+    task_cache.invalidate.assert_called_once_with(
+        (
+            "task_cache_generation:user123",
+            "tasks:1.0:user123",
+            "tasks:1.0:user123:response",
+        )
+    )
+
+
+def test_keys_namespaced_by_global_generation(task_service, redis_client):
+    # Arrange
+    generation = Mock()
+    generation.get.return_value = 7
+
+    # Act
+    cached_task_service = CachedTaskService(
+        task_service, redis_client, generation=generation
+    )
+
+    # Assert
+    assert cached_task_service._get_user_tasks_key("user123") == "tasks:1.7:user123"
+    assert (
+        cached_task_service._get_missing_task_key("task1") == "missing_task:1.7:task1"
+    )
+    assert (
+        cached_task_service._get_generation_key("user123")
+        == "task_cache_generation:user123"
+    )
+
+
+def test_concurrent_miss_waits_for_rebuild(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange - Another request holds the rebuild lock and finishes shortly
+    redis_client.set.return_value = None
+    rebuilt = {
+        b"task1": json.dumps(
+            {"id": "task1", "title": "Task 1", "user_id": "user123"}
+        ).encode(),
+        b"__complete__": b"1",
+        b"__generation__": b"0",
+    }
+    redis_client.pipeline.return_value.execute.side_effect = [
+        [{}, None],
+        [{}, None],
+        [rebuilt, None],
+    ]
+    cached_task_service.rebuild_poll_ms = 1
+
+    # Act
+    results = cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    assert [task.id for task in results] == ["task1"]
+    task_service.get_user_tasks.assert_not_called()
+
+
+def test_concurrent_miss_falls_back_after_wait(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange
+    redis_client.set.return_value = None
+    redis_client.pipeline.return_value.execute.return_value = [{}, None]
+    task_service.get_user_tasks.return_value = []
+    cached_task_service.rebuild_wait_ms = 0
+
+    # Act
+    results = cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    assert results == []
+    task_service.get_user_tasks.assert_called_once_with("user123")
+    redis_client.pipeline.return_value.hset.assert_not_called()
+
+
+def test_rebuild_takes_lock_and_releases_it(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange
+    redis_client.pipeline.return_value.execute.return_value = [{}, None]
+    task_service.get_user_tasks.return_value = []
+
+    # Act
+    cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    lock_call = redis_client.set.call_args
+    assert lock_call[0][0] == "tasks_rebuild:user123"
+    assert lock_call.kwargs["nx"] is True
+    release = redis_client.register_script.return_value
+    assert release.call_args.kwargs == {
+        "keys": ["tasks_rebuild:user123"],
+        "args": [lock_call[0][1]],
+    }
+
+
+def test_hot_list_refreshed_early_near_expiry(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange - The list expires in one second and took two seconds to build
+    marker = json.dumps({"delta": 2.0, "expires_at": 1001.0})
+    redis_client.pipeline.return_value.execute.return_value = [
+        {b"__complete__": marker.encode(), b"__generation__": b"0"},
+        None,
+    ]
+    task_service.get_user_tasks.return_value = []
+
+    # Act
+    with patch("src.services.cached_task.time.time", return_value=1000.0), patch(
+        "src.services.cached_task.random.random", return_value=0.5
+    ):
+        cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    task_service.get_user_tasks.assert_called_once_with("user123")
+
+
+def test_fresh_list_not_refreshed_early(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange
+    marker = json.dumps({"delta": 0.01, "expires_at": 4600.0})
+    redis_client.pipeline.return_value.execute.return_value = [
+        {b"__complete__": marker.encode(), b"__generation__": b"0"},
+        None,
+    ]
+
+    # Act
+    with patch("src.services.cached_task.time.time", return_value=1000.0):
+        cached_task_service.get_user_tasks("user123")
+
+    # Assert
+    task_service.get_user_tasks.assert_not_called()
+    redis_client.set.assert_not_called()
+
+
+def test_ttl_jitter_stays_within_bounds(cached_task_service):
+    # Arrange
+    cached_task_service.ttl_jitter = 0.1
+
+    # Act
+    ttls = [cached_task_service._jittered_ttl(3600) for _ in range(200)]
+
+    # Assert
+    assert all(3240 <= ttl <= 3960 for ttl in ttls)
+    assert len(set(ttls)) > 1
+
+
+def _render(tasks):
+    return json.dumps([task.id for task in tasks]).encode()
+
+
+def test_get_user_tasks_response_hit(cached_task_service, task_service, redis_client):
+    # Arrange
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [[b"0123456789abcdef" + b'["task1"]', b"0"], None]
+
+    # Act
+    body, etag = cached_task_service.get_user_tasks_response("user123", _render)
+
+    # Assert
+    pipe.hmget.assert_called_once_with(
+        "tasks:1.0:user123", ["__response__", "__generation__"]
+    )
+    assert body == b'["task1"]'
+    assert etag == "0123456789abcdef"
+    pipe.hgetall.assert_not_called()
+
+
+def test_get_user_tasks_response_renders_and_stores_snapshot(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Arrange
+    redis_client.pipeline.return_value.execute.side_effect = [
+        [[None, None], None],
+        [
+            {
+                sample_task.id.encode(): cached_task_service._encode_task(sample_task),
+                b"__complete__": b"1",
+                b"__version__": b"v1",
+                b"__generation__": b"0",
+            },
+            None,
+        ],
+    ]
+
+    # Act
+    body, etag = cached_task_service.get_user_tasks_response("test_user", _render)
+
+    # Assert
+    assert body == b'["test_id"]'
+    assert len(etag) == 16
+    store = redis_client.register_script.return_value
+    assert store.call_args.kwargs == {
+        "keys": ["tasks:1.0:test_user"],
+        "args": [b"v1", etag.encode() + body],
+    }
+    task_service.get_user_tasks.assert_not_called()
+
+
+def test_get_user_tasks_response_miss_rebuilds_list(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Arrange
+    redis_client.pipeline.return_value.execute.side_effect = [
+        [[None, None], None],
+        [{}, None],
+        [{}, None],
+        [],
+    ]
+    task_service.get_user_tasks.return_value = [sample_task]
+
+    # Act
+    body, etag = cached_task_service.get_user_tasks_response("test_user", _render)
+
+    # Assert
+    assert body == b'["test_id"]'
+    task_service.get_user_tasks.assert_called_once_with("test_user")
+
+
+def test_lookups_are_recorded_per_family(task_service, redis_client, sample_task):
+    # Arrange
+    metrics = CacheMetrics()
+    cached_task_service = CachedTaskService(task_service, redis_client, metrics=metrics)
+    payload = cached_task_service._encode_task(sample_task)
+    redis_client.pipeline.return_value.execute.side_effect = [
+        [[payload, b"0"], None, 0],
+        [{}, None],
+    ]
+    redis_client.set.return_value = None
+    cached_task_service.rebuild_wait_ms = 0
+    task_service.get_user_tasks.return_value = []
+
+    # Act
+    cached_task_service.get_task(sample_task.id, sample_task.user_id)
+    cached_task_service.get_user_tasks(sample_task.user_id)
+
+    # Assert
+    families = metrics.snapshot()["families"]
+    assert families["task"]["get"]["hits"] == 1
+    assert families["task"]["get"]["bytes"] == len(payload)
+    assert families["user_tasks"]["get"]["misses"] == 1
+
+
+def test_find_uncached_users(cached_task_service, redis_client):
+    # Arrange - cached, never cached, cached before an invalidation
+    redis_client.pipeline.return_value.execute.return_value = [
+        [b"1", b"0"],
+        None,
+        [None, None],
+        b"2",
+        [b"1", b"1"],
+        b"2",
+    ]
+
+    # Act
+    uncached = cached_task_service.find_uncached_users(["cached", "new", "stale"])
+
+    # Assert
+    assert uncached == {"new": b"2", "stale": b"2"}
+
+
+def test_prime_user_tasks_stores_generation_read_before_loading(
+    cached_task_service, redis_client, sample_task
+):
+    # Arrange
+    pipe = redis_client.pipeline.return_value
+
+    # Act
+    warmed = cached_task_service.prime_user_tasks(
+        {"test_user": [sample_task]}, {"test_user": b"3"}
+    )
+
+    # Assert
+    assert warmed == 1
+    pipe.delete.assert_called_once_with("tasks:1.0:test_user")
+    mapping = pipe.hset.call_args.kwargs["mapping"]
+    assert decode_task(mapping["test_id"]).title == "Test Task"
+    assert cached_task_service.COMPLETE_FIELD in mapping
+    assert mapping["__generation__"] == b"3"
+    pipe.expire.assert_called_once_with("tasks:1.0:test_user", 3600)
+
+
+def test_get_user_tasks_page_miss_loads_and_caches(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Arrange
+    after_id = "507f1f77bcf86cd799439011"
+    cursor = encode_cursor(after_id)
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [{}, b"4"]
+    task_service.get_user_tasks_page.return_value = ([sample_task], "next-cursor")
+
+    # Act
+    tasks, next_cursor = cached_task_service.get_user_tasks_page(
+        "test_user", cursor, 20
+    )
+
+    # Assert
+    assert (tasks, next_cursor) == ([sample_task], "next-cursor")
+    task_service.get_user_tasks_page.assert_called_once_with("test_user", cursor, 20)
+    page_key = f"tasks_page:1.0:test_user:{after_id}:20"
+    pipe.hgetall.assert_called_once_with(page_key)
+    mapping = pipe.hset.call_args.kwargs["mapping"]
+    assert decode_task(mapping["0"]).title == "Test Task"
+    assert mapping["__generation__"] == b"4"
+    assert mapping["__next__"] == "next-cursor"
+    pipe.expire.assert_called_once_with(page_key, 300)
+
+
+def test_get_user_tasks_page_hit(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Arrange
+    redis_client.pipeline.return_value.execute.return_value = [
+        {
+            b"0": cached_task_service._encode_task(sample_task),
+            b"__generation__": b"4",
+            b"__next__": b"",
+        },
+        b"4",
+    ]
+
+    # Act
+    tasks, next_cursor = cached_task_service.get_user_tasks_page("test_user", None, 20)
+
+    # Assert
+    assert [task.title for task in tasks] == ["Test Task"]
+    assert next_cursor is None
+    task_service.get_user_tasks_page.assert_not_called()
+
+
+def test_get_user_tasks_page_from_older_generation_is_a_miss(
+    cached_task_service, task_service, redis_client, sample_task
+):
+    # Arrange - A write since the page was cached bumped the generation
+    redis_client.pipeline.return_value.execute.return_value = [
+        {
+            b"0": cached_task_service._encode_task(sample_task),
+            b"__generation__": b"4",
+            b"__next__": b"",
+        },
+        b"5",
+    ]
+    task_service.get_user_tasks_page.return_value = ([], None)
+
+    # Act
+    cached_task_service.get_user_tasks_page("test_user", None, 20)
+
+    # Assert
+    task_service.get_user_tasks_page.assert_called_once_with("test_user", None, 20)
+
+
+def test_get_user_tasks_page_rejects_bad_cursor(cached_task_service, redis_client):
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        cached_task_service.get_user_tasks_page("test_user", "tasks:*", 20)
+    redis_client.pipeline.return_value.hgetall.assert_not_called()
+
+
+def test_bulk_write_invalidates_user_in_one_pipeline(task_service, redis_client):
+    # Arrange
+    task_cache = Mock()
+    cached_task_service = CachedTaskService(task_service, redis_client, task_cache)
+    pipe = redis_client.pipeline.return_value
+    task_service.bulk_delete_tasks.return_value = [
+        {"id": "t1", "status": 200, "error": None},
+        {"id": "t2", "status": 404, "error": "Task not found"},
+    ]
+
+    # Act
+    results = cached_task_service.bulk_delete_tasks(["t1", "t2"], "user123")
+
+    # Assert
+    assert results == task_service.bulk_delete_tasks.return_value
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    pipe.incr.assert_called_once_with("task_cache_generation:user123")
+    pipe.expire.assert_called_once_with("task_cache_generation:user123", 7200)
+    pipe.delete.assert_called_once_with("tasks:1.0:user123")
+    pipe.execute.assert_called_once()
+    redis_client.register_script.return_value.assert_not_called()
+    task_cache.invalidate.assert_called_once_with(
+        (
+            "task_cache_generation:user123",
+            "tasks:1.0:user123",
+            "tasks:1.0:user123:response",
+        )
+    )
+
+
+def test_bulk_write_without_changes_keeps_cache(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange
+    task_service.bulk_update_tasks.return_value = [
+        {"id": "t1", "status": 404, "error": "Task not found"}
+    ]
+
+    # Act
+    cached_task_service.bulk_update_tasks([("t1", {"completed": True})], "user123")
+
+    # Assert
+    redis_client.pipeline.assert_not_called()
+
+
+def test_failed_bulk_write_still_invalidates(
+    cached_task_service, task_service, redis_client
+):
+    # Arrange
+    task_service.bulk_create_tasks.side_effect = Exception("Database error")
+
+    # Act & Assert
+    with pytest.raises(Exception, match="Database error"):
+        cached_task_service.bulk_create_tasks([("T", "d")], "user123")
+    redis_client.pipeline.return_value.incr.assert_called_once_with(
+        "task_cache_generation:user123"
+    )
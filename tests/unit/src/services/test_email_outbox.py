@@ -0,0 +1,224 @@
+import pytest
+import json
+import threading
+import fakeredis
+from unittest.mock import Mock, patch
+from src.config import Config
+from src.services.email_outbox import EmailOutbox
+
+
+@pytest.fixture
+def redis_client():
+    return Mock()
+
+
+@pytest.fixture
+def email_service():
+    return Mock()
+
+
+@pytest.fixture
+def email_outbox(redis_client, email_service):
+    return EmailOutbox(redis_client, email_service)
+
+
+@pytest.fixture
+def queued_message():
+    return {
+        "id": "message_id",
+        "to": "test@example.com",
+        "subject": "Test Subject",
+        "body": "Test Body",
+        "enqueued_at": 1000.0,
+        "attempts": 0,
+    }
+
+
+def test_send_email_enqueues(email_outbox, redis_client, email_service):
+    # Act
+    email_outbox.send_email("test@example.com", "Test Subject", "Test Body")
+
+    # Assert
+    email_service.send_email.assert_not_called()
+    key, raw = redis_client.lpush.call_args[0]
+    message = json.loads(raw)
+    assert key == "email_outbox:pending"
+    assert message["to"] == "test@example.com"
+    assert message["subject"] == "Test Subject"
+    assert message["attempts"] == 0
+
+
+def test_send_email_disabled_sends_directly(email_outbox, redis_client, email_service):
+    # Act
+    with patch.object(Config, "EMAIL_OUTBOX_ENABLED", False):
+        email_outbox.send_email("test@example.com", "Test Subject", "Test Body")
+
+    # Assert
+    email_service.send_email.assert_called_once_with(
+        "test@example.com", "Test Subject", "Test Body"
+    )
+    redis_client.lpush.assert_not_called()
+
+
+def test_process_next_empty_queue(email_outbox, redis_client, email_service):
+    # Arrange
+    redis_client.brpoplpush.return_value = None
+
+    # Act
+    processed = email_outbox.process_next("worker1")
+
+    # Assert
+    assert processed is False
+    email_service.send_email.assert_not_called()
+
+
+def test_process_next_sends(email_outbox, redis_client, email_service, queued_message):
+    # Arrange
+    raw = json.dumps(queued_message).encode("utf-8")
+    redis_client.brpoplpush.return_value = raw
+
+    # Act
+    with patch("src.services.email_outbox.time.time", return_value=1002.0):
+        processed = email_outbox.process_next("worker1")
+
+    # Assert
+    assert processed is True
+    email_service.send_email.assert_called_once_with(
+        "test@example.com", "Test Subject", "Test Body"
+    )
+    redis_client.lrem.assert_called_once_with("email_outbox:processing:worker1", 1, raw)
+    assert email_outbox.send_latency.snapshot()["max_ms"] == 2000.0
+
+
+def test_process_next_schedules_retry(
+    email_outbox, redis_client, email_service, queued_message
+):
+    # Arrange
+    raw = json.dumps(queued_message).encode("utf-8")
+    redis_client.brpoplpush.return_value = raw
+    email_service.send_email.side_effect = Exception("SMTP Error")
+
+    # Act
+    with patch("src.services.email_outbox.time.time", return_value=2000.0):
+        email_outbox.process_next("worker1")
+
+    # Assert
+    ((key, mapping),) = [call[0] for call in redis_client.zadd.call_args_list]
+    ((retry_raw, due),) = mapping.items()
+    assert key == "email_outbox:retry"
+    assert json.loads(retry_raw)["attempts"] == 1
+    assert due == 2000.0 + Config.EMAIL_OUTBOX_BACKOFF_SECONDS
+    redis_client.lrem.assert_called_once_with("email_outbox:processing:worker1", 1, raw)
+
+
+def test_process_next_dead_letters_after_max_attempts(
+    email_outbox, redis_client, email_service, queued_message
+):
+    # Arrange
+    queued_message["attempts"] = Config.EMAIL_OUTBOX_MAX_ATTEMPTS - 1
+    redis_client.brpoplpush.return_value = json.dumps(queued_message).encode("utf-8")
+    email_service.send_email.side_effect = Exception("SMTP Error")
+
+    # Act
+    email_outbox.process_next("worker1")
+
+    # Assert
+    redis_client.zadd.assert_not_called()
+    key, raw = redis_client.lpush.call_args[0]
+    assert key == "email_outbox:dead"
+    assert json.loads(raw)["attempts"] == Config.EMAIL_OUTBOX_MAX_ATTEMPTS
+
+
+def test_retry_delay_backs_off_exponentially(email_outbox):
+    # Assert
+    assert email_outbox._retry_delay(1) == Config.EMAIL_OUTBOX_BACKOFF_SECONDS
+    assert email_outbox._retry_delay(3) == Config.EMAIL_OUTBOX_BACKOFF_SECONDS * 4
+    assert email_outbox._retry_delay(30) == Config.EMAIL_OUTBOX_MAX_BACKOFF_SECONDS
+
+
+def test_promote_due_retries():
+    # Arrange - The real script, run by fakeredis
+    redis_client = fakeredis.FakeStrictRedis()
+    email_outbox = EmailOutbox(redis_client, Mock())
+    redis_client.zadd("email_outbox:retry", {"due": 900.0, "later": 1100.0})
+
+    # Act
+    with patch("src.services.email_outbox.time.time", return_value=1000.0):
+        promoted = email_outbox.promote_due_retries()
+
+    # Assert
+    assert promoted == 1
+    assert redis_client.lrange("email_outbox:pending", 0, -1) == [b"due"]
+    assert redis_client.zrange("email_outbox:retry", 0, -1) == [b"later"]
+
+
+@pytest.mark.parametrize(
+    "raw", [b"not json", b"42", json.dumps({"to": "a@example.com"}).encode()]
+)
+def test_process_next_dead_letters_undecodable_message(raw, email_service):
+    # Arrange
+    redis_client = fakeredis.FakeStrictRedis()
+    email_outbox = EmailOutbox(redis_client, email_service)
+    redis_client.lpush("email_outbox:pending", raw)
+
+    # Act
+    processed = email_outbox.process_next("worker1")
+
+    # Assert
+    assert processed is True
+    email_service.send_email.assert_not_called()
+    assert redis_client.lrange("email_outbox:dead", 0, -1) == [raw]
+    assert not redis_client.exists("email_outbox:processing:worker1")
+    assert email_outbox.requeue_in_flight("worker1") == 0
+
+
+def test_requeue_in_flight(email_outbox, redis_client):
+    # Arrange
+    redis_client.rpoplpush.side_effect = [b"message", None]
+
+    # Act
+    requeued = email_outbox.requeue_in_flight("worker1")
+
+    # Assert
+    assert requeued == 1
+    redis_client.rpoplpush.assert_called_with(
+        "email_outbox:processing:worker1", "email_outbox:pending"
+    )
+
+
+def test_run_stops(email_outbox, redis_client):
+    # Arrange
+    stop_event = threading.Event()
+    redis_client.rpoplpush.return_value = None
+    redis_client.brpoplpush.side_effect = lambda *args: stop_event.set()
+
+    # Act
+    email_outbox.run(worker_id="worker1", stop_event=stop_event)
+
+    # Assert
+    redis_client.brpoplpush.assert_called_once()
+
+
+def test_stats(email_outbox, redis_client, queued_message):
+    # Arrange
+    pipe = redis_client.pipeline.return_value
+    pipe.execute.return_value = [
+        3,
+        1,
+        0,
+        json.dumps(queued_message).encode("utf-8"),
+        None,
+    ]
+
+    # Act
+    with patch("src.services.email_outbox.time.time", return_value=1010.0):
+        stats = email_outbox.stats()
+
+    # Assert
+    assert stats == {
+        "pending": 3,
+        "retrying": 1,
+        "dead": 0,
+        "oldest_pending_age_seconds": 10.0,
+        "send_latency": None,
+    }
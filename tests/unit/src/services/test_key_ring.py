@@ -0,0 +1,275 @@
+import json
+import os
+import pytest
+import rsa
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from jose import JWTError, jwt
+from src.config import Config
+from src.services.key_ring import KeyRing
+
+
+@pytest.fixture
+def claims():
+    return {"sub": "test_id", "exp": datetime.utcnow() + timedelta(minutes=5)}
+
+
+@pytest.fixture
+def key_file(tmp_path):
+    def write(data, mtime=None, name="keyring.json"):
+        path = tmp_path / name
+        path.write_text(json.dumps(data))
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return str(path)
+
+    return write
+
+
+def make_key_ring(path):
+    with patch.object(Config, "JWT_KEYRING_FILE", path), patch.object(
+        Config, "JWT_KEYRING_RELOAD_SECONDS", 0
+    ):
+        return KeyRing()
+
+
+def test_default_key_ring_uses_config_secret(claims):
+    # Arrange
+    key_ring = KeyRing()
+
+    # Act
+    token = key_ring.encode(claims)
+
+    # Assert
+    assert jwt.get_unverified_header(token)["kid"] == "default"
+    payload = jwt.decode(
+        token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM]
+    )
+    assert payload["sub"] == "test_id"
+
+
+def test_decode_token_without_kid(claims):
+    # Arrange
+    token = jwt.encode(claims, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+
+    # Act
+    payload = KeyRing().decode(token)
+
+    # Assert
+    assert payload["sub"] == "test_id"
+
+
+def test_decode_invalid_token():
+    # Act & Assert
+    with pytest.raises(JWTError):
+        KeyRing().decode("invalid_token")
+
+
+def test_file_key_ring_signs_with_active_key(key_file, claims):
+    # Arrange
+    path = key_file(
+        {
+            "active_kid": "k2",
+            "keys": [
+                {"kid": "k1", "alg": "HS256", "secret": "first-secret"},
+                {"kid": "k2", "alg": "HS256", "secret": "second-secret"},
+            ],
+        }
+    )
+    key_ring = make_key_ring(path)
+
+    # Act
+    token = key_ring.encode(claims)
+
+    # Assert
+    assert jwt.get_unverified_header(token)["kid"] == "k2"
+    assert jwt.decode(token, "second-secret", algorithms=["HS256"])["sub"] == "test_id"
+    old_token = jwt.encode(
+        claims, "first-secret", algorithm="HS256", headers={"kid": "k1"}
+    )
+    assert key_ring.decode(old_token)["sub"] == "test_id"
+
+
+def test_rotation_is_picked_up_without_restart(key_file, claims):
+    # Arrange
+    path = key_file(
+        {
+            "active_kid": "k1",
+            "keys": [{"kid": "k1", "alg": "HS256", "secret": "first-secret"}],
+        },
+        mtime=1_000_000,
+    )
+    key_ring = make_key_ring(path)
+    key_file(
+        {
+            "active_kid": "k2",
+            "keys": [
+                {"kid": "k1", "alg": "HS256", "secret": "first-secret"},
+                {"kid": "k2", "alg": "HS256", "secret": "second-secret"},
+            ],
+        },
+        mtime=2_000_000,
+    )
+
+    # Act
+    token = key_ring.encode(claims)
+
+    # Assert
+    assert key_ring.active_kid == "k2"
+    assert jwt.get_unverified_header(token)["kid"] == "k2"
+
+
+def test_broken_key_file_keeps_previous_keys(key_file, claims):
+    # Arrange
+    path = key_file(
+        {
+            "active_kid": "k1",
+            "keys": [{"kid": "k1", "alg": "HS256", "secret": "first-secret"}],
+        },
+        mtime=1_000_000,
+    )
+    key_ring = make_key_ring(path)
+    with open(path, "w") as f:
+        f.write("{not json")
+    os.utime(path, (2_000_000, 2_000_000))
+
+    # Act
+    token = key_ring.encode(claims)
+
+    # Assert
+    assert key_ring.decode(token)["sub"] == "test_id"
+
+
+def test_unknown_kid_is_rejected(claims):
+    # Arrange
+    token = jwt.encode(
+        claims, "other-secret", algorithm="HS256", headers={"kid": "unknown"}
+    )
+
+    # Act & Assert
+    with pytest.raises(JWTError, match="Unknown signing key"):
+        KeyRing().decode(token)
+
+
+def test_asymmetric_verify_only_node(key_file, claims):
+    # Arrange
+    public_key, private_key = rsa.newkeys(1024)
+    signer = make_key_ring(
+        key_file(
+            {
+                "active_kid": "rs1",
+                "keys": [
+                    {
+                        "kid": "rs1",
+                        "alg": "RS256",
+                        "private_key": private_key.save_pkcs1().decode(),
+                        "public_key": public_key.save_pkcs1().decode(),
+                    }
+                ],
+            }
+        )
+    )
+    verifier = make_key_ring(
+        key_file(
+            {
+                "active_kid": "rs1",
+                "keys": [
+                    {
+                        "kid": "rs1",
+                        "alg": "RS256",
+                        "public_key": public_key.save_pkcs1().decode(),
+                    }
+                ],
+            },
+            name="verify-only.json",
+        )
+    )
+
+    # Act
+    token = signer.encode(claims)
+
+    # Assert
+    assert verifier.decode(token)["sub"] == "test_id"
+    with pytest.raises(JWTError, match="can only verify"):
+        verifier.encode(claims)
+
+
+def test_reload_publishes_a_new_key_set(key_file, claims):
+    # Arrange
+    path = key_file(
+        {
+            "active_kid": "k1",
+            "keys": [{"kid": "k1", "alg": "HS256", "secret": "first-secret"}],
+        },
+        mtime=1_000_000,
+    )
+    key_ring = make_key_ring(path)
+    previous = key_ring._key_set
+    key_file(
+        {
+            "active_kid": "k2",
+            "keys": [{"kid": "k2", "alg": "HS256", "secret": "second-secret"}],
+        },
+        mtime=2_000_000,
+    )
+
+    # Act
+    key_ring.encode(claims)
+
+    # Assert - A reader still holding the old set sees a consistent pair
+    assert key_ring._key_set is not previous
+    assert previous.active_kid == "k1"
+    assert set(previous.keys) == {"k1"}
+    with pytest.raises(TypeError):
+        previous.keys["k2"] = key_ring._key_set.keys["k2"]
+
+
+def test_public_key_ring_rejects_default_secret_tokens(key_file, claims):
+    # Arrange
+    public_key, _ = rsa.newkeys(1024)
+    verifier = make_key_ring(
+        key_file(
+            {
+                "active_kid": "rs1",
+                "keys": [
+                    {
+                        "kid": "rs1",
+                        "alg": "RS256",
+                        "public_key": public_key.save_pkcs1().decode(),
+                    }
+                ],
+            }
+        )
+    )
+    forged = jwt.encode(
+        claims,
+        Config.JWT_SECRET_KEY,
+        algorithm="HS256",
+        headers={"kid": "default"},
+    )
+    without_kid = jwt.encode(claims, Config.JWT_SECRET_KEY, algorithm="HS256")
+
+    # Act & Assert
+    for token in (forged, without_kid):
+        with pytest.raises(JWTError, match="Unknown signing key"):
+            verifier.decode(token)
+
+
+def test_default_key_kept_alongside_file_when_enabled(key_file, claims):
+    # Arrange
+    path = key_file(
+        {
+            "active_kid": "k1",
+            "keys": [{"kid": "k1", "alg": "HS256", "secret": "first-secret"}],
+        }
+    )
+    with patch.object(Config, "JWT_KEYRING_INCLUDE_DEFAULT_KEY", True):
+        key_ring = make_key_ring(path)
+    token = jwt.encode(claims, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+
+    # Act
+    payload = key_ring.decode(token)
+
+    # Assert
+    assert payload["sub"] == "test_id"
+    assert key_ring.active_kid == "k1"
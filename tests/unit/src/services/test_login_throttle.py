@@ -0,0 +1,109 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from src.services.login_throttle import LoginThrottle, LoginThrottledError
+
+
+@pytest.fixture
+def redis_client():
+    mock = Mock()
+    mock.mget.return_value = [None, None, None, None]
+    return mock
+
+
+@pytest.fixture
+def throttle(redis_client):
+    throttle = LoginThrottle(redis_client)
+    throttle.window_seconds = 300
+    throttle.email_limit = 5
+    throttle.ip_limit = 50
+    return throttle
+
+
+def test_check_reads_all_counters_in_one_round_trip(throttle, redis_client):
+    # Act
+    with patch("src.services.login_throttle.time.time", return_value=3000.0):
+        had_failures = throttle.check("User@Example.com", "10.0.0.1")
+
+    # Assert
+    assert had_failures is False
+    redis_client.mget.assert_called_once_with(
+        [
+            "login_failures:email:user@example.com:10",
+            "login_failures:email:user@example.com:9",
+            "login_failures:ip:10.0.0.1:10",
+            "login_failures:ip:10.0.0.1:9",
+        ]
+    )
+
+
+def test_check_raises_when_email_limit_reached(throttle, redis_client):
+    # Arrange - 60s into the window, so 80% of the previous window still counts
+    redis_client.mget.return_value = [b"2", b"4", None, None]
+
+    # Act & Assert
+    with patch("src.services.login_throttle.time.time", return_value=3060.0):
+        with pytest.raises(LoginThrottledError) as exc_info:
+            throttle.check("user@example.com", "10.0.0.1")
+    assert exc_info.value.retry_after == 241
+
+
+def test_check_weights_previous_window_by_overlap(throttle, redis_client):
+    # Arrange - Near the end of the window the previous one barely counts
+    redis_client.mget.return_value = [b"2", b"4", None, None]
+
+    # Act
+    with patch("src.services.login_throttle.time.time", return_value=3290.0):
+        had_failures = throttle.check("user@example.com", "10.0.0.1")
+
+    # Assert
+    assert had_failures is True
+
+
+def test_check_raises_when_ip_limit_reached(throttle, redis_client):
+    # Arrange
+    redis_client.mget.return_value = [None, None, b"50", None]
+
+    # Act & Assert
+    with pytest.raises(LoginThrottledError):
+        throttle.check("other@example.com", "10.0.0.1")
+
+
+def test_check_without_client_ip_only_reads_email_counters(throttle, redis_client):
+    # Arrange
+    redis_client.mget.return_value = [None, None]
+
+    # Act
+    throttle.check("user@example.com")
+
+    # Assert
+    assert len(redis_client.mget.call_args[0][0]) == 2
+
+
+def test_record_failure_pipelines_increments(throttle, redis_client):
+    # Arrange
+    pipe = Mock()
+    redis_client.pipeline.return_value = pipe
+
+    # Act
+    with patch("src.services.login_throttle.time.time", return_value=3000.0):
+        throttle.record_failure("user@example.com", "10.0.0.1")
+
+    # Assert
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    pipe.incr.assert_any_call("login_failures:email:user@example.com:10")
+    pipe.incr.assert_any_call("login_failures:ip:10.0.0.1:10")
+    pipe.expire.assert_any_call("login_failures:email:user@example.com:10", 600)
+    pipe.execute.assert_called_once()
+
+
+def test_reset_clears_email_counters(throttle, redis_client):
+    # Act
+    with patch("src.services.login_throttle.time.time", return_value=3000.0):
+        throttle.reset("user@example.com")
+
+    # Assert
+    redis_client.delete.assert_called_once_with(
+        "login_failures:email:user@example.com:10",
+        "login_failures:email:user@example.com:9",
+    )
@@ -56,6 +56,7 @@ def test_get_metrics_success(
     assert result.completed_tasks == 0
     assert result.active_tasks == 3
     metrics_repository.update_metrics.assert_called_once()
+    task_repository.find_all.assert_called_once_with(projection={"completed": 1})
 
 
 def test_get_metrics_no_data(
@@ -0,0 +1,66 @@
+import pytest
+import threading
+from unittest.mock import patch
+from src.config import Config
+from src.services.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+@pytest.fixture
+def password_hasher():
+    with patch.object(Config, "BCRYPT_ROUNDS", 4), patch.object(
+        Config, "BCRYPT_MAX_WORKERS", 1
+    ), patch.object(Config, "BCRYPT_MAX_QUEUE", 0):
+        hasher = PasswordHasher()
+    yield hasher
+    hasher.executor.shutdown(wait=True)
+
+
+def test_hash_and_verify(password_hasher):
+    # Act
+    hashed = password_hasher.hash("password123")
+
+    # Assert
+    assert hashed.startswith("$2b$04$")
+    assert password_hasher.verify("password123", hashed) is True
+    assert password_hasher.verify("wrong_password", hashed) is False
+
+
+def test_records_latency(password_hasher):
+    # Act
+    password_hasher.hash("password123")
+
+    # Assert
+    stats = password_hasher.stats()
+    assert stats["hash_time"]["count"] == 1
+    assert stats["queue_wait"]["count"] == 1
+
+
+def test_needs_rehash(password_hasher):
+    # Assert
+    assert password_hasher.needs_rehash("$2b$04$abcdefghijklmnopqrstuv") is False
+    assert password_hasher.needs_rehash("$2b$12$abcdefghijklmnopqrstuv") is True
+    assert password_hasher.needs_rehash("not_a_bcrypt_hash") is False
+
+
+def test_rejects_when_queue_is_full(password_hasher):
+    # Arrange
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_operation():
+        started.set()
+        release.wait()
+        return True
+
+    worker = threading.Thread(target=password_hasher._run, args=(slow_operation,))
+    worker.start()
+    started.wait()
+
+    # Act & Assert
+    try:
+        with pytest.raises(PasswordHasherBusyError):
+            password_hasher.hash("password123")
+        assert password_hasher.stats()["rejected"] == 1
+    finally:
+        release.set()
+        worker.join()
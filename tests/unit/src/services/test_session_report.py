@@ -0,0 +1,54 @@
+import pytest
+from unittest.mock import Mock
+from src.services.session_report import SessionReportService
+
+
+@pytest.fixture
+def redis_client():
+    return Mock()
+
+
+@pytest.fixture
+def session_report_service(redis_client):
+    return SessionReportService(redis_client)
+
+
+def test_get_report(session_report_service, redis_client):
+    # Arrange
+    keys = {
+        "token:*": [b"token:a", b"token:b"],
+        "refresh:*": [b"refresh:a"],
+        "at:*": [b"at:a"],
+        "rt:*": [b"rt:a"],
+    }
+    sizes = {
+        b"token:a": 600,
+        b"token:b": 400,
+        b"refresh:a": 500,
+        b"at:a": 100,
+        b"rt:a": 90,
+    }
+    redis_client.scan_iter.side_effect = lambda match, count: iter(keys[match])
+    redis_client.memory_usage.side_effect = lambda key, samples: sizes[key]
+
+    # Act
+    report = session_report_service.get_report(sample_size=10)
+
+    # Assert
+    assert report["legacy"] == {
+        "access_keys_sampled": 2,
+        "refresh_keys_sampled": 1,
+        "bytes_per_session": 1000,
+    }
+    assert report["compact"]["bytes_per_session"] == 190
+
+
+def test_get_report_without_sessions(session_report_service, redis_client):
+    # Arrange
+    redis_client.scan_iter.side_effect = lambda match, count: iter([])
+
+    # Act
+    report = session_report_service.get_report()
+
+    # Assert
+    assert report["compact"]["bytes_per_session"] is None
@@ -0,0 +1,94 @@
+import json
+import pytest
+from unittest.mock import Mock
+
+from src.services.task_cache import TaskCache
+
+
+@pytest.fixture
+def redis_client():
+    return Mock()
+
+
+@pytest.fixture
+def task_cache(redis_client):
+    task_cache = TaskCache(redis_client)
+    task_cache.enabled = True
+    task_cache.subscriber = Mock()
+    return task_cache
+
+
+def test_set_and_get(task_cache):
+    # Arrange
+    task_cache.set("task:1", "task", size=10)
+
+    # Act
+    result = task_cache.get("task:1")
+
+    # Assert
+    assert result == "task"
+    assert task_cache.stats()["l1"]["hits"] == 1
+
+
+def test_disabled_cache_stores_nothing(task_cache):
+    # Arrange
+    task_cache.enabled = False
+    task_cache.set("task:1", "task", size=10)
+
+    # Act
+    result = task_cache.get("task:1")
+
+    # Assert
+    assert result is None
+    assert task_cache.stats()["l1"]["size"] == 0
+
+
+def test_invalidate_evicts_and_publishes(task_cache, redis_client):
+    # Arrange
+    task_cache.set("task:1", "task", size=10)
+
+    # Act
+    task_cache.invalidate(["task:1", "user_tasks:user123"])
+
+    # Assert
+    assert task_cache.get("task:1") is None
+    redis_client.publish.assert_called_once_with(
+        task_cache.channel, json.dumps(["task:1", "user_tasks:user123"])
+    )
+
+
+def test_invalidation_from_other_worker_evicts(task_cache):
+    # Arrange
+    task_cache.set("user_tasks:user123", ("task",), size=10)
+
+    # Act
+    task_cache._handle_invalidation(json.dumps(["user_tasks:user123"]).encode())
+
+    # Assert
+    assert task_cache.get("user_tasks:user123") is None
+
+
+def test_stats_report_l2_hit_ratio(task_cache):
+    # Act
+    task_cache.record_l2(True)
+    task_cache.record_l2(True)
+    task_cache.record_l2(False)
+
+    # Assert
+    l2 = task_cache.stats()["l2"]
+    assert l2["hits"] == 2
+    assert l2["misses"] == 1
+    assert l2["hit_ratio"] == pytest.approx(2 / 3)
+
+
+def test_stats_report_rebuild_counters(task_cache):
+    # Act
+    task_cache.record_rebuild("rebuilds")
+    task_cache.record_rebuild("coalesced")
+    task_cache.record_rebuild("coalesced")
+
+    # Assert
+    rebuilds = task_cache.stats()["rebuilds"]
+    assert rebuilds["rebuilds"] == 1
+    assert rebuilds["coalesced"] == 2
+    assert rebuilds["wait_timeouts"] == 0
@@ -1,7 +1,8 @@
 from unittest.mock import MagicMock
 import pytest
-from src.services.task import TaskService
+from src.services.task import TaskNotFoundError, TaskService
 from src.models.task import Task
+from src.utils.pagination import decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -47,11 +48,12 @@ def test_create_task_success(task_service):
 
 def test_update_task_not_found(task_service, valid_object_id):
     # Arrange
-    task_service.task_repository.find_by_id.return_value = None
+    task_service.task_repository.update_owned.return_value = None
+    task_service.task_repository.exists.return_value = False
     user_id = "test_user_id"
 
     # Act & Assert
-    with pytest.raises(ValueError, match="Task not found"):
+    with pytest.raises(TaskNotFoundError, match="Task not found"):
         task_service.update_task(
             valid_object_id, "Updated Title", "Updated Description", user_id
         )
@@ -59,11 +61,12 @@ def test_update_task_not_found(task_service, valid_object_id):
 
 def test_delete_task_not_found(task_service, valid_object_id):
     # Arrange
-    task_service.task_repository.find_by_id.return_value = None
+    task_service.task_repository.delete_owned.return_value = False
+    task_service.task_repository.exists.return_value = False
     user_id = "test_user_id"
 
     # Act & Assert
-    with pytest.raises(ValueError, match="Task not found"):
+    with pytest.raises(TaskNotFoundError, match="Task not found"):
         task_service.delete_task(valid_object_id, user_id)
 
 
@@ -143,46 +146,62 @@ def test_get_all_tasks_success(task_service):
 
 def test_update_task_success(task_service, valid_object_id):
     # Arrange
-    existing_task = Task(
+    updated_task = Task(
         id=valid_object_id,
-        title="Old Title",
-        description="Old Description",
+        title="Updated Task",
+        description="Updated Description",
         user_id="test_user_id",
         completed=True,
     )
-    task_service.task_repository.find_by_id.return_value = existing_task
+    task_service.task_repository.update_owned.return_value = updated_task
     new_title = "Updated Task"
     new_description = "Updated Description"
 
     # Act
-    task_service.update_task(
+    result = task_service.update_task(
         valid_object_id, new_title, new_description, "test_user_id"
     )
 
+    # Assert - One ownership-filtered write, no read before it
+    assert result == updated_task
+    task_service.task_repository.update_owned.assert_called_once_with(
+        valid_object_id,
+        "test_user_id",
+        {"title": new_title, "description": new_description},
+    )
+    task_service.task_repository.find_by_id.assert_not_called()
+    task_service.task_repository.exists.assert_not_called()
+
+
+def test_update_task_keeps_missing_description(task_service, valid_object_id):
+    # Act
+    task_service.update_task(valid_object_id, "Updated Task", None, "test_user_id")
+
     # Assert
-    task_service.task_repository.update.assert_called_once()
-    updated_task = task_service.task_repository.update.call_args[0][1]
-    assert updated_task.title == new_title
-    assert updated_task.description == new_description
-    assert updated_task.user_id == "test_user_id"
-    assert updated_task.completed == True  # Completion status should be preserved
+    task_service.task_repository.update_owned.assert_called_once_with(
+        valid_object_id, "test_user_id", {"title": "Updated Task"}
+    )
+
+
+def test_update_task_empty_title(task_service, valid_object_id):
+    # Act & Assert
+    with pytest.raises(ValueError, match="Title cannot be empty"):
+        task_service.update_task(valid_object_id, "  ", None, "test_user_id")
+    task_service.task_repository.update_owned.assert_not_called()
 
 
 def test_delete_task_success(task_service, valid_object_id):
     # Arrange
-    existing_task = Task(
-        id=valid_object_id,
-        title="Task",
-        description="Description",
-        user_id="test_user_id",
-    )
-    task_service.task_repository.find_by_id.return_value = existing_task
+    task_service.task_repository.delete_owned.return_value = True
 
     # Act
     task_service.delete_task(valid_object_id, "test_user_id")
 
     # Assert
-    task_service.task_repository.delete.assert_called_once_with(valid_object_id)
+    task_service.task_repository.delete_owned.assert_called_once_with(
+        valid_object_id, "test_user_id"
+    )
+    task_service.task_repository.find_by_id.assert_not_called()
 
 
 def test_update_task_invalid_id(task_service):
@@ -204,31 +223,22 @@ def test_delete_task_invalid_id(task_service):
 
 
 def test_update_task_unauthorized(task_service, valid_object_id):
-    # Arrange
-    existing_task = Task(
-        id=valid_object_id,
-        title="Task",
-        description="Description",
-        user_id="different_user_id",
-    )
-    task_service.task_repository.find_by_id.return_value = existing_task
+    # Arrange - The task exists but belongs to someone else
+    task_service.task_repository.update_owned.return_value = None
+    task_service.task_repository.exists.return_value = True
 
     # Act & Assert
-    with pytest.raises(ValueError, match="Unauthorized access to task"):
+    with pytest.raises(ValueError, match="Unauthorized access to task") as error:
         task_service.update_task(
             valid_object_id, "New Title", "New Description", "test_user_id"
         )
+    assert not isinstance(error.value, TaskNotFoundError)
 
 
 def test_delete_task_unauthorized(task_service, valid_object_id):
     # Arrange
-    existing_task = Task(
-        id=valid_object_id,
-        title="Task",
-        description="Description",
-        user_id="different_user_id",
-    )
-    task_service.task_repository.find_by_id.return_value = existing_task
+    task_service.task_repository.delete_owned.return_value = False
+    task_service.task_repository.exists.return_value = True
 
     # Act & Assert
     with pytest.raises(ValueError, match="Unauthorized access to task"):
@@ -237,37 +247,30 @@ def test_delete_task_unauthorized(task_service, valid_object_id):
 
 def test_update_task_status_success(task_service, valid_object_id):
     # Arrange
-    existing_task = Task(
+    updated_task = Task(
         id=valid_object_id,
         title="Task",
         description="Description",
         user_id="test_user_id",
-        completed=False,
+        completed=True,
     )
-    task_service.task_repository.find_by_id.return_value = existing_task
+    task_service.task_repository.update_owned.return_value = updated_task
 
     # Act
-    task_service.update_task_status(valid_object_id, True, "test_user_id")
+    result = task_service.update_task_status(valid_object_id, True, "test_user_id")
 
     # Assert
-    task_service.task_repository.update.assert_called_once()
-    updated_task = task_service.task_repository.update.call_args[0][1]
-    assert updated_task.completed is True
-    assert updated_task.title == existing_task.title
-    assert updated_task.description == existing_task.description
-    assert updated_task.user_id == existing_task.user_id
+    assert result == updated_task
+    task_service.task_repository.update_owned.assert_called_once_with(
+        valid_object_id, "test_user_id", {"completed": True}
+    )
+    task_service.task_repository.find_by_id.assert_not_called()
 
 
 def test_update_task_status_unauthorized(task_service, valid_object_id):
     # Arrange
-    existing_task = Task(
-        id=valid_object_id,
-        title="Task",
-        description="Description",
-        user_id="different_user_id",
-        completed=False,
-    )
-    task_service.task_repository.find_by_id.return_value = existing_task
+    task_service.task_repository.update_owned.return_value = None
+    task_service.task_repository.exists.return_value = True
 
     # Act & Assert
     with pytest.raises(ValueError, match="Unauthorized access to task"):
@@ -276,10 +279,11 @@ def test_update_task_status_unauthorized(task_service, valid_object_id):
 
 def test_update_task_status_not_found(task_service, valid_object_id):
     # Arrange
-    task_service.task_repository.find_by_id.return_value = None
+    task_service.task_repository.update_owned.return_value = None
+    task_service.task_repository.exists.return_value = False
 
     # Act & Assert
-    with pytest.raises(ValueError, match="Task not found"):
+    with pytest.raises(TaskNotFoundError, match="Task not found"):
         task_service.update_task_status(valid_object_id, True, "test_user_id")
 
 
@@ -309,3 +313,135 @@ def test_get_user_tasks_success(task_service):
     assert all(isinstance(task, Task) for task in results)
     assert all(task.user_id == user_id for task in results)
     task_service.task_repository.find_by_user_id.assert_called_once_with(user_id)
+
+
+def _tasks(count):
+    return [
+        Task(
+            id=f"507f1f77bcf86cd79943901{index}",
+            title=f"Task {index}",
+            description=None,
+            user_id="user123",
+        )
+        for index in range(count)
+    ]
+
+
+def test_get_user_tasks_page_with_more_pages(task_service, task_repository):
+    # Arrange
+    task_repository.find_page_by_user_id.return_value = _tasks(3)
+
+    # Act
+    tasks, next_cursor = task_service.get_user_tasks_page("user123", None, 2)
+
+    # Assert
+    task_repository.find_page_by_user_id.assert_called_once_with("user123", None, 3)
+    assert [task.title for task in tasks] == ["Task 0", "Task 1"]
+    assert decode_cursor(next_cursor) == tasks[-1].id
+
+
+def test_get_user_tasks_page_last_page(task_service, task_repository):
+    # Arrange
+    after_id = "507f1f77bcf86cd799439011"
+    task_repository.find_page_by_user_id.return_value = _tasks(1)
+
+    # Act
+    tasks, next_cursor = task_service.get_user_tasks_page(
+        "user123", encode_cursor(after_id), 2
+    )
+
+    # Assert
+    task_repository.find_page_by_user_id.assert_called_once_with("user123", after_id, 3)
+    assert len(tasks) == 1
+    assert next_cursor is None
+
+
+@pytest.mark.parametrize("limit", [0, 501])
+def test_get_user_tasks_page_rejects_limit(task_service, task_repository, limit):
+    # Act & Assert
+    with pytest.raises(ValueError, match="limit must be between"):
+        task_service.get_user_tasks_page("user123", None, limit)
+    task_repository.find_page_by_user_id.assert_not_called()
+
+
+def test_bulk_create_tasks(task_service, task_repository, user_service):
+    # Arrange
+    task_repository.bulk_create.return_value = (["id1", "id2"], {1: "write failed"})
+
+    # Act
+    results = task_service.bulk_create_tasks(
+        [("A", "a"), (" ", "b"), ("C", "c")], "user123"
+    )
+
+    # Assert
+    user_service.get_user_by_id.assert_called_once_with("user123")
+    created = task_repository.bulk_create.call_args.args[0]
+    assert [task.title for task in created] == ["A", "C"]
+    assert results == [
+        {"id": "id1", "status": 201, "error": None},
+        {"id": None, "status": 400, "error": "Title cannot be empty"},
+        {"id": None, "status": 500, "error": "Internal server error"},
+    ]
+
+
+def test_bulk_create_tasks_rejects_oversized_batch(task_service, task_repository):
+    # Arrange
+    tasks = [("T", "d")] * 1001
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="between 1 and 1000"):
+        task_service.bulk_create_tasks(tasks, "user123")
+    task_repository.bulk_create.assert_not_called()
+
+
+def test_bulk_update_tasks_checks_ownership_once(task_service, task_repository):
+    # Arrange
+    owned, other, missing = (
+        "507f1f77bcf86cd799439011",
+        "507f1f77bcf86cd799439012",
+        "507f1f77bcf86cd799439013",
+    )
+    task_repository.find_owners.return_value = {owned: "user123", other: "user456"}
+    task_repository.bulk_update_owned.return_value = {}
+    updates = [
+        (owned, {"completed": True}),
+        (other, {"completed": True}),
+        (missing, {"completed": True}),
+        ("bad-id", {"completed": True}),
+        (owned, {"completed": False}),
+    ]
+
+    # Act
+    results = task_service.bulk_update_tasks(updates, "user123")
+
+    # Assert
+    task_repository.find_owners.assert_called_once_with([owned, other, missing])
+    task_repository.bulk_update_owned.assert_called_once_with(
+        [(owned, {"completed": True})], "user123"
+    )
+    assert [result["status"] for result in results] == [200, 400, 404, 400, 400]
+    assert results[4]["error"] == "Duplicate task ID"
+
+
+def test_bulk_update_tasks_rejects_unknown_fields(task_service, task_repository):
+    # Act & Assert
+    with pytest.raises(ValueError, match="Cannot update fields: user_id"):
+        task_service.bulk_update_tasks(
+            [("507f1f77bcf86cd799439011", {"user_id": "user456"})], "user123"
+        )
+    task_repository.find_owners.assert_not_called()
+
+
+def test_bulk_delete_tasks(task_service, task_repository, valid_object_id):
+    # Arrange
+    task_repository.find_owners.return_value = {valid_object_id: "user123"}
+    task_repository.bulk_delete_owned.return_value = {}
+
+    # Act
+    results = task_service.bulk_delete_tasks([valid_object_id], "user123")
+
+    # Assert
+    task_repository.bulk_delete_owned.assert_called_once_with(
+        [valid_object_id], "user123"
+    )
+    assert results == [{"id": valid_object_id, "status": 200, "error": None}]
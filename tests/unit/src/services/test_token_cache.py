@@ -0,0 +1,101 @@
+import pytest
+import json
+import time
+from unittest.mock import Mock, patch
+from src.config import Config
+from src.services.token_cache import TokenCache
+from src.models.user import User
+
+
+@pytest.fixture
+def redis_client():
+    mock = Mock()
+    mock.pubsub.return_value.listen.return_value = []
+    return mock
+
+
+@pytest.fixture
+def token_cache(redis_client):
+    cache = TokenCache(redis_client)
+    yield cache
+    cache.subscriber.stop()
+
+
+@pytest.fixture
+def test_user():
+    return User(
+        id="test_id",
+        username="test_user",
+        email="test@example.com",
+        password="hashed_password",
+    )
+
+
+def test_set_and_get(token_cache, test_user):
+    # Arrange
+    token_cache.set("token", test_user, time.time() + 60, "at:jti")
+
+    # Act
+    result = token_cache.get("token")
+
+    # Assert
+    assert result == test_user
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_expired_token_is_not_cached(token_cache, test_user):
+    # Act
+    token_cache.set("token", test_user, time.time() - 1, "at:jti")
+
+    # Assert
+    assert token_cache.get("token") is None
+
+
+def test_token_not_served_once_its_session_mapping_is_evicted(redis_client, test_user):
+    # Arrange - Room for three entries; a hot token keeps being read
+    with patch.object(Config, "TOKEN_CACHE_MAX_ENTRIES", 3):
+        token_cache = TokenCache(redis_client)
+    token_cache.set("hot", test_user, time.time() + 60, "at:hot")
+    for index in range(3):
+        assert token_cache.get("hot") == test_user
+        token_cache.set(f"cold{index}", test_user, time.time() + 60, f"at:cold{index}")
+
+    # Act
+    token_cache.revoke(["at:hot"])
+
+    # Assert
+    assert token_cache.get("hot") is None
+    token_cache.subscriber.stop()
+
+
+def test_revoke_evicts_and_publishes(token_cache, redis_client, test_user):
+    # Arrange
+    token_cache.set("token", test_user, time.time() + 60, "at:jti")
+
+    # Act
+    token_cache.revoke(["at:jti"])
+
+    # Assert
+    assert token_cache.get("token") is None
+    redis_client.publish.assert_called_once_with(
+        token_cache.channel, json.dumps(["at:jti"])
+    )
+
+
+def test_revoke_nothing_does_not_publish(token_cache, redis_client):
+    # Act
+    token_cache.revoke([])
+
+    # Assert
+    redis_client.publish.assert_not_called()
+
+
+def test_revocation_message_evicts(token_cache, test_user):
+    # Arrange
+    token_cache.set("token", test_user, time.time() + 60, "at:jti")
+
+    # Act
+    token_cache._handle_revocation(json.dumps(["at:jti"]).encode("utf-8"))
+
+    # Assert
+    assert token_cache.get("token") is None
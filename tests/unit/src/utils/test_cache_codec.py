@@ -0,0 +1,126 @@
+import json
+import pytest
+
+from src.models.task import Task
+from src.utils.cache_codec import (
+    BinaryTaskCodec,
+    CacheCodecError,
+    JsonTaskCodec,
+    MsgpackTaskCodec,
+    decode_task,
+    get_task_codec,
+)
+
+
+@pytest.fixture
+def task():
+    return Task(
+        id="507f1f77bcf86cd799439011",
+        title="Write report",
+        description="Quarterly numbers ✓",
+        user_id="507f191e810c19729de860ea",
+        completed=True,
+    )
+
+
+def _assert_same_task(result, task):
+    assert result.id == task.id
+    assert result.title == task.title
+    assert result.description == task.description
+    assert result.user_id == task.user_id
+    assert result.completed == task.completed
+
+
+@pytest.mark.parametrize(
+    "codec", [JsonTaskCodec(), BinaryTaskCodec(), MsgpackTaskCodec()]
+)
+def test_round_trip(codec, task):
+    # Act
+    result = decode_task(codec.encode(task))
+
+    # Assert
+    _assert_same_task(result, task)
+
+
+def test_binary_round_trip_without_object_ids_or_description():
+    # Arrange
+    task = Task(id="custom-id", title="Title", description=None, user_id="test_user")
+
+    # Act
+    result = decode_task(BinaryTaskCodec().encode(task))
+
+    # Assert
+    _assert_same_task(result, task)
+
+
+def test_binary_is_smaller_than_json(task):
+    # Act
+    binary = BinaryTaskCodec().encode(task)
+    legacy = json.dumps({"id": task.id, **task.to_dict()}).encode()
+
+    # Assert
+    assert len(binary) < len(legacy) / 2
+
+
+def test_long_payload_is_compressed(task):
+    # Arrange
+    task.description = "lorem ipsum " * 200
+    codec = BinaryTaskCodec(compress_threshold=256)
+
+    # Act
+    payload = codec.encode(task)
+
+    # Assert
+    assert payload[0] & 0x80
+    assert len(payload) < 256
+    _assert_same_task(decode_task(payload), task)
+
+
+def test_decodes_legacy_unversioned_json(task):
+    # Arrange
+    legacy = json.dumps({"id": task.id, **task.to_dict()}).encode()
+
+    # Act
+    result = decode_task(legacy)
+
+    # Assert
+    _assert_same_task(result, task)
+
+
+def test_unknown_version_raises(task):
+    # Act & Assert
+    with pytest.raises(CacheCodecError, match="Unknown task payload version"):
+        decode_task(b"\x7e" + BinaryTaskCodec().encode(task)[1:])
+
+
+def test_truncated_binary_payload_raises(task):
+    # Act & Assert
+    with pytest.raises(CacheCodecError):
+        decode_task(BinaryTaskCodec().encode(task)[:-5])
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"\x95\xa2id", b"\xc1", b"\x92\x01\x02", b"\x05", b"\x90\x90"],
+    ids=["truncated", "invalid", "wrong_length", "not_a_list", "extra_data"],
+)
+def test_corrupt_msgpack_payload_raises(body):
+    # Act & Assert
+    with pytest.raises(CacheCodecError, match="Corrupt msgpack task payload"):
+        decode_task(b"\x03" + body)
+
+
+@pytest.mark.parametrize("cut", [1, 12, 20])
+def test_binary_payload_cut_inside_object_id_raises(task, cut):
+    # Arrange - Header and flags byte, then part of the 12-byte ids
+    payload = BinaryTaskCodec().encode(task)[: 2 + cut]
+
+    # Act & Assert
+    with pytest.raises(CacheCodecError, match="ObjectId runs past end"):
+        decode_task(payload)
+
+
+def test_get_task_codec_rejects_unknown_name():
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unknown task cache codec"):
+        get_task_codec("pickle")
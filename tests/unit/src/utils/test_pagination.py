@@ -0,0 +1,27 @@
+import pytest
+from src.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    # Arrange
+    task_id = "507f1f77bcf86cd799439011"
+
+    # Act
+    cursor = encode_cursor(task_id)
+
+    # Assert
+    assert len(cursor) == 16
+    assert decode_cursor(cursor) == task_id
+
+
+def test_decode_cursor_first_page():
+    # Act & Assert
+    assert decode_cursor(None) is None
+    assert decode_cursor("") is None
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor!", "abc", "YWJj"])
+def test_decode_cursor_rejects_garbage(cursor):
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
@@ -0,0 +1,59 @@
+import json
+from unittest.mock import Mock, patch
+from src.utils.stats import CacheMetrics, LatencyRecorder
+
+
+def test_latency_recorder_snapshot():
+    # Arrange
+    recorder = LatencyRecorder()
+
+    # Act
+    for seconds in (0.001, 0.002, 0.003):
+        recorder.record(seconds)
+
+    # Assert
+    snapshot = recorder.snapshot()
+    assert snapshot["count"] == 3
+    assert snapshot["p50_ms"] == 2.0
+    assert snapshot["max_ms"] == 3.0
+
+
+def test_cache_metrics_groups_by_family_and_operation():
+    # Arrange
+    metrics = CacheMetrics()
+
+    # Act
+    metrics.record("task", "get", 0.001, hit=True, size=100)
+    metrics.record("task", "get", 0.003, hit=False)
+    metrics.record("user_tasks", "set", 0.002, size=500)
+    metrics.record_invalidation("user_tasks")
+
+    # Assert
+    snapshot = metrics.snapshot()
+    task_get = snapshot["families"]["task"]["get"]
+    assert task_get["calls"] == 2
+    assert task_get["hit_ratio"] == 0.5
+    assert task_get["avg_bytes"] == 50.0
+    assert task_get["latency"]["max_ms"] == 3.0
+    assert snapshot["families"]["user_tasks"]["set"]["bytes"] == 500
+    assert snapshot["invalidations"] == {"user_tasks": 1}
+
+
+def test_cache_metrics_logs_at_most_once_per_interval():
+    # Arrange
+    metrics = CacheMetrics(log_interval=60)
+    logger = Mock()
+    metrics.record("task", "get", 0.001, hit=True)
+
+    # Act
+    with patch(
+        "src.utils.stats.time.monotonic", return_value=metrics._last_logged + 61
+    ):
+        metrics.log_snapshot(logger)
+        metrics.log_snapshot(logger)
+
+    # Assert
+    logger.info.assert_called_once()
+    logged = json.loads(logger.info.call_args[0][0])
+    assert logged["event"] == "cache_metrics"
+    assert logged["families"]["task"]["get"]["hits"] == 1
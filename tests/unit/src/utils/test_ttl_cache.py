@@ -0,0 +1,127 @@
+from unittest.mock import patch
+from src.utils.ttl_cache import TTLCache
+
+
+def test_get_miss():
+    # Arrange
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+
+    # Act
+    result = cache.get("missing")
+
+    # Assert
+    assert result is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_set_and_get_hit():
+    # Arrange
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("key", "value")
+
+    # Act
+    result = cache.get("key")
+
+    # Assert
+    assert result == "value"
+    assert cache.stats()["hits"] == 1
+
+
+def test_entry_expires():
+    # Arrange
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    with patch("src.utils.ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value", ttl_seconds=5)
+
+    # Act
+    with patch("src.utils.ttl_cache.time.monotonic", return_value=106.0):
+        result = cache.get("key")
+
+    # Assert
+    assert result is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_ttl_is_capped_by_cache_ttl():
+    # Arrange
+    cache = TTLCache(max_entries=2, ttl_seconds=10)
+    with patch("src.utils.ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value", ttl_seconds=3600)
+
+    # Act
+    with patch("src.utils.ttl_cache.time.monotonic", return_value=111.0):
+        result = cache.get("key")
+
+    # Assert
+    assert result is None
+
+
+def test_non_positive_ttl_is_not_cached():
+    # Arrange
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+
+    # Act
+    cache.set("key", "value", ttl_seconds=-1)
+
+    # Assert
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    # Arrange
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" becomes least recently used
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_delete():
+    # Arrange
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("key", "value")
+
+    # Act
+    deleted = cache.delete("key")
+
+    # Assert
+    assert deleted is True
+    assert cache.delete("key") is False
+    assert cache.get("key") is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_evicts_lru_entries_over_byte_budget():
+    # Arrange
+    cache = TTLCache(max_entries=10, ttl_seconds=60, max_bytes=100)
+    cache.set("old", "a", size=60)
+    cache.set("new", "b", size=30)
+
+    # Act
+    cache.set("newest", "c", size=30)
+
+    # Assert
+    assert cache.get("old") is None
+    assert cache.get("new") == "b"
+    assert cache.stats()["bytes"] == 60
+    assert cache.stats()["evictions"] == 1
+
+
+def test_skips_entries_larger_than_byte_budget():
+    # Arrange
+    cache = TTLCache(max_entries=10, ttl_seconds=60, max_bytes=100)
+
+    # Act
+    cache.set("huge", "x", size=101)
+
+    # Assert
+    assert cache.get("huge") is None
+    assert cache.stats()["bytes"] == 0